@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Times building the argparse parser of a config with a large choice registry.
+
+Usage (with draccus installed, e.g. `pip install -e .`):
+    python benchmarks/argparse_conflicts.py [--sizes 50 100 200 400 800] [--fields N] [--number N]
+
+Every choice of the registry shares the fields of the base class, so each of them registers the same options again
+and `SuppressingArgumentParser` has to resolve a conflict for each of those. The build time should grow linearly with
+the registry size.
+"""
+
+import argparse
+import dataclasses
+import time
+from typing import Any, List
+
+from draccus.argparsing import ArgumentParser
+from draccus.choice_types import ChoiceRegistry
+
+
+def synthetic_config(num_choices: int, num_fields: int) -> Any:
+    base_fields = [(f"shared_{i}", int, dataclasses.field(default=i)) for i in range(num_fields)]
+    base = dataclasses.make_dataclass("ModelConfig", base_fields, bases=(ChoiceRegistry,))
+    for i in range(num_choices):
+        own_fields = [(f"model_{i}_option", float, dataclasses.field(default=0.0))]
+        base.register_subclass(f"model_{i}", dataclasses.make_dataclass(f"Model{i}", own_fields, bases=(base,)))
+    return dataclasses.make_dataclass("Config", [("model", base, dataclasses.field(default=None))])
+
+
+def bench_build(config_class: Any, number: int) -> float:
+    best = float("inf")
+    for _ in range(number):
+        parser = ArgumentParser(config_class)
+        # builds the wrapper tree of every choice, so only argparse is timed
+        parser._get_full_option_table()
+        start = time.perf_counter()
+        # what `--help` (or any command line the option table can't tokenize) builds
+        parser._get_parser()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[50, 100, 200, 400, 800])
+    parser.add_argument("--fields", type=int, default=50, help="number of fields shared by every choice")
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    times: List[float] = []
+    for size in args.sizes:
+        times.append(bench_build(synthetic_config(size, args.fields), args.number))
+        per_choice = times[-1] / size * 1e6
+        print(f"{size:>6} choices: {times[-1] * 1000:8.1f} ms ({per_choice:.0f} us per choice)")
+
+    if len(times) > 1:
+        growth = (times[-1] / times[0]) / (args.sizes[-1] / args.sizes[0])
+        print(f"growth relative to linear: {growth:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Runs every registered parser backend on the same corpus of config files.
+
+Usage (with draccus installed, e.g. `pip install -e .`):
+    python benchmarks/backends.py [file_or_dir ...] [--number N]
+
+Files are grouped by format according to their extension, and every available backend able to load that format is
+timed on the whole group. Without arguments, a synthetic corpus of JSON run specs is used.
+"""
+
+import argparse
+import io
+import json
+import timeit
+from pathlib import Path
+from typing import Dict, List
+
+from draccus.cfgparsing import _config_type_for_file
+from draccus.options import ConfigType
+from draccus.parsers import backends
+from draccus.parsers.backends import Capability
+
+
+def synthetic_corpus(num_files: int = 1000) -> Dict[ConfigType, List[str]]:
+    specs = []
+    for i in range(num_files):
+        spec = {
+            "name": f"run-{i}",
+            "model": {"type": "gpt", "layers": 12 + i % 12, "hidden": 768, "dropout": 0.1},
+            "optimizer": {"lr": 3e-4 * (1 + i % 5), "betas": [0.9, 0.95], "weight_decay": 0.1},
+            "data": {"sources": [{"name": f"source-{j}", "weight": 1 / (j + 1)} for j in range(8)]},
+            "tags": ["benchmark", f"group-{i % 10}"],
+        }
+        specs.append(json.dumps(spec, indent=2))
+    return {ConfigType.JSON: specs}
+
+
+def read_corpus(paths: List[Path]) -> Dict[ConfigType, List[str]]:
+    corpus: Dict[ConfigType, List[str]] = {}
+    files = [f for p in paths for f in (sorted(p.rglob("*")) if p.is_dir() else [p]) if f.is_file()]
+    for f in files:
+        file_type = _config_type_for_file(f)
+        if file_type is not None:
+            corpus.setdefault(ConfigType[file_type.upper()], []).append(f.read_text())
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", type=Path)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = read_corpus(args.paths) if args.paths else synthetic_corpus()
+    for config_type, texts in corpus.items():
+        total_kb = sum(len(text) for text in texts) / 1024
+        print(f"{config_type.name}: {len(texts)} file(s), {total_kb:.1f} KiB")
+
+        reference = None
+        for backend in backends.list_backends(config_type):
+            if not backend.supports(Capability.LOAD):
+                continue
+            if not backend.is_available():
+                print(f"  {backend.name:>10}: not installed")
+                continue
+
+            def load_all(backend=backend, texts=texts):
+                return [backend.parser.load_config(io.StringIO(text)) for text in texts]
+
+            result = load_all()
+            if reference is None:
+                reference = result
+            elif result != reference:
+                print(f"  {backend.name:>10}: results differ from the other backends!")
+
+            seconds = min(timeit.Timer(load_all).repeat(repeat=3, number=args.number)) / args.number
+            print(f"  {backend.name:>10}: {seconds * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
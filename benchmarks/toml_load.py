@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Compares the load time of the TOML engines.
+
+Usage (with draccus installed, e.g. `pip install -e .`):
+    python benchmarks/toml_load.py [config.toml ...] [--number N]
+
+Without config files, a synthetic config with a few hundred tables is generated.
+"""
+
+import argparse
+import io
+import timeit
+from pathlib import Path
+from typing import List
+
+from draccus.parsers.config_parsers import TOMLEngine, TOMLParser
+
+
+def synthetic_config(num_tables: int = 200) -> str:
+    lines = []
+    for i in range(num_tables):
+        lines.append(f"[layer_{i}]")
+        lines.append(f'name = "layer {i}"')
+        lines.append(f"hidden_size = {64 * (i + 1)}")
+        lines.append(f"dropout = {i / 1000}")
+        lines.append(f"enabled = {str(i % 2 == 0).lower()}")
+        lines.append(f"shape = [{i}, {i + 1}, {i + 2}]")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def bench_engine(engine: TOMLEngine, texts: List[str], number: int) -> float:
+    TOMLParser.set_engine(engine)
+    try:
+        timer = timeit.Timer(lambda: [TOMLParser.load_config(io.StringIO(text)) for text in texts])
+        return min(timer.repeat(repeat=5, number=number)) / number
+    finally:
+        TOMLParser.set_engine(None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.files:
+        texts = [f.read_text() for f in args.files]
+    else:
+        texts = [synthetic_config()]
+
+    total_kb = sum(len(text) for text in texts) / 1024
+    print(f"{len(texts)} file(s), {total_kb:.1f} KiB")
+    results = {}
+    for engine in TOMLEngine:
+        try:
+            results[engine] = bench_engine(engine, texts, args.number)
+        except ImportError:
+            print(f"{engine.value:>8}: not installed")
+            continue
+        print(f"{engine.value:>8}: {results[engine] * 1000:.2f} ms")
+
+    if len(results) == 2:
+        print(f" speedup: {results[TOMLEngine.TOML] / results[TOMLEngine.TOMLLIB]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,36 +3,143 @@
 # Copyright 2019 Fabrice Normandin
 # Copyright 2021 Elad Richardson
 
+from __future__ import annotations
+
 __version__ = "0.8.0"
 
-from .argparsing import parse, wrap
-from .cfgparsing import dump, load, loads
-from .choice_types import CHOICE_TYPE_KEY, ChoiceRegistry, ChoiceType, PluginRegistry
-from .fields import field
-from .options import ConfigType, Options, config_type
-from .parsers.decoding import decode
-from .parsers.encoding import encode
-from .utils import ParsingError
+import importlib
+
+# not imported from `typing`, which would make `import draccus` import it
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Tuple
+
+    from .aio import adump, aload, aload_many
+    from .argparsing import parse, wrap
+    from .cfgparsing import dump, dump_iter, load, load_iter, load_layers, loads
+    from .choice_types import CHOICE_TYPE_KEY, ChoiceRegistry, ChoiceType, PluginRegistry
+    from .completion import completion_script
+    from .fields import field
+    from .options import ConfigType, Options, config_type
+    from .parsers.backends import Backend, Capability, register_backend, set_backend
+    from .parsers.bundles import bundle, trust_parsed_bundles
+    from .parsers.cache import set_cache_dir
+    from .parsers.decoding import decode
+    from .parsers.encoding import encode
+    from .parsers.json_decoding import decode_json, load_json
+    from .parsers.overrides import apply_overrides
+    from .parsers.resolvers import IncludeResolver, register_include_resolver
+    from .schema import json_schema
+    from .utils import ParsingError
+
+    get_config_type = Options.get_config_type
+    set_config_type = Options.set_config_type
+
+# The public names are imported lazily (PEP 562): `import draccus` imports none of the modules below, and each of them
+# is imported the first time one of its names is used.
+# name -> (module, attribute)
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "CHOICE_TYPE_KEY": (".choice_types", "CHOICE_TYPE_KEY"),
+    "Backend": (".parsers.backends", "Backend"),
+    "Capability": (".parsers.backends", "Capability"),
+    "ChoiceRegistry": (".choice_types", "ChoiceRegistry"),
+    "ChoiceType": (".choice_types", "ChoiceType"),
+    "ConfigType": (".options", "ConfigType"),
+    "IncludeResolver": (".parsers.resolvers", "IncludeResolver"),
+    "Options": (".options", "Options"),
+    "ParsingError": (".utils", "ParsingError"),
+    "PluginRegistry": (".choice_types", "PluginRegistry"),
+    "adump": (".aio", "adump"),
+    "aload": (".aio", "aload"),
+    "aload_many": (".aio", "aload_many"),
+    "apply_overrides": (".parsers.overrides", "apply_overrides"),
+    "bundle": (".parsers.bundles", "bundle"),
+    "completion_script": (".completion", "completion_script"),
+    "config_type": (".options", "config_type"),
+    "decode": (".parsers.decoding", "decode"),
+    "decode_json": (".parsers.json_decoding", "decode_json"),
+    "dump": (".cfgparsing", "dump"),
+    "dump_iter": (".cfgparsing", "dump_iter"),
+    "encode": (".parsers.encoding", "encode"),
+    "field": (".fields", "field"),
+    "get_config_type": (".options", "Options.get_config_type"),
+    "json_schema": (".schema", "json_schema"),
+    "load": (".cfgparsing", "load"),
+    "load_iter": (".cfgparsing", "load_iter"),
+    "load_json": (".parsers.json_decoding", "load_json"),
+    "load_layers": (".cfgparsing", "load_layers"),
+    "loads": (".cfgparsing", "loads"),
+    "parse": (".argparsing", "parse"),
+    "register_backend": (".parsers.backends", "register_backend"),
+    "register_include_resolver": (".parsers.resolvers", "register_include_resolver"),
+    "set_backend": (".parsers.backends", "set_backend"),
+    "set_cache_dir": (".parsers.cache", "set_cache_dir"),
+    "set_config_type": (".options", "Options.set_config_type"),
+    "trust_parsed_bundles": (".parsers.bundles", "trust_parsed_bundles"),
+    "wrap": (".argparsing", "wrap"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        value: Any = importlib.import_module(module_name, __name__)
+        for part in attribute.split("."):
+            value = getattr(value, part)
+    elif not name.startswith("__"):
+        # submodules, e.g. `draccus.utils` (which `import draccus` used to import)
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
 
-get_config_type = Options.get_config_type
-set_config_type = Options.set_config_type
 
 __all__ = [
     "CHOICE_TYPE_KEY",
+    "Backend",
+    "Capability",
     "ChoiceRegistry",
     "ChoiceType",
     "ConfigType",
+    "IncludeResolver",
     "Options",
     "ParsingError",
     "PluginRegistry",
+    "adump",
+    "aload",
+    "aload_many",
+    "apply_overrides",
+    "bundle",
+    "completion_script",
     "config_type",
     "decode",
+    "decode_json",
     "dump",
+    "dump_iter",
     "encode",
     "field",
     "get_config_type",
+    "json_schema",
     "load",
+    "load_iter",
+    "load_json",
+    "load_layers",
     "parse",
+    "register_backend",
+    "register_include_resolver",
+    "set_backend",
+    "set_cache_dir",
     "set_config_type",
+    "trust_parsed_bundles",
     "wrap",
 ]
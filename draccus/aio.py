@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Asyncio versions of `draccus.load` and `draccus.dump`.
+
+Loading a config is split in two steps so that neither blocks the event loop:
+
+1. reading the file and everything it `!include`s, which runs on `io_executor` (the loop's default executor unless
+   given). Many loads can have their reads in flight at the same time.
+2. parsing and decoding the text, which is CPU-bound and runs on `executor` (also the loop's default executor unless
+   given). The work is done by module-level functions, so a `ProcessPoolExecutor` works too.
+
+```python
+configs = await draccus.aload_many(RunConfig, sorted(Path("runs").glob("*.yaml")), executor=process_pool)
+```
+"""
+
+import asyncio
+import io
+import os
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+from draccus import cfgparsing
+from draccus.options import ConfigType, Options
+from draccus.parsers import compression, include_graph, resolvers
+from draccus.parsers.decoding import decode
+from draccus.parsers.encoding import encode
+from draccus.utils import Dataclass, get_defaults_dict, remove_matching
+
+T = TypeVar("T")
+
+PathType = Union[str, os.PathLike]
+
+
+def _read_sources(location: str, config_type: ConfigType) -> Tuple[str, Dict[str, str]]:
+    """Reads the config at `location`, and for YAML, the files it transitively includes."""
+    text = resolvers.read_text(location)
+    if config_type is not ConfigType.YAML:
+        return text, {}
+    return text, include_graph.resolve_include_graph(location, root_text=text).sources
+
+
+def _parse_and_decode(cls: Type[T], location: str, text: str, sources: Dict[str, str], config_type: ConfigType) -> T:
+    stream = io.StringIO(text)
+    stream.name = location  # type: ignore
+    with include_graph.prefetched_sources(sources):
+        d = cfgparsing.load_config(stream, file=location, config_type=config_type)
+    return decode(cls, d)
+
+
+def _file_config_type(location: str) -> ConfigType:
+    file_type = cfgparsing._config_type_for_file(location)
+    return Options.get_config_type() if file_type is None else ConfigType[file_type.upper()]
+
+
+async def aload(
+    cls: Type[T],
+    path: PathType,
+    *,
+    executor: Optional[Executor] = None,
+    io_executor: Optional[Executor] = None,
+) -> T:
+    """Loads the config file at `path` into `cls` without blocking the event loop.
+
+    Args:
+        cls: The dataclass type to load into
+        path: Path of the config file (or any location handled by an include resolver, e.g. `bundle.zip::a.yaml`)
+        executor: Executor running the parsing and decoding. Defaults to the loop's default executor
+        io_executor: Executor running the file reads. Defaults to the loop's default executor
+    """
+    loop = asyncio.get_running_loop()
+    location = os.fspath(path)
+    # resolved here: the context of the caller isn't visible from the executors
+    config_type = _file_config_type(location)
+    text, sources = await loop.run_in_executor(io_executor, _read_sources, location, config_type)
+    return await loop.run_in_executor(executor, _parse_and_decode, cls, location, text, sources, config_type)
+
+
+async def aload_many(
+    cls: Type[T],
+    paths: Sequence[PathType],
+    *,
+    executor: Optional[Executor] = None,
+    io_executor: Optional[Executor] = None,
+    max_concurrency: Optional[int] = None,
+) -> List[T]:
+    """Loads every config in `paths` into `cls` concurrently, returning them in the same order.
+
+    Args:
+        max_concurrency: Maximum number of configs being loaded at the same time. Unlimited by default, in which case
+            the executors bound the actual parallelism.
+    """
+    if max_concurrency is None:
+        return list(await asyncio.gather(*(aload(cls, p, executor=executor, io_executor=io_executor) for p in paths)))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_load(path: PathType) -> T:
+        async with semaphore:
+            return await aload(cls, path, executor=executor, io_executor=io_executor)
+
+    return list(await asyncio.gather(*(bounded_load(p) for p in paths)))
+
+
+def _serialize(config: Dataclass, omit_defaults: bool, config_type: ConfigType, kwargs: Dict[str, Any]) -> str:
+    config_dict = encode(config)
+    if omit_defaults:
+        config_dict = remove_matching(config_dict, encode(get_defaults_dict(config)))
+    return cfgparsing.save_config(config_dict, config_type=config_type, **kwargs)  # type: ignore
+
+
+def _write_text(path: str, text: str) -> None:
+    with compression.open_text(path, "w") as f:
+        f.write(text)
+
+
+async def adump(
+    config: Dataclass,
+    path: Optional[PathType] = None,
+    *,
+    omit_defaults: bool = False,
+    executor: Optional[Executor] = None,
+    io_executor: Optional[Executor] = None,
+    **kwargs,
+) -> Optional[str]:
+    """Dumps `config` like `draccus.dump`, without blocking the event loop.
+
+    Returns the serialized config if `path` is None, otherwise writes it to `path`. The format is the one of the
+    extension of `path`, or the current config type.
+    """
+    loop = asyncio.get_running_loop()
+    config_type = Options.get_config_type() if path is None else _file_config_type(os.fspath(path))
+    text = await loop.run_in_executor(executor, _serialize, config, omit_defaults, config_type, kwargs)
+    if path is None:
+        return text
+    await loop.run_in_executor(io_executor, _write_text, os.fspath(path), text)
+    return None
@@ -6,7 +6,6 @@
 """Simple, Elegant Argument parsing.
 @author: Fabrice Normandin
 """
-import argparse
 import dataclasses
 import inspect
 import os
@@ -18,15 +17,16 @@ from functools import wraps
 from gettext import gettext
 from logging import getLogger
 from pathlib import Path
-from typing import Dict, Generic, Optional, Sequence, Text, Type, TypeVar, Union
+from typing import Any, Dict, Generic, Mapping, Optional, Sequence, Text, Tuple, Type, TypeVar, Union
 
 import mergedeep
 
-from draccus import cfgparsing, utils
+from draccus import cfgparsing, choice_types, utils
 from draccus.help_formatter import SimpleHelpFormatter
-from draccus.parsers import decoding
-from draccus.utils import Dataclass, DraccusException
-from draccus.wrappers import DataclassWrapper
+from draccus.options import Options
+from draccus.parsers import compression, decoding, resolvers
+from draccus.utils import DraccusException
+from draccus.wrappers import DataclassWrapper, option_table
 from draccus.wrappers.docstring import HelpOrder
 from draccus.wrappers.suppressing_argparse import SuppressingArgumentParser
 
@@ -34,6 +34,14 @@ logger = getLogger(__name__)
 
 T = TypeVar("T")
 
+# maximum number of parsers kept by `parse` for reuse
+MAX_CACHED_PARSERS = 128
+# maximum number of option tables (one per selection of choices) kept by each parser
+MAX_CACHED_OPTION_TABLES = 32
+
+# (config class, config path, prog, exit_on_error, preferred help) -> (registry generations, parser)
+_parsers: Dict[Tuple[Any, ...], Tuple[Tuple[int, int], "ArgumentParser"]] = {}
+
 
 class ArgumentParser(Generic[T]):
     def __init__(
@@ -58,7 +66,14 @@ class ArgumentParser(Generic[T]):
                     )
                 del kwargs["exit_on_error"]
 
-        self.parser = SuppressingArgumentParser(*args, **kwargs)
+        self._parser_args = args
+        self._parser_kwargs = kwargs
+        self._parser: Optional[SuppressingArgumentParser] = None
+        # the run-mode view of `self._parser` (see `SuppressingArgumentParser.run_mode_copy`)
+        self._run_parser: Optional[SuppressingArgumentParser] = None
+        # the argparse parser is only built for `--help` and for the command lines the option table can't tokenize,
+        # unless the caller customizes it through `self.parser`
+        self._use_option_table = True
 
         # constructor arguments for the dataclass instances.
         # (a Dict[dest, [attribute, value]])
@@ -70,26 +85,72 @@ class ArgumentParser(Generic[T]):
         self._assert_preferred_help()
 
         self._assert_no_conflicts()
-        self.parser.add_argument(
+        # the wrapper tree is only built when needed: to build an option table or the argparse parser
+        self._wrapper: Optional[DataclassWrapper] = None
+        # the option tables built for the choices selected by the command lines parsed so far, by selection
+        self._option_tables: Dict[Tuple[Tuple[str, str], ...], option_table.OptionTable] = {}
+        # the options of every choice, for the command lines parsed by argparse
+        self._full_option_table: Optional[option_table.OptionTable] = None
+
+    def _register_actions(self, parser, choices: Optional[Mapping[str, str]] = None) -> None:
+        """Adds the command-line arguments of the config class to `parser` (an argparse parser or an option table).
+
+        If `choices` is given, only the selected choices of the choice types are registered (see `ChoiceSelection`).
+        """
+        parser.add_argument(
             f"--{utils.CONFIG_ARG}",
             type=str,
             help="Path for a config file to parse with draccus",
         )
-        self._set_dataclass(config_class)  # type: ignore
-
-    def _set_dataclass(
-        self,
-        dataclass: Union[Type[Dataclass], Dataclass],
-        default: Optional[Union[Dataclass, Dict]] = None,
-        dataclass_wrapper_class: Type[DataclassWrapper] = DataclassWrapper,
-    ):
-        """Adds command-line arguments for the fields of `dataclass`."""
-        if not isinstance(dataclass, type):
-            default = dataclass if default is None else default
-            dataclass = type(dataclass)
-
-        new_wrapper = dataclass_wrapper_class(dataclass, default=default, preferred_help=self.preferred_help)
-        new_wrapper.register_actions(parser=self.parser)
+        if self._wrapper is None:
+            self._wrapper = DataclassWrapper(self.config_class, preferred_help=self.preferred_help)
+        self._wrapper.register_actions(parser=parser, choices=choices)
+
+    def _get_option_table(self, selection: option_table.ChoiceSelection) -> option_table.OptionTable:
+        """The option table with the choices selected by `selection`."""
+        key = tuple(sorted(selection.names.items()))
+        table = self._option_tables.get(key)
+        if table is not None:
+            return table
+        # a selection may differ from a known one only in type options the config doesn't have
+        table = next((table for table in self._option_tables.values() if table.selects(selection)), None)
+        if table is None:
+            table = option_table.read_cached_table(self.config_class, selection)
+        if table is None:
+            table = option_table.OptionTable()
+            self._register_actions(table, selection)
+            table.choices = selection.used
+            option_table.write_cached_table(self.config_class, table, self._wrapper)
+        if len(self._option_tables) >= MAX_CACHED_OPTION_TABLES:
+            self._option_tables.pop(next(iter(self._option_tables)))
+        self._option_tables[key] = table
+        return table
+
+    def _get_full_option_table(self) -> option_table.OptionTable:
+        if self._full_option_table is None:
+            self._full_option_table = option_table.OptionTable()
+            self._register_actions(self._full_option_table)
+        return self._full_option_table
+
+    @property
+    def parser(self) -> SuppressingArgumentParser:
+        """The underlying argparse parser. Customizing it disables the argparse-free parsing of command lines."""
+        self._use_option_table = False
+        return self._get_parser()
+
+    def _get_parser(self) -> SuppressingArgumentParser:
+        if self._parser is None:
+            self._parser = SuppressingArgumentParser(*self._parser_args, **self._parser_kwargs)
+            self._register_actions(self._parser)
+        return self._parser
+
+    def _get_run_parser(self) -> SuppressingArgumentParser:
+        if not self._use_option_table:
+            # the caller may have customized the parser since the last parse
+            return self._get_parser().run_mode_copy()
+        if self._run_parser is None:
+            self._run_parser = self._get_parser().run_mode_copy()
+        return self._run_parser
 
     def _assert_preferred_help(self):
         """Checks that `self.prefer_help` is valid."""
@@ -124,41 +185,88 @@ class ArgumentParser(Generic[T]):
             # make sure that args are mutable
             args = list(args)
 
-        if "--help" not in args and "-h" not in args:
-            for action in self.parser._actions:
-                # TODO(dlwh): this is so gross
-                # TODO: Find a better way to do that?
-                action.default = argparse.SUPPRESS  # To avoid setting of defaults in actual run
-                action.type = str  # In practice, we want all processing to happen with yaml
-                if action.choices:
-                    action.choices = [str(c) for c in action.choices]
-
-        parsed_args, unparsed_args = self.parser.parse_known_args(args, namespace)
+        is_help = "--help" in args or "-h" in args
+        config_file: Optional[Tuple[Any, Dict[str, Any]]] = None
+        if not is_help and self._use_option_table:
+            # the choices the command line selects (from the type options or the config file) come first, so only
+            # their options are needed to tokenize it
+            config_file = self._preload_config_file(args)
+            selection = option_table.ChoiceSelection.from_command_line(args, config_file and config_file[1])
+            table = self._get_option_table(selection)
+            values = table.tokenize(args)
+            if values is not None:
+                if namespace is None:
+                    namespace = Namespace()
+                for dest, value in values.items():
+                    setattr(namespace, dest, value)
+                return self._postprocessing(namespace, table.value_types, config_file), []
+
+        # In practice, we want all processing to happen with yaml
+        parser = self._get_parser() if is_help else self._get_run_parser()
+
+        parsed_args, unparsed_args = parser.parse_known_args(args, namespace)
         if is_parse_args and unparsed_args:
             msg = gettext("unrecognized arguments: %s") % " ".join(unparsed_args)
-            if getattr(self.parser, "exit_on_error", True):
-                self.parser.error(msg)
+            if getattr(parser, "exit_on_error", True):
+                parser.error(msg)
             else:
                 raise DraccusException(msg)
 
-        parsed_t = self._postprocessing(parsed_args)
+        parsed_t = self._postprocessing(parsed_args, self._get_full_option_table().value_types, config_file)
         return parsed_t, unparsed_args
 
+    def _preload_config_file(self, args: Sequence[str]) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """The config file of a command line and its contents, if it has one that loads."""
+        config_path: Any = self.config_path
+        for i, arg in enumerate(args):
+            if arg == f"--{utils.CONFIG_ARG}" and i + 1 < len(args):
+                config_path = args[i + 1]
+            elif arg.startswith(f"--{utils.CONFIG_ARG}="):
+                config_path = arg.partition("=")[2]
+        if config_path is None:
+            return None
+        try:
+            return config_path, self._load_config_file(config_path)
+        except Exception as e:  # pylint: disable=broad-except
+            # reported by `_postprocessing`, which loads it again
+            logger.debug(f"Not selecting choices from {config_path}: {e}")
+            return None
+
+    @staticmethod
+    def _load_config_file(config_path: Any) -> Dict[str, Any]:
+        if not os.path.exists(config_path) and not resolvers.is_local(str(config_path)):
+            # e.g. a config inside a bundle (`bundle.zip::exp.yaml`)
+            return cfgparsing.load_config(resolvers.open_text(str(config_path)), file=config_path)
+        with compression.open_text(config_path) as f:
+            return cfgparsing.load_config(f, file=config_path)
+
     def print_help(self, file=None):
-        return super().print_help(file)
+        return self._get_parser().print_help(file)
 
-    def _postprocessing(self, parsed_args: Namespace) -> T:
+    def _postprocessing(
+        self,
+        parsed_args: Namespace,
+        value_types: Dict[str, Any],
+        config_file: Optional[Tuple[Any, Dict[str, Any]]] = None,
+    ) -> T:
+        """Decodes the parsed arguments. `config_file` is a config file already loaded, with its path."""
         logger.debug("\nPOST PROCESSING\n")
         logger.debug(f"(raw) parsed args: {parsed_args}")
 
         parsed_arg_values = vars(parsed_args)
+        # resolved once, so every value of this parse uses the same format
+        config_type = Options.get_config_type()
 
         for key in parsed_arg_values:
-            parsed_value = cfgparsing.parse_string(parsed_arg_values[key])
+            parsed_value = cfgparsing.parse_string(
+                parsed_arg_values[key], value_types.get(key), config_type=config_type
+            )
             if isinstance(parsed_value, str) and parsed_value.startswith("include"):
                 try:
-                    with open(parsed_value[len("include ") :], "r", encoding="utf-8") as f:
-                        parsed_arg_values[key] = cfgparsing.load_config(f)
+                    location = resolvers.resolve_location(None, parsed_value[len("include ") :])
+                    parsed_arg_values[key] = cfgparsing.load_config(
+                        resolvers.open_text(location), config_type=config_type
+                    )
                 except FileNotFoundError as e:
                     raise FileNotFoundError(
                         f"{e}. Include is a reserved cli keyword. "
@@ -177,14 +285,16 @@ class ArgumentParser(Generic[T]):
             config_path = new_config_path
             del parsed_arg_values[utils.CONFIG_ARG]
 
-        if config_path is not None:
-            with open(config_path, "r", encoding="utf-8") as f:
-                file_args = cfgparsing.load_config(f, file=config_path)
+        if config_file is not None and config_path is not None and str(config_path) == str(config_file[0]):
+            file_args = config_file[1]
+        elif config_path is not None:
+            file_args = self._load_config_file(config_path)
         else:
             file_args = {}
 
         deflat_d = utils.deflatten(parsed_arg_values, sep=".")
-        deflat_d = mergedeep.merge(file_args, deflat_d)
+        # merged into a new dict, so the parsed config file isn't modified
+        deflat_d = mergedeep.merge({}, file_args, deflat_d)
         cfg = decoding.decode(self.config_class, deflat_d)
 
         return cfg
@@ -209,16 +319,51 @@ def parse(
         exit_on_error: Whether to exit if an error occurs.
         preferred_help: Preferred location to parse help text for fields (< "inline" | "above" | "below" >)
     """
-    parser = ArgumentParser(
-        config_class=config_class,
-        config_path=config_path,
-        exit_on_error=exit_on_error,
-        prog=prog,
-        preferred_help=preferred_help,
-    )
+    parser = _get_parser(config_class, config_path, prog, exit_on_error, preferred_help)
     return parser.parse_args(args)
 
 
+def _registry_generations() -> Tuple[int, int]:
+    return choice_types.registry_generation(), decoding.decode.generation()
+
+
+def _get_parser(
+    config_class: Type[T],
+    config_path: Optional[Union[Path, str]],
+    prog: Optional[str],
+    exit_on_error: bool,
+    preferred_help: str,
+) -> ArgumentParser[T]:
+    """An `ArgumentParser` for `config_class`, reused while no choice or decoder is registered.
+
+    Parsing doesn't change the parser, so the same one can parse any number of command lines.
+    """
+
+    def build() -> ArgumentParser[T]:
+        return ArgumentParser(
+            config_class=config_class,
+            config_path=config_path,
+            exit_on_error=exit_on_error,
+            prog=prog,
+            preferred_help=preferred_help,
+        )
+
+    key = (config_class, config_path, prog, exit_on_error, preferred_help)
+    try:
+        entry = _parsers.get(key)
+    except TypeError:  # e.g. an unhashable config path
+        return build()
+    if entry is not None and entry[0] == _registry_generations():
+        return entry[1]
+
+    parser = build()
+    if len(_parsers) >= MAX_CACHED_PARSERS:
+        _parsers.pop(next(iter(_parsers)), None)
+    # read after building, since building may discover plugins
+    _parsers[key] = (_registry_generations(), parser)
+    return parser
+
+
 def wrap(config_path: Optional[os.PathLike] = None, preferred_help: str = HelpOrder.inline):
     def wrapper_outer(fn):
         @wraps(fn)
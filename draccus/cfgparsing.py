@@ -3,31 +3,56 @@
 
 import os
 from pathlib import Path
-from typing import Optional, TextIO, Type, Union
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, TextIO, Type, Union
 
 from draccus import utils
-from draccus.options import Options, config_type
-from draccus.parsers.decoding import decode
+from draccus.options import ConfigType, Options, to_config_type
+from draccus.parsers import backends, bundles, cache, compression, merging, resolvers
+from draccus.parsers.backends import Capability
+from draccus.parsers.decoding import decode, get_decoding_fn
 from draccus.parsers.encoding import encode
 from draccus.utils import Dataclass
 
 
-def parse_string(s: str) -> dict:
+def _resolve_config_type(config_type: Optional[Union[ConfigType, str]]) -> ConfigType:
+    return Options.get_config_type() if config_type is None else to_config_type(config_type)
+
+
+def parse_string(s: str, tpe: Optional[Type] = None, *, config_type: Optional[Union[ConfigType, str]] = None) -> dict:
     """
     Parse a string into a dictionary using the current config type parser.
 
     Args:
         s: The string to parse
+        tpe: Optional type of the field the string is a value of, used to skip the parser for plain scalars
+        config_type: Optional config type to parse with, instead of the current one
 
     Returns:
         A dictionary containing the parsed configuration
     """
-    parser = Options.get_config_type().value
+    parser = backends.get_parser(_resolve_config_type(config_type), Capability.PARSE_STRING)
+    if tpe is not None:
+        return parser.parse_typed_string(s, tpe)
     return parser.parse_string(s)
 
 
+def _config_type_for_file(file: Union[str, Path, os.PathLike]) -> Optional[str]:
+    # the format of `config.yaml.gz` is the one of `config.yaml`
+    fpath = compression.strip_compression_suffix(str(file))
+    if fpath.endswith(".toml"):
+        return "toml"
+    elif fpath.endswith(".json"):
+        return "json"
+    elif fpath.endswith(".yaml") or fpath.endswith(".yml"):
+        return "yaml"
+    return None
+
+
 def load_config(
-    stream: Union[str, TextIO, os.PathLike], *, file: Optional[Union[str, Path, os.PathLike]] = None
+    stream: Union[str, TextIO, os.PathLike],
+    *,
+    file: Optional[Union[str, Path, os.PathLike]] = None,
+    config_type: Optional[Union[ConfigType, str]] = None,
 ) -> dict:
     """
     Load configuration from a stream (file object or string) or file path.
@@ -35,47 +60,52 @@ def load_config(
     Args:
         stream: Either a file object, string content, or file path
         file: Optional file path used to determine the config type based on extension
+        config_type: Optional config type to parse with, instead of the current one
 
     Returns:
         A dictionary containing the loaded configuration
 
     Note:
         If file is provided, the config type will be determined by the file extension.
-        Supported extensions: .toml, .json, .yaml, .yml
+        Supported extensions: .toml, .json, .yaml, .yml, optionally followed by .gz, .bz2 or .xz for compressed files
+        If a cache directory is configured (see `draccus.set_cache_dir`), the parsed form of the file is cached.
     """
     if file is not None:
-        fpath = str(file)
-        if fpath.endswith(".toml"):
-            with config_type("toml"):
-                return load_config(stream)
-        elif fpath.endswith(".json"):
-            with config_type("json"):
-                return load_config(stream)
-        elif fpath.endswith(".yaml") or fpath.endswith(".yml"):
-            with config_type("yaml"):
-                return load_config(stream)
-
-    parser = Options.get_config_type().value
+        file_type = _config_type_for_file(file)
+        if file_type is not None:
+            parsed = bundles.read_parsed(file, file_type)
+            if parsed is not bundles.MISSING:
+                return parsed
+            # the type is passed down explicitly, so concurrent loads of different formats can't interfere
+            return cache.load_cached(file, file_type, lambda: load_config(stream, config_type=file_type))
+
+    parser = backends.get_parser(_resolve_config_type(config_type), Capability.LOAD)
     try:
         return parser.load_config(stream)
+    except utils.ParsingError:
+        raise
     except Exception as e:  # pylint: disable=broad-except
         raise utils.ParsingError(f"Failed to load config from {stream}") from e
 
 
-def save_config(d: dict, stream=None, **kwargs) -> Optional[str]:
+def save_config(
+    d: dict, stream=None, *, config_type: Optional[Union[ConfigType, str]] = None, **kwargs
+) -> Optional[str]:
     """
     Save a configuration dictionary to a stream or return as a string.
 
     Args:
         d: The configuration dictionary to save
         stream: Optional stream to write to. If None, returns the configuration as a string
+        config_type: Optional config type to save as, instead of the current one
         **kwargs: Additional arguments passed to the parser's save_config method
 
     Returns:
         If stream is None, returns the configuration as a string.
         Otherwise, returns None after writing to the stream.
     """
-    parser = Options.get_config_type().value
+    capability = Capability.DUMP | Capability.DUMP_KWARGS if kwargs else Capability.DUMP
+    parser = backends.get_parser(_resolve_config_type(config_type), capability)
     return parser.save_config(d, stream, **kwargs)
 
 
@@ -85,7 +115,7 @@ def load(t: Type[Dataclass], stream: Union[str, TextIO, os.PathLike]) -> Datacla
 
     Args:
         t: The dataclass type to load into
-        stream: Either a file path, file object, or string content
+        stream: Either a file path (or any location handled by an include resolver), file object, or string content
 
     Returns:
         An instance of the specified dataclass with values loaded from the stream
@@ -95,9 +125,12 @@ def load(t: Type[Dataclass], stream: Union[str, TextIO, os.PathLike]) -> Datacla
         This method maintains backwards compatibility with previous versions.
     """
     if isinstance(stream, (str, os.PathLike)) and os.path.exists(stream):
-        # If stream is a file path, open it
-        with open(stream, "r") as f:
+        # If stream is a file path, open it (decompressing it on the fly if needed)
+        with compression.open_text(stream) as f:
             dictionary = load_config(f, file=stream)
+    elif isinstance(stream, str) and "\n" not in stream and not resolvers.is_local(stream):
+        # a location handled by an include resolver, e.g. a config inside a bundle (`bundle.zip::exp.yaml`)
+        dictionary = load_config(resolvers.open_text(stream), file=stream)
     else:
         # If stream is a file object or string content
         dictionary = load_config(stream)
@@ -120,13 +153,59 @@ def loads(t: Type[Dataclass], s: str) -> Dataclass:
     return decode(t, dictionary)
 
 
+def _load_layer(layer: Union[str, os.PathLike, Mapping[str, Any]]) -> Mapping[str, Any]:
+    if isinstance(layer, Mapping):
+        return layer
+    location = resolvers.normalize_location(os.fspath(layer))
+    file_type = _config_type_for_file(location) or Options.get_config_type().name.lower()
+    return cache.load_memoized(
+        location, file_type, lambda: load_config(resolvers.open_text(location), config_type=file_type)
+    )
+
+
+def load_layers(
+    t: Type[Dataclass],
+    layers: Sequence[Union[str, os.PathLike, Mapping[str, Any]]],
+    overrides: Optional[Mapping[str, Any]] = None,
+) -> Dataclass:
+    """
+    Load a config from several layers of config files, each overriding the previous ones.
+
+    Args:
+        t: The dataclass type to load into
+        layers: Config file paths (or already parsed dicts), from lowest to highest precedence
+        overrides: Optional values overriding all the layers. Keys may be dotted paths, like on the command line
+
+    Returns:
+        An instance of the specified dataclass with values merged from all layers
+
+    Note:
+        The layers are merged guided by the fields of `t`: nested mappings are merged key by key, while lists and
+        scalars are replaced. Changing the `type` of a choice field replaces its whole subtree. The parsed form of each
+        file is kept in memory and reused while the file is unchanged, and the merged config is decoded once.
+    """
+    raw_layers = [_load_layer(layer) for layer in layers]
+    if overrides:
+        raw_layers.append(utils.deflatten(dict(overrides), sep="."))
+    return decode(t, merging.merge_layers(t, raw_layers))
+
+
+def _encode_config(config: Dataclass, omit_defaults: bool) -> Any:
+    config_dict = encode(config)
+    if omit_defaults:
+        defaults_dict = encode(utils.get_defaults_dict(config))
+        config_dict = utils.remove_matching(config_dict, defaults_dict)
+    return config_dict
+
+
 def dump(config: Dataclass, stream=None, omit_defaults: bool = False, **kwargs) -> Optional[str]:
     """
     Dump the config object to a stream or return as a string.
 
     Args:
         config: The dataclass instance to dump
-        stream: Optional stream to write to. If None, returns the configuration as a string
+        stream: Optional stream or file path to write to. If None, returns the configuration as a string. A file path
+            sets the format from its extension, and a compression extension (.gz, .bz2, .xz) compresses the file
         omit_defaults: If True, omits any values that match their default values
         **kwargs: Additional arguments passed to the parser's save_config method
 
@@ -134,8 +213,124 @@ def dump(config: Dataclass, stream=None, omit_defaults: bool = False, **kwargs)
         If stream is None, returns the configuration as a string.
         Otherwise, returns None after writing to the stream.
     """
-    config_dict = encode(config)
-    if omit_defaults:
-        defaults_dict = encode(utils.get_defaults_dict(config))
-        config_dict = utils.remove_matching(config_dict, defaults_dict)
+    config_dict = _encode_config(config, omit_defaults)
+    if isinstance(stream, (str, os.PathLike)):
+        file_type = _config_type_for_file(stream)
+        with compression.open_text(stream, "w") as f:
+            return save_config(config_dict, f, config_type=file_type, **kwargs)
     return save_config(config_dict, stream, **kwargs)
+
+
+RECORDS_EXTENSIONS = (".jsonl", ".ndjson")
+"""Extensions of JSON Lines files, which hold one JSON config per line."""
+
+
+def _records_config_type(
+    stream: Union[str, TextIO, os.PathLike], config_type: Optional[Union[ConfigType, str]]
+) -> ConfigType:
+    if config_type is not None:
+        return to_config_type(config_type)
+    if isinstance(stream, (str, os.PathLike)):
+        fpath = compression.strip_compression_suffix(stream)
+        if fpath.endswith(RECORDS_EXTENSIONS):
+            return ConfigType.JSON
+        file_type = _config_type_for_file(fpath)
+        if file_type is not None:
+            return to_config_type(file_type)
+    return Options.get_config_type()
+
+
+def _iter_raw_records(stream: Union[str, TextIO, os.PathLike], config_type: ConfigType) -> Iterator[Any]:
+    if isinstance(stream, (str, os.PathLike)):
+        with compression.open_text(stream) as f:
+            yield from _iter_raw_records(f, config_type)
+        return
+
+    if config_type is ConfigType.JSON:
+        parser = backends.get_parser(config_type, Capability.PARSE_STRING)
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            record = parser.parse_string(line)
+            if not isinstance(record, dict):
+                raise utils.ParsingError(f"Expected a JSON object on line {line_number}, got {line.strip()[:80]!r}")
+            yield record
+        return
+
+    import yaml
+
+    from draccus.parsers.yaml_loader import FullLoaderWithInclusion
+
+    # one loader for all the documents, which reads the stream incrementally
+    loader = FullLoaderWithInclusion(stream)
+    try:
+        while loader.check_data():
+            yield loader.get_data()
+    except yaml.YAMLError as e:
+        raise utils.ParsingError(f"Failed to load config from {getattr(stream, 'name', stream)}") from e
+    finally:
+        loader.dispose()
+
+
+def load_iter(
+    t: Type[Dataclass],
+    stream: Union[str, TextIO, os.PathLike],
+    *,
+    config_type: Optional[Union[ConfigType, str]] = None,
+) -> Iterator[Dataclass]:
+    """
+    Lazily load the configs of a multi-document YAML stream or a JSON Lines stream, one at a time.
+
+    Args:
+        t: The dataclass type to load each config into
+        stream: Either a file path or a file object. `.jsonl` and `.ndjson` files are read as JSON Lines
+        config_type: Optional format of the stream, instead of the one of the file extension or the current one
+
+    Returns:
+        An iterator over the decoded configs. Only one record is held in memory at a time.
+    """
+    # resolved now, rather than on the first call to `next`
+    resolved = _records_config_type(stream, config_type)
+    if resolved is ConfigType.TOML:
+        raise utils.ParsingError("TOML has no multi-record format, use YAML or JSON Lines")
+    decoding_fn = get_decoding_fn(utils.canonicalize_union(t))
+    return (decoding_fn(record, ()) for record in _iter_raw_records(stream, resolved))
+
+
+def dump_iter(
+    configs: Iterable[Dataclass],
+    stream: Union[str, TextIO, os.PathLike],
+    omit_defaults: bool = False,
+    *,
+    config_type: Optional[Union[ConfigType, str]] = None,
+    **kwargs,
+) -> None:
+    """
+    Dump configs to a multi-document YAML stream or a JSON Lines stream, one at a time.
+
+    Args:
+        configs: The dataclass instances to dump. May be a generator, it is consumed lazily
+        stream: Either a file path or a file object. `.jsonl` and `.ndjson` files are written as JSON Lines
+        omit_defaults: If True, omits any values that match their default values
+        config_type: Optional format of the stream, instead of the one of the file extension or the current one
+        **kwargs: Additional arguments passed to the parser's save_config method
+    """
+    resolved = _records_config_type(stream, config_type)
+    if resolved is ConfigType.TOML:
+        raise utils.ParsingError("TOML has no multi-record format, use YAML or JSON Lines")
+    if isinstance(stream, (str, os.PathLike)):
+        with compression.open_text(stream, "w") as f:
+            return dump_iter(configs, f, omit_defaults, config_type=resolved, **kwargs)
+
+    capability = Capability.DUMP | Capability.DUMP_KWARGS if kwargs else Capability.DUMP
+    parser = backends.get_parser(resolved, capability)
+    for i, config in enumerate(configs):
+        config_dict = _encode_config(config, omit_defaults)
+        if resolved is ConfigType.JSON:
+            stream.write(parser.save_config(config_dict, None, **kwargs))
+            stream.write("\n")
+        else:
+            if i > 0:
+                stream.write("---\n")
+            parser.save_config(config_dict, stream, **kwargs)
+    return None
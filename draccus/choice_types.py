@@ -46,6 +46,14 @@ T = TypeVar("T")
 CHOICE_TYPE_KEY = "type"
 """name of key to use in configuration to specify the type of a choice type"""
 
+# incremented whenever a choice is registered, so results derived from the registries (e.g. json schemas) can be cached
+_registry_generation = 0
+
+
+def registry_generation() -> int:
+    """Returns a counter that changes whenever a choice is registered with any registry."""
+    return _registry_generation
+
 
 @runtime_checkable
 class ChoiceType(Protocol):
@@ -113,6 +121,9 @@ class ChoiceRegistryBase(ChoiceType):
                     f" {name}"
                 )
 
+        global _registry_generation
+        if name not in cls._choice_registry:
+            _registry_generation += 1
         cls._choice_registry[name] = choice_type
         return choice_type
 
@@ -161,10 +172,10 @@ class PluginRegistry(ChoiceRegistryBase):
     ```
 
     Unlike with ClassRegistry, import doesn't happen until you call get_choice_class or get_known_choices,
-    and you can split your plugins across multiple files.
+    and you can split your plugins across multiple files. get_choice_class only imports plugins until the
+    requested one is registered, trying the module with the same name as the choice first.
     """
 
-    # TODO: is it better to lazily import plugins?
     _choice_registry: ClassVar[Dict[str, Any]]
     discover_packages_path: ClassVar[str]
     _did_discover_packages: ClassVar[bool]
@@ -181,7 +192,8 @@ class PluginRegistry(ChoiceRegistryBase):
 
     @classmethod
     def get_choice_class(cls, name: str) -> Any:
-        cls._discover_packages()
+        if name not in cls._choice_registry:
+            cls._discover_packages(until=name)
         return cls._choice_registry[name]
 
     @classmethod
@@ -190,7 +202,8 @@ class PluginRegistry(ChoiceRegistryBase):
         return cls._choice_registry
 
     @classmethod
-    def _discover_packages(cls):
+    def _discover_packages(cls, until: Optional[str] = None):
+        """Imports the plugins, or (if `until` is given) only as many as needed to register the choice `until`."""
         if cls._did_discover_packages:
             return
 
@@ -204,8 +217,14 @@ class PluginRegistry(ChoiceRegistryBase):
             # the name.
             return pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + ".")
 
-        for _finder, pkg_name, _ispkg in iter_namespace(package_module):
+        pkg_names = [pkg_name for _finder, pkg_name, _ispkg in iter_namespace(package_module)]
+        if until is not None:
+            # plugins are usually named after their module, so that one is tried first
+            pkg_names.sort(key=lambda pkg_name: pkg_name.rpartition(".")[2] != until)
+        for pkg_name in pkg_names:
             importlib.import_module(pkg_name)
             # registration should happen in the initialization of the package, so importing is sufficient
+            if until is not None and until in cls._choice_registry:
+                return
 
         cls._did_discover_packages = True
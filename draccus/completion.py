@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Static shell completion scripts for the command line of a config class.
+
+The scripts are generated once from the options the wrapper tree registers (the options of every choice), so
+completing a command line doesn't start Python. They complete:
+
+- the option names, including the dotted options of nested dataclasses and choices;
+- the choice names of `--x.type`, the values of literals and enums (by name), and `true` / `false` for booleans;
+- file names for `--config_path`, for the config file options of nested configs (e.g. `--model`), and for paths.
+"""
+
+import re
+import shlex
+from pathlib import PurePath
+from typing import Any, List, Optional, Tuple, Type
+
+from draccus.argparsing import ArgumentParser
+from draccus.utils import CONFIG_ARG, get_type_arguments, is_bool, is_enum, is_optional
+from draccus.wrappers.option_table import Option
+
+SHELLS = ("bash", "zsh", "fish")
+
+# what an option takes: a file name, one of the given words, any value, or nothing (a custom action)
+_FILE, _WORDS, _VALUE, _FLAG = "file", "words", "value", "flag"
+
+
+def completion_script(config_class: Type, shell: str = "bash", prog: Optional[str] = None) -> str:
+    """Returns a completion script for `shell` (one of "bash", "zsh" or "fish") of the command `prog`.
+
+    `prog` is the name of the command the script completes, e.g. `train` (the name of the config class by default).
+    """
+    if shell not in SHELLS:
+        raise ValueError(f"Unsupported shell {shell!r}, must be one of {', '.join(SHELLS)}")
+    prog = prog or config_class.__name__
+    options = _options(config_class)
+    if shell == "bash":
+        return _bash_script(prog, options)
+    if shell == "zsh":
+        return _zsh_script(prog, options)
+    return _fish_script(prog, options)
+
+
+def _options(config_class: Type) -> List[Tuple[str, str, List[str]]]:
+    """The (option string, kind, words) of the options of `config_class`."""
+    table = ArgumentParser(config_class)._get_full_option_table()
+    # the config file of a nested config is given with the option of its prefix (e.g. `--model` for `--model.x`)
+    prefixes = {option_string.rpartition(".")[0] for option_string in table.options}
+    return [
+        (option_string, *_values(option, option_string in prefixes)) for option_string, option in table.options.items()
+    ]
+
+
+def _values(option: Option, is_config_file: bool) -> Tuple[str, List[str]]:
+    if not option.simple:
+        return _FLAG, []
+    if option.dest == CONFIG_ARG or is_config_file:
+        return _FILE, []
+    if option.choices is not None:
+        return _WORDS, sorted(option.choices)
+    tpe: Any = option.type
+    if is_optional(tpe):
+        args = [arg for arg in get_type_arguments(tpe) if arg is not type(None)]
+        tpe = args[0] if len(args) == 1 else None
+    if isinstance(tpe, type) and issubclass(tpe, PurePath):
+        return _FILE, []
+    if tpe is not None and is_enum(tpe):
+        return _WORDS, list(tpe.__members__)
+    if tpe is not None and is_bool(tpe):
+        return _WORDS, ["true", "false"]
+    return _VALUE, []
+
+
+def _function_name(prog: str) -> str:
+    return "_draccus_" + re.sub(r"\W", "_", prog)
+
+
+def _bash_script(prog: str, options: List[Tuple[str, str, List[str]]]) -> str:
+    cases = []
+    for kind in (_FILE, _VALUE):
+        option_strings = [option_string for option_string, option_kind, _ in options if option_kind == kind]
+        if not option_strings:
+            continue
+        case = f"        {'|'.join(option_strings)})\n"
+        if kind == _FILE:
+            case += '            compopt -o filenames 2>/dev/null\n            COMPREPLY=($(compgen -f -- "$cur"))\n'
+        cases.append(case + "            return 0\n            ;;")
+    for option_string, kind, words in options:
+        if kind == _WORDS:
+            cases.append(
+                f"        {option_string})\n"
+                f'            COMPREPLY=($(compgen -W {shlex.quote(" ".join(words))} -- "$cur"))\n'
+                "            return 0\n            ;;"
+            )
+    all_options = " ".join(["-h", "--help", *(option_string for option_string, _, _ in options)])
+    function = _function_name(prog)
+    newline = "\n"
+    return f"""# bash completion for {prog}, generated by draccus
+{function}() {{
+    local cur="${{COMP_WORDS[COMP_CWORD]}}" prev="${{COMP_WORDS[COMP_CWORD-1]}}"
+    COMPREPLY=()
+    # `--x=value` is split into `--x`, `=` and `value`
+    if [[ "$cur" == "=" ]]; then
+        cur=""
+    elif [[ "$prev" == "=" && $COMP_CWORD -ge 2 ]]; then
+        prev="${{COMP_WORDS[COMP_CWORD-2]}}"
+    fi
+    case "$prev" in
+{newline.join(cases)}
+    esac
+    COMPREPLY=($(compgen -W {shlex.quote(all_options)} -- "$cur"))
+}}
+complete -F {function} {shlex.quote(prog)}
+"""
+
+
+def _zsh_escape(word: str) -> str:
+    return re.sub(r"([\\\s():'\"\[\]])", r"\\\1", word)
+
+
+def _zsh_script(prog: str, options: List[Tuple[str, str, List[str]]]) -> str:
+    specs = ["'(- *)'{-h,--help}'[show help and exit]'"]
+    for option_string, kind, words in options:
+        message = option_string.lstrip("-")
+        if kind == _FLAG:
+            spec = option_string
+        elif kind == _FILE:
+            spec = f"{option_string}=:{message}:_files"
+        elif kind == _WORDS:
+            spec = f"{option_string}=:{message}:({' '.join(_zsh_escape(word) for word in words)})"
+        else:
+            spec = f"{option_string}=:{message}: "
+        specs.append(shlex.quote(spec))
+    function = _function_name(prog)
+    arguments = " \\\n        ".join(specs)
+    return f"""#compdef {prog}
+# zsh completion for {prog}, generated by draccus
+
+{function}() {{
+    _arguments \\
+        {arguments}
+}}
+
+if [[ $zsh_eval_context[-1] == loadautofunc ]]; then
+    {function} "$@"
+else
+    compdef {function} {shlex.quote(prog)}
+fi
+"""
+
+
+def _fish_script(prog: str, options: List[Tuple[str, str, List[str]]]) -> str:
+    command = f"complete -c {shlex.quote(prog)}"
+    lines = [
+        f"# fish completion for {prog}, generated by draccus",
+        # only the options that take files complete file names
+        f"{command} -f",
+        f"{command} -s h -l help -d 'show help and exit'",
+    ]
+    for option_string, kind, words in options:
+        line = f"{command} -l {shlex.quote(option_string[2:])}"
+        if kind == _FILE:
+            line += " -r -F"
+        elif kind == _WORDS:
+            line += f" -x -a {shlex.quote(' '.join(words))}"
+        elif kind == _VALUE:
+            line += " -x"
+        lines.append(line)
+    return "\n".join(lines) + "\n"
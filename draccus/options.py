@@ -2,7 +2,8 @@
 # Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
 
 import contextlib
-from typing import Union
+from contextvars import ContextVar
+from typing import Optional, Union
 
 from draccus.parsers.config_parsers import JSONParser, ParserEnum, TOMLParser, YAMLParser
 
@@ -13,25 +14,39 @@ class ConfigType(ParserEnum):
     TOML = TOMLParser
 
 
+def to_config_type(new_type: Union[ConfigType, str]) -> ConfigType:
+    if isinstance(new_type, str):
+        return ConfigType[new_type.upper()]
+    return new_type
+
+
+# set by the `config_type` context manager. Being context-local, it is isolated between threads and asyncio tasks
+_context_config_type: ContextVar[Optional[ConfigType]] = ContextVar("draccus_config_type", default=None)
+
+
 class Options:
+    # process-wide default, used outside of `config_type` blocks
     _config_type: ConfigType = ConfigType.YAML
 
     @staticmethod
     def set_config_type(new_type: Union[ConfigType, str]):
-        if isinstance(new_type, str):
-            new_type = ConfigType[new_type.upper()]
-        Options._config_type = new_type
+        new_type = to_config_type(new_type)
+        if _context_config_type.get() is not None:
+            # inside a `config_type` block, only change the type until the end of the block
+            _context_config_type.set(new_type)
+        else:
+            Options._config_type = new_type
 
     @staticmethod
     def get_config_type() -> ConfigType:
-        return Options._config_type
+        context_type = _context_config_type.get()
+        return Options._config_type if context_type is None else context_type
 
 
 @contextlib.contextmanager
 def config_type(new_type: Union[ConfigType, str]):
-    current_type = Options.get_config_type()
+    token = _context_config_type.set(to_config_type(new_type))
     try:
-        Options.set_config_type(new_type)
         yield
     finally:
-        Options.set_config_type(current_type)
+        _context_config_type.reset(token)
@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Registry of the parser backends available for each config format.
+
+Each `ConfigType` can be served by several backends, e.g. JSON is read by the standard library `json` module or,
+when it is installed, by the much faster `orjson`. A backend declares the operations it supports (`Capability`) and
+the modules it needs. For every operation, the backend selected with `set_backend` is used if it is installed and
+supports that operation; otherwise the available backend with the highest priority that does is used. So `orjson`
+reads JSON when installed, while dumping keeps going through `json` (and its exact output).
+
+```python
+draccus.register_backend(ConfigType.YAML, Backend("rapidyaml", RapidYAMLParser, Capability.LOAD, requires=("ryml",)))
+draccus.set_backend(ConfigType.YAML, "rapidyaml")
+```
+"""
+
+import enum
+import importlib.util
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type, Union
+
+from draccus.options import ConfigType, to_config_type
+
+from .config_parsers import JSONParser, OrjsonParser, Parser, TOMLParser, YAMLParser
+
+
+class Capability(enum.Flag):
+    LOAD = enum.auto()  # Parser.load_config
+    DUMP = enum.auto()  # Parser.save_config
+    PARSE_STRING = enum.auto()  # Parser.parse_string, used for command line values
+    DUMP_KWARGS = enum.auto()  # save_config honors the keyword arguments of the reference implementation
+    ALL = LOAD | DUMP | PARSE_STRING | DUMP_KWARGS
+
+
+@dataclass(frozen=True)
+class Backend:
+    name: str
+    parser: Type[Parser]
+    capabilities: Capability = Capability.ALL
+    # among available backends supporting an operation, the one with the highest priority is used
+    priority: int = 0
+    # modules that must be importable for the backend to be used
+    requires: Tuple[str, ...] = ()
+
+    def is_available(self) -> bool:
+        return all(_is_importable(module) for module in self.requires)
+
+    def supports(self, capability: Capability) -> bool:
+        return capability in self.capabilities
+
+
+@lru_cache(maxsize=None)
+def _is_importable(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+_backends: Dict[ConfigType, List[Backend]] = {config_type: [] for config_type in ConfigType}
+_selected: Dict[ConfigType, Optional[str]] = {config_type: None for config_type in ConfigType}
+# (config type, capability) -> backend, invalidated on every registration or selection
+_resolved: Dict[Tuple[ConfigType, Capability], Backend] = {}
+
+
+def register_backend(config_type: Union[ConfigType, str], backend: Backend) -> Backend:
+    """Registers a backend for `config_type`, replacing any backend registered under the same name."""
+    config_type = to_config_type(config_type)
+    backends = [b for b in _backends[config_type] if b.name != backend.name]
+    backends.append(backend)
+    # stable sort, so backends with equal priorities keep their registration order
+    _backends[config_type] = sorted(backends, key=lambda b: -b.priority)
+    _resolved.clear()
+    return backend
+
+
+def unregister_backend(config_type: Union[ConfigType, str], name: str) -> None:
+    config_type = to_config_type(config_type)
+    _backends[config_type] = [b for b in _backends[config_type] if b.name != name]
+    if _selected[config_type] == name:
+        _selected[config_type] = None
+    _resolved.clear()
+
+
+def set_backend(config_type: Union[ConfigType, str], name: Optional[str]) -> None:
+    """Prefers the backend called `name` for `config_type`. None restores the automatic selection by priority."""
+    config_type = to_config_type(config_type)
+    if name is not None and name not in {b.name for b in _backends[config_type]}:
+        raise ValueError(f"No backend named {name} for {config_type.name}")
+    _selected[config_type] = name
+    _resolved.clear()
+
+
+def list_backends(config_type: Union[ConfigType, str]) -> List[Backend]:
+    """All backends registered for `config_type`, by decreasing priority, including unavailable ones."""
+    return list(_backends[to_config_type(config_type)])
+
+
+def get_backend(config_type: Union[ConfigType, str], capability: Capability) -> Backend:
+    """Returns the backend used for the operations in `capability` on `config_type`."""
+    config_type = to_config_type(config_type)
+    key = (config_type, capability)
+    backend = _resolved.get(key)
+    if backend is None:
+        backend = _resolved[key] = _resolve(config_type, capability)
+    return backend
+
+
+def get_parser(config_type: Union[ConfigType, str], capability: Capability) -> Type[Parser]:
+    return get_backend(config_type, capability).parser
+
+
+def _resolve(config_type: ConfigType, capability: Capability) -> Backend:
+    candidates = [b for b in _backends[config_type] if b.supports(capability) and b.is_available()]
+    selected = _selected[config_type]
+    for backend in candidates:
+        if backend.name == selected:
+            return backend
+    if candidates:
+        return candidates[0]
+    # nothing else registered, this is what ConfigType always pointed to
+    return Backend(config_type.name.lower(), config_type.value)
+
+
+register_backend(ConfigType.YAML, Backend("pyyaml", YAMLParser, requires=("yaml",)))
+register_backend(ConfigType.JSON, Backend("json", JSONParser))
+register_backend(ConfigType.TOML, Backend("toml", TOMLParser))
+register_backend(
+    ConfigType.JSON,
+    Backend("orjson", OrjsonParser, Capability.LOAD | Capability.PARSE_STRING, priority=10, requires=("orjson",)),
+)
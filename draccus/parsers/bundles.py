@@ -0,0 +1,156 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Config bundles: a config file and everything it (transitively) includes, packed in a single zip archive.
+
+Files keep their layout relative to each other, so relative `!include`s resolve inside the bundle, and loading
+`bundle.zip::exp.yaml` opens the archive once and reads every file from its index (see `ZipResolver`).
+
+A bundle can also carry the parsed form of its root config, in which case loading it doesn't parse anything. Parsed
+forms are pickled, and unpickling runs code, so they are only read after `trust_parsed_bundles` was called: otherwise
+a config location would be enough to run the code of whoever made the archive. Untrusted bundles are parsed from their
+sources, like any other config file.
+"""
+
+import os
+import pickle
+import posixpath
+import tempfile
+import zipfile
+from logging import getLogger
+from typing import Any, Dict, Optional, Union
+
+from .include_graph import resolve_include_graph, scan_includes
+from .resolvers import ARCHIVE_SEPARATOR, ZipResolver, get_include_resolver, is_local, normalize_location, read_text
+
+logger = getLogger(__name__)
+
+PARSED_DIR = ".draccus/parsed"
+"""Directory of the bundle holding the parsed forms of configs."""
+
+# bump this whenever the layout of a parsed entry (or the parsed form of a config) changes
+_BUNDLE_FORMAT_VERSION = 1
+
+# fixed timestamp, so bundling the same files twice gives the same archive
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+MISSING: Any = object()
+
+_trust_parsed = False
+
+
+def trust_parsed_bundles(trusted: bool = True) -> None:
+    """Sets whether the parsed forms stored in bundles (see `bundle(..., parsed=True)`) are loaded.
+
+    Parsed forms are pickled, so only enable this when every bundle the process loads comes from a trusted source.
+    Otherwise, bundles are parsed from the config files they contain.
+    """
+    global _trust_parsed
+    _trust_parsed = trusted
+
+
+def _read_sources(root: str, fmt: str) -> Dict[str, str]:
+    if fmt != "yaml":
+        return {root: read_text(root)}
+
+    graph = resolve_include_graph(root)
+    if root not in graph.sources:
+        # the graph skips unreadable files, but the root must exist
+        raise FileNotFoundError(f"Couldn't read config {root}")
+    for location, children in graph.edges.items():
+        for child in children:
+            if child not in graph.sources:
+                logger.warning(f"Couldn't read {child} (included from {location}), it won't be in the bundle")
+
+    sources = {}
+    for location, text in graph.sources.items():
+        if not is_local(location):
+            logger.warning(f"{location} isn't a local file, it will be read from its original location")
+            continue
+        for ref in scan_includes(text):
+            if os.path.isabs(ref):
+                logger.warning(f"The absolute include {ref} in {location} will be read from outside the bundle")
+        sources[location] = text
+    return sources
+
+
+def _write_zip(out: str, files: Dict[str, bytes]) -> None:
+    out_dir = os.path.dirname(os.path.abspath(out))
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for member in sorted(files):
+                zf.writestr(zipfile.ZipInfo(member, date_time=_ZIP_DATE_TIME), files[member], zipfile.ZIP_DEFLATED)
+        os.replace(tmp_path, out)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def bundle(path: Union[str, os.PathLike], out: Optional[Union[str, os.PathLike]] = None, *, parsed: bool = False) -> str:
+    """Packs the config file at `path` and everything it includes into the zip archive `out`.
+
+    Args:
+        path: The config file to bundle
+        out: Path of the archive. Defaults to `path` with a `.zip` extension
+        parsed: Whether to also store the parsed form of the config, so that loading it doesn't parse anything (in
+            processes that call `trust_parsed_bundles`)
+
+    Returns:
+        The location of the config inside the bundle (`out::member`), which can be passed to `draccus.load`
+    """
+    from draccus import cfgparsing
+
+    from .yaml_loader import named_stream
+
+    root = normalize_location(os.fspath(path))
+    fmt = cfgparsing._config_type_for_file(root)
+    if fmt is None:
+        raise ValueError(f"Can't tell the format of {root} from its extension")
+    out = os.path.splitext(root)[0] + ".zip" if out is None else os.fspath(out)
+    if not out.lower().endswith(ZipResolver.suffixes):
+        raise ValueError(f"Bundles are zip archives, got {out}")
+
+    sources = _read_sources(root, fmt)
+    base = os.path.commonpath([os.path.dirname(location) for location in sources])
+    members = {location: os.path.relpath(location, base).replace(os.sep, "/") for location in sources}
+    files = {members[location]: text.encode("utf-8") for location, text in sources.items()}
+
+    if parsed:
+        value = cfgparsing.load_config(named_stream(sources[root], root), config_type=fmt)
+        entry = {"version": _BUNDLE_FORMAT_VERSION, "format": fmt, "value": value}
+        files[f"{PARSED_DIR}/{members[root]}.pickle"] = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+
+    _write_zip(out, files)
+    return f"{os.path.abspath(out)}{ARCHIVE_SEPARATOR}{members[root]}"
+
+
+def read_parsed(location: Union[str, os.PathLike], fmt: str) -> Any:
+    """Returns the parsed form of the config at `location` stored in its bundle, or `MISSING` if there is none.
+
+    Always `MISSING` unless `trust_parsed_bundles` was called, so that untrusted archives are never unpickled.
+    """
+    if not _trust_parsed:
+        return MISSING
+    location = os.fspath(location)
+    if ARCHIVE_SEPARATOR not in location:
+        return MISSING
+    resolver = get_include_resolver(location)
+    if not isinstance(resolver, ZipResolver):
+        return MISSING
+
+    archive, member = resolver.split(resolver.normalize(location))
+    try:
+        data = resolver.read_bytes(f"{archive}{ARCHIVE_SEPARATOR}{PARSED_DIR}/{posixpath.normpath(member)}.pickle")
+    except OSError:
+        return MISSING
+
+    try:
+        entry = pickle.loads(data)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.debug(f"Ignoring unreadable parsed config for {location}: {e}")
+        return MISSING
+    if not isinstance(entry, dict) or entry.get("version") != _BUNDLE_FORMAT_VERSION or entry.get("format") != fmt:
+        return MISSING
+    return entry["value"]
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Persistent on-disk cache for parsed config files.
+
+This works much like `.pyc` files do for Python sources. When a cache directory is configured (either through
+`set_cache_dir` or the `DRACCUS_CACHE_DIR` environment variable), the parsed form of every config file loaded
+through `cfgparsing.load_config(..., file=...)` is pickled into that directory, keyed by the content hash of the file.
+Each entry also records the content hashes of every file pulled in through `!include` (transitively), so an entry is
+only reused while none of those files have changed.
+
+The cache directory must be trusted: entries are unpickled as-is.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from contextvars import ContextVar
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .resolvers import is_local, normalize_location, read_text
+
+logger = getLogger(__name__)
+
+CACHE_DIR_ENV = "DRACCUS_CACHE_DIR"
+"""Environment variable used to enable the cache when `set_cache_dir` was not called."""
+
+# bump this whenever the layout of an entry (or the parsed form of a config) changes
+_CACHE_FORMAT_VERSION = 1
+
+_UNSET: Any = object()
+_cache_dir: Any = _UNSET
+
+# maximum number of parsed files kept in memory by `load_memoized`
+MAX_MEMOIZED_FILES = 256
+
+# files that were read while producing the value that is currently being cached
+_dependencies: ContextVar[Optional[List[str]]] = ContextVar("draccus_cache_dependencies", default=None)
+
+
+def set_cache_dir(path: Optional[Union[str, os.PathLike]]) -> None:
+    """Sets the directory used to cache parsed config files. `None` disables the cache."""
+    global _cache_dir
+    _cache_dir = None if path is None else Path(path)
+
+
+def get_cache_dir() -> Optional[Path]:
+    """Returns the configured cache directory, or None if caching is disabled."""
+    if _cache_dir is not _UNSET:
+        return _cache_dir
+    env_dir = os.environ.get(CACHE_DIR_ENV)
+    return Path(env_dir) if env_dir else None
+
+
+# parsed files kept in memory, keyed by (path, format), with the signatures of the files they were parsed from
+_memoized: Dict[Tuple[str, str], Tuple[Any, List[Tuple[str, Any]]]] = {}
+
+
+def record_dependency(path: str) -> None:
+    """Records that `path` was read while producing the value currently being cached (e.g. by `!include`)."""
+    dependencies = _dependencies.get()
+    if dependencies is not None:
+        dependencies.append(normalize_location(path))
+
+
+def file_digest(path: Union[str, os.PathLike]) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def location_digest(location: str) -> str:
+    """Content hash of a config file at any location an include resolver understands."""
+    if is_local(location):
+        return file_digest(location)
+    return hashlib.sha256(read_text(location).encode("utf-8")).hexdigest()
+
+
+def load_cached(path: Union[str, os.PathLike], fmt: str, load_fn: Callable[[], Any]) -> Any:
+    """Returns the parsed form of the config file at `path`, calling `load_fn` to parse it on a cache miss.
+
+    Args:
+        path: The config file being loaded
+        fmt: Name of the config format used to parse the file. Part of the cache key.
+        load_fn: Parses the file. Any `!include`d file must be reported through `record_dependency`.
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return load_fn()
+
+    path = os.path.abspath(path)
+    try:
+        digest = file_digest(path)
+    except OSError:
+        return load_fn()
+
+    key = hashlib.sha256(f"{_CACHE_FORMAT_VERSION}:{fmt}:{path}:{digest}".encode()).hexdigest()
+    entry_path = cache_dir / f"{key}.pickle"
+
+    entry = _read_entry(entry_path)
+    if entry is not None:
+        value, dependencies = entry
+    else:
+        token = _dependencies.set([])
+        try:
+            value = load_fn()
+            dependencies = [(dep, location_digest(dep)) for dep in dict.fromkeys(_dependencies.get() or [])]
+        finally:
+            _dependencies.reset(token)
+        _write_entry(entry_path, value, dependencies)
+
+    # if this load is itself part of a cached load, its dependencies are the outer load's dependencies too
+    for dep in [path, *(dep for dep, _ in dependencies)]:
+        record_dependency(dep)
+
+    return value
+
+
+def read_entry(key: str) -> Optional[Any]:
+    """Returns the value cached under `key` by `write_entry`, or None if there is none or a dependency changed."""
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    entry = _read_entry(cache_dir / f"{key}.pickle")
+    return None if entry is None else entry[0]
+
+
+def write_entry(key: str, value: Any, dependencies: List[str]) -> None:
+    """Caches `value` under `key`, for as long as the files at `dependencies` are unchanged."""
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        digests = [(dep, location_digest(dep)) for dep in dict.fromkeys(dependencies)]
+    except OSError as e:
+        logger.debug(f"Not caching {key}: {e}")
+        return
+    _write_entry(cache_dir / f"{key}.pickle", value, digests)
+
+
+def _read_entry(entry_path: Path) -> Optional[Tuple[Any, List[Tuple[str, str]]]]:
+    try:
+        with open(entry_path, "rb") as f:
+            entry = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # pylint: disable=broad-except
+        logger.debug(f"Ignoring unreadable cache entry {entry_path}: {e}")
+        return None
+
+    if not isinstance(entry, dict) or entry.get("version") != _CACHE_FORMAT_VERSION:
+        return None
+
+    dependencies = entry["dependencies"]
+    for dep, digest in dependencies:
+        try:
+            if location_digest(dep) != digest:
+                return None
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    return entry["value"], dependencies
+
+
+def _write_entry(entry_path: Path, value: Any, dependencies: List[Tuple[str, str]]) -> None:
+    entry = {"version": _CACHE_FORMAT_VERSION, "dependencies": dependencies, "value": value}
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # atomic, so concurrent readers never see a partially written entry
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:  # pylint: disable=broad-except
+        logger.debug(f"Couldn't write cache entry {entry_path}: {e}")
+
+
+def _signature(location: str) -> Any:
+    if is_local(location):
+        stat = os.stat(location)
+        return stat.st_mtime_ns, stat.st_size
+    return location_digest(location)
+
+
+def load_memoized(path: Union[str, os.PathLike], fmt: str, load_fn: Callable[[], Any]) -> Any:
+    """Like `load_cached`, but also keeps the parsed file in memory for the lifetime of the process.
+
+    The in-memory entry is reused while the file and everything it includes are unchanged (same modification time and
+    size for local files). The returned value is shared between calls, so it must not be modified.
+    """
+    location = normalize_location(os.fspath(path))
+    key = (location, fmt)
+    entry = _memoized.get(key)
+    if entry is not None:
+        value, signatures = entry
+        try:
+            if all(_signature(dep) == signature for dep, signature in signatures):
+                for dep, _ in signatures:
+                    record_dependency(dep)
+                return value
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+    token = _dependencies.set([])
+    try:
+        # taken before parsing, so a file modified while it's parsed is parsed again next time
+        signatures = [(location, _signature(location))]
+        value = load_cached(location, fmt, load_fn)
+        deps = dict.fromkeys(dep for dep in _dependencies.get() or [] if dep != location)
+        signatures.extend((dep, _signature(dep)) for dep in deps)
+    finally:
+        _dependencies.reset(token)
+
+    if len(_memoized) >= MAX_MEMOIZED_FILES:
+        _memoized.pop(next(iter(_memoized)), None)
+    _memoized[key] = (value, signatures)
+    for dep, _ in signatures:
+        record_dependency(dep)
+    return value
+
+
+def clear_memoized() -> None:
+    """Drops the parsed files kept in memory by `load_memoized`."""
+    _memoized.clear()
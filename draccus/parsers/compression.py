@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Transparent compression of config files, chosen by the last extension of their path (e.g. `config.yaml.gz`).
+
+The remaining extension gives the config format as usual. Files are (de)compressed while they are read or written,
+using the codecs of the standard library.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+from typing import IO, Callable, Dict, Optional, Union
+
+_OPENERS: Dict[str, Callable[..., IO]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+"""Compression extension -> function opening a compressed file, with the signature of `gzip.open`."""
+
+
+class _NamedTextIOWrapper(io.TextIOWrapper):
+    # not all compressed files have a `name`, which is needed to resolve relative includes
+    def __init__(self, buffer: IO[bytes], name: str):
+        super().__init__(buffer, encoding="utf-8")
+        self._name = name
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return self._name
+
+
+def compression_suffix(path: Union[str, os.PathLike]) -> Optional[str]:
+    """Returns the compression extension of `path` (e.g. `.gz`), or None if it isn't compressed."""
+    suffix = os.path.splitext(os.fspath(path))[1].lower()
+    return suffix if suffix in _OPENERS else None
+
+
+def strip_compression_suffix(path: Union[str, os.PathLike]) -> str:
+    """Returns `path` without its compression extension, e.g. `config.yaml` for `config.yaml.gz`."""
+    path = os.fspath(path)
+    return os.path.splitext(path)[0] if compression_suffix(path) is not None else path
+
+
+def open_text(path: Union[str, os.PathLike], mode: str = "r") -> IO[str]:
+    """Opens the config file at `path` in text mode (`"r"` or `"w"`), (de)compressing it if needed.
+
+    The stream's `name` is `path`, so relative includes still resolve against the file's directory.
+    """
+    suffix = compression_suffix(path)
+    if suffix is None:
+        return open(path, mode, encoding="utf-8")
+    return _NamedTextIOWrapper(_OPENERS[suffix](path, mode + "b"), os.fspath(path))
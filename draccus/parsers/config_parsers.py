@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: MIT
 # Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
 
+import re
 from abc import ABC, abstractmethod
 from enum import Enum
 from inspect import isclass
+from typing import Optional, Union
 
 
 class Parser(ABC):
@@ -22,6 +24,11 @@ class Parser(ABC):
     def save_config(d, stream=None, **kwargs):
         pass
 
+    @classmethod
+    def parse_typed_string(cls, s, tpe):
+        """Parses the command line value `s` of a field of type `tpe`. Must return the same as `parse_string(s)`."""
+        return cls.parse_string(s)
+
 
 class ParserEnum(Enum):
     def __init__(self, *args):
@@ -42,13 +49,38 @@ class YAMLParser(Parser):
 
         return yaml.load(s, SafeLoaderWithInclusion)
 
+    @classmethod
+    def parse_typed_string(cls, s, tpe):
+        from .yaml_scalars import NO_MATCH, get_scalar_parser
+
+        try:
+            parse_scalar = get_scalar_parser(tpe)
+        except TypeError:  # unhashable type annotation
+            parse_scalar = None
+        if parse_scalar is not None:
+            value = parse_scalar(s)
+            if value is not NO_MATCH:
+                return value
+        return cls.parse_string(s)
+
     @staticmethod
     def load_config(stream):
         import yaml  # type: ignore
 
-        from .yaml_loader import FullLoaderWithInclusion
+        from .include_graph import resolve_include_graph
+        from .yaml_loader import FullLoaderWithInclusion, load_yaml, named_stream
+
+        name = getattr(stream, "name", None)
+        if not isinstance(name, str) or not hasattr(stream, "read"):
+            return yaml.load(stream, FullLoaderWithInclusion)
+
+        text = stream.read()
+        if not isinstance(text, str):
+            return yaml.load(text, FullLoaderWithInclusion)
 
-        return yaml.load(stream, FullLoaderWithInclusion)
+        # read the whole include graph up front: each file once, independent files concurrently
+        graph = resolve_include_graph(name, root_text=text)
+        return load_yaml(named_stream(text, name), FullLoaderWithInclusion, include_sources=graph.sources)
 
     @staticmethod
     def save_config(d, stream=None, **kwargs):
@@ -83,9 +115,110 @@ class JSONParser(Parser):
             return json.dump(d, stream, **kwargs)
 
 
+class OrjsonParser(Parser):
+    """Reads JSON with `orjson`. Inputs `orjson` rejects (NaN, integers over 64 bits, ...) are left to `json`.
+
+    Writing goes through `json`, whose output (separators, `indent`, ...) `orjson` doesn't reproduce.
+    """
+
+    @staticmethod
+    def parse_string(s):
+        import orjson  # type: ignore
+
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return JSONParser.parse_string(s)
+
+    @staticmethod
+    def load_config(stream):
+        import json
+
+        import orjson
+
+        text = stream.read() if hasattr(stream, "read") else stream
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+
+    @staticmethod
+    def save_config(d, stream=None, **kwargs):
+        return JSONParser.save_config(d, stream, **kwargs)
+
+
+# scalars that make up most CLI values, parsed without going through a TOML parser. The patterns follow the TOML
+# grammar for decimal integers and floats, so the results are the same as the parser's
+_TOML_INT_RE = re.compile(r"[+-]?(?:0|[1-9](?:_?[0-9])*)")
+_TOML_FLOAT_RE = re.compile(
+    r"[+-]?(?:0|[1-9](?:_?[0-9])*)(?:\.[0-9](?:_?[0-9])*(?:[eE][+-]?[0-9](?:_?[0-9])*)?|[eE][+-]?[0-9](?:_?[0-9])*)"
+)
+_TOML_BOOLS = {"true": True, "false": False}
+# bare words are never valid TOML values (except for the keywords below), they are kept as strings
+_TOML_BARE_WORD_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_\-./]*")
+_TOML_KEYWORDS = ("true", "false", "inf", "nan")
+
+
+class TOMLEngine(Enum):
+    """Libraries that can be used to read TOML. Writing always uses the `toml` package."""
+
+    TOMLLIB = "tomllib"  # the standard library parser (python >= 3.11), or its `tomli` backport
+    TOML = "toml"  # the pure python `toml` package
+
+
+def _import_tomllib():
+    try:
+        import tomllib  # type: ignore
+
+        return tomllib
+    except ImportError:
+        import tomli  # type: ignore
+
+        return tomli
+
+
 class TOMLParser(Parser):
+    # None picks the fastest available engine
+    _engine: Optional[TOMLEngine] = None
+
+    @staticmethod
+    def set_engine(engine: Optional[Union[TOMLEngine, str]]) -> None:
+        """Sets the engine used to read TOML. None (the default) uses `tomllib` if available, else `toml`."""
+        if isinstance(engine, str):
+            engine = TOMLEngine(engine.lower())
+        if engine is TOMLEngine.TOMLLIB:
+            _import_tomllib()  # fail early if it isn't available
+        TOMLParser._engine = engine
+
+    @staticmethod
+    def get_engine() -> TOMLEngine:
+        if TOMLParser._engine is not None:
+            return TOMLParser._engine
+        try:
+            _import_tomllib()
+            return TOMLEngine.TOMLLIB
+        except ImportError:
+            return TOMLEngine.TOML
+
     @staticmethod
     def parse_string(s):
+        if _TOML_INT_RE.fullmatch(s):
+            return int(s)
+        if _TOML_FLOAT_RE.fullmatch(s):
+            return float(s)
+        if s in _TOML_BOOLS:
+            return _TOML_BOOLS[s]
+        if s not in _TOML_KEYWORDS and _TOML_BARE_WORD_RE.fullmatch(s):
+            return s
+
+        if TOMLParser.get_engine() is TOMLEngine.TOMLLIB:
+            tomllib = _import_tomllib()
+
+            try:
+                return tomllib.loads(f"val = {s}")["val"]
+            except tomllib.TOMLDecodeError:
+                return s
+
         import toml  # type: ignore
 
         try:
@@ -95,6 +228,14 @@ class TOMLParser(Parser):
 
     @staticmethod
     def load_config(stream):
+        if TOMLParser.get_engine() is TOMLEngine.TOMLLIB:
+            tomllib = _import_tomllib()
+
+            text = stream.read() if hasattr(stream, "read") else stream
+            if isinstance(text, bytes):
+                text = text.decode("utf-8")
+            return tomllib.loads(text)
+
         import toml
 
         return toml.load(stream)
@@ -7,7 +7,7 @@
 import functools
 import typing
 from collections import OrderedDict
-from dataclasses import MISSING, fields, is_dataclass
+from dataclasses import MISSING, Field, fields, is_dataclass
 from functools import lru_cache, partial
 from logging import getLogger
 from pathlib import Path
@@ -122,13 +122,8 @@ def is_generic_type(cls: Type[Any]) -> bool:
     return typing.get_origin(cls) is not None
 
 
-def decode_dataclass(cls: Type[Dataclass], d: Dict[str, Any], path: Sequence[str] = ()) -> Dataclass:
-    path = tuple(path)
-    obj_dict: Dict[str, Any] = d.copy()
-    init_args: Dict[str, Any] = {}
-    non_init_args: Dict[str, Any] = {}
-    logger.debug(f"from_dict for {cls}")
-
+def dataclass_field_types(cls: Type[Dataclass]) -> Tuple[Type[Dataclass], List[Tuple[Field, Any]]]:
+    """Returns the (unsubscripted) dataclass of `cls`, and its fields with their resolved type annotations."""
     origin = typing.get_origin(cls)
     if origin is not None:
         type_args = typing.get_args(cls)
@@ -139,10 +134,50 @@ def decode_dataclass(cls: Type[Dataclass], d: Dict[str, Any], path: Sequence[str
         type_map = {}
 
     hints = {name: apply_type_map(t, type_map) for name, t in typing.get_type_hints(origin).items()}
+    return origin, [(field, hints.get(field.name, field.type)) for field in fields(origin)]
+
+
+def build_dataclass(
+    cls: Type[Dataclass],
+    origin: Type[Dataclass],
+    init_args: Dict[str, Any],
+    non_init_args: Dict[str, Any],
+    extra_args: Dict[str, Any],
+    path: Sequence[str],
+) -> Dataclass:
+    """Instantiates `origin` from already decoded field values, checking for unknown and missing fields."""
+    if extra_args:
+        formatted_keys = ", ".join(f"`{k}`" for k in extra_args.keys())
+        raise DecodingError(path, f"The fields {formatted_keys} are not valid for {stringify_type(cls)}")
+    missing_fields = [
+        field.name
+        for field in fields(origin)
+        if field.init and field.name not in init_args and field.default is MISSING and field.default_factory is MISSING
+    ]
+    if missing_fields:
+        formatted_keys = ", ".join(f"`{k}`" for k in missing_fields)
+        raise DecodingError(path, f"Missing required field(s) {formatted_keys} for {stringify_type(cls)}")
+    try:
+        instance = origin(**init_args)
+    except (TypeError, ValueError) as e:
+        raise ParsingError(f"Couldn't instantiate class {stringify_type(cls)} using the given arguments.") from e
+    for name, value in non_init_args.items():
+        logger.debug(f"Setting non-init field '{name}' on the instance.")
+        setattr(instance, name, value)
+    return instance
+
 
-    for field in fields(origin):
+def decode_dataclass(cls: Type[Dataclass], d: Dict[str, Any], path: Sequence[str] = ()) -> Dataclass:
+    path = tuple(path)
+    obj_dict: Dict[str, Any] = d.copy()
+    init_args: Dict[str, Any] = {}
+    non_init_args: Dict[str, Any] = {}
+    logger.debug(f"from_dict for {cls}")
+
+    origin, field_types = dataclass_field_types(cls)
+
+    for field, field_type in field_types:
         name = field.name
-        field_type = hints.get(name, field.type)
         if name not in obj_dict:
             continue
         raw_value = obj_dict.pop(name)
@@ -161,26 +196,7 @@ def decode_dataclass(cls: Type[Dataclass], d: Dict[str, Any], path: Sequence[str
             init_args[name] = field_value
         else:
             non_init_args[name] = field_value
-    extra_args = obj_dict
-    if extra_args:
-        formatted_keys = ", ".join(f"`{k}`" for k in extra_args.keys())
-        raise DecodingError(path, f"The fields {formatted_keys} are not valid for {stringify_type(cls)}")
-    missing_fields = [
-        field.name
-        for field in fields(origin)
-        if field.init and field.name not in init_args and field.default is MISSING and field.default_factory is MISSING
-    ]
-    if missing_fields:
-        formatted_keys = ", ".join(f"`{k}`" for k in missing_fields)
-        raise DecodingError(path, f"Missing required field(s) {formatted_keys} for {stringify_type(cls)}")
-    try:
-        instance = origin(**init_args)
-    except (TypeError, ValueError) as e:
-        raise ParsingError(f"Couldn't instantiate class {stringify_type(cls)} using the given arguments.") from e
-    for name, value in non_init_args.items():
-        logger.debug(f"Setting non-init field '{name}' on the instance.")
-        setattr(instance, name, value)
-    return instance
+    return build_dataclass(cls, origin, init_args, non_init_args, obj_dict, path)
 
 
 def decode_choice_class(cls: Type[T], raw_value: Any, path: Sequence[str]) -> T:
@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Pre-pass over the `!include` graph of a YAML config.
+
+Before a YAML file is parsed, its text (and, transitively, the text of the files it includes) is scanned for
+`!include` tags. Every unique file is read exactly once, independent includes are read concurrently on a thread pool,
+and include cycles are reported with the full chain of files instead of overflowing the stack. The YAML loader then
+resolves `!include` from the prefetched sources.
+
+The scan is lexical, so it may pick up an `!include` inside a block string. Such false positives are harmless: files
+that can't be read are skipped here and only reported if the loader actually needs them.
+"""
+
+import contextlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from draccus.utils import ParsingError
+
+from .resolvers import normalize_location, read_text, resolve_location
+
+logger = getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+INCLUDE_TAG = "!include"
+
+_INCLUDE_LINE_RE = re.compile(r"^.*!include.*$", re.MULTILINE)
+# `!include` in a value position followed by a plain or quoted scalar
+_INCLUDE_RE = re.compile(r"""(?:^|[\s:\-\[,{])!include[ \t]+("[^"]*"|'[^']*'|[^\s#,\]\}]+)""")
+_COMMENT_RE = re.compile(r"(?:^|\s)#")
+
+# sources already read by the caller (e.g. on an I/O executor), which don't need to be read again
+_prefetched_sources: ContextVar[Optional[Dict[str, str]]] = ContextVar("draccus_prefetched_sources", default=None)
+
+
+class IncludeCycleError(ParsingError):
+    def __init__(self, chain: Sequence[str]):
+        self.chain = list(chain)
+        super().__init__("Include cycle detected: " + " -> ".join(self.chain))
+
+
+@dataclass
+class IncludeGraph:
+    root: str
+    # text of every file in the graph that could be read, keyed by normalized location
+    sources: Dict[str, str] = field(default_factory=dict)
+    # the files included by each file, in order of appearance
+    edges: Dict[str, List[str]] = field(default_factory=dict)
+
+    def find_cycle(self) -> Optional[List[str]]:
+        """Returns the chain of files forming an include cycle (first file repeated at the end), if there is one."""
+        visiting: List[str] = []
+        on_stack = set()
+        done = set()
+
+        def visit(node: str) -> Optional[List[str]]:
+            visiting.append(node)
+            on_stack.add(node)
+            for child in self.edges.get(node, ()):
+                if child in on_stack:
+                    return [*visiting[visiting.index(child) :], child]
+                if child not in done:
+                    cycle = visit(child)
+                    if cycle is not None:
+                        return cycle
+            visiting.pop()
+            on_stack.remove(node)
+            done.add(node)
+            return None
+
+        return visit(self.root)
+
+
+def scan_includes(text: str) -> List[str]:
+    """Returns the references of all `!include` tags in `text`, in order of appearance."""
+    if INCLUDE_TAG not in text:
+        return []
+    refs = []
+    for line in _INCLUDE_LINE_RE.findall(text):
+        comment = _COMMENT_RE.search(line)
+        if comment is not None:
+            line = line[: comment.start()]
+        for match in _INCLUDE_RE.finditer(line):
+            ref = match.group(1)
+            if ref[0] in "\"'":
+                ref = ref[1:-1]
+            refs.append(ref)
+    return refs
+
+
+def _read_text(location: str) -> Optional[str]:
+    try:
+        return read_text(location)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.debug(f"Couldn't prefetch include {location}: {e}")
+        return None
+
+
+@contextlib.contextmanager
+def prefetched_sources(sources: Dict[str, str]) -> Iterator[None]:
+    """Makes `resolve_include_graph` use the given texts (keyed by normalized location) instead of reading them."""
+    token = _prefetched_sources.set(sources)
+    try:
+        yield
+    finally:
+        _prefetched_sources.reset(token)
+
+
+def resolve_include_graph(
+    root: str, root_text: Optional[str] = None, max_workers: int = DEFAULT_MAX_WORKERS
+) -> IncludeGraph:
+    """Reads `root` and everything it transitively includes, each file once.
+
+    Files at the same depth of the graph are read concurrently. Raises `IncludeCycleError` if the includes form a
+    cycle.
+    """
+    root = normalize_location(root)
+    graph = IncludeGraph(root)
+    prefetched = _prefetched_sources.get() or {}
+    if root_text is None:
+        root_text = prefetched[root] if root in prefetched else _read_text(root)
+        if root_text is None:
+            return graph
+    graph.sources[root] = root_text
+
+    executor: Optional[ThreadPoolExecutor] = None
+    frontier = [root]
+    seen = {root}
+    try:
+        while frontier:
+            to_read: List[str] = []
+            for path in frontier:
+                children = [resolve_location(path, ref) for ref in scan_includes(graph.sources[path])]
+                graph.edges[path] = children
+                for child in children:
+                    if child not in seen:
+                        seen.add(child)
+                        to_read.append(child)
+
+            if not to_read:
+                break
+            texts = {path: prefetched[path] for path in to_read if path in prefetched}
+            missing = [path for path in to_read if path not in texts]
+            if len(missing) == 1:
+                texts[missing[0]] = _read_text(missing[0])
+            elif missing:
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="draccus-include")
+                texts.update(zip(missing, executor.map(_read_text, missing)))
+
+            frontier = []
+            for path in to_read:
+                text = texts[path]
+                if text is None:
+                    graph.edges[path] = []
+                else:
+                    graph.sources[path] = text
+                    frontier.append(path)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    cycle = graph.find_cycle()
+    if cycle is not None:
+        raise IncludeCycleError(cycle)
+    return graph
@@ -0,0 +1,383 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Single-pass decoding of JSON text straight into dataclasses.
+
+`draccus.load` first builds the whole JSON document as Python dicts and lists, and `decode` then walks that tree again
+to build the dataclasses. For very large configs (e.g. long data-mixture manifests) the intermediate tree roughly
+doubles peak memory. `decode_json` instead tokenizes the text guided by the target type: objects that decode to
+dataclasses, and lists and dicts of them, are consumed key by key and built directly, so no intermediate dict is ever
+created for them. Every other value (scalars, unions, choice types, types with a custom decoder, ...) is scanned with
+the C-accelerated scanner of the `json` module and handed to the regular decoding function for its type, so the
+result is exactly what `decode(cls, json.loads(text))` would produce.
+
+UTF-8 bytes (e.g. the memory map of the file `load_json` reads) are never decoded as a whole: they are decoded a chunk
+at a time into a window of text, and the text before the value being scanned is dropped from the window. Only a value
+scanned with the `json` module (e.g. a long list of numbers) has to fit in the window at once.
+"""
+
+import codecs
+import json
+import json.decoder
+import json.scanner
+import mmap
+import os
+import typing
+from dataclasses import is_dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, Union
+
+from draccus.utils import (
+    DecodingError,
+    ParsingError,
+    canonicalize_union,
+    format_error,
+    get_type_arguments,
+    has_generic_arg,
+    is_choice_type,
+    is_dict,
+    is_list,
+    is_optional,
+    is_tuple,
+)
+
+from .decoding import build_dataclass, dataclass_field_types, decode, get_decoding_fn
+
+T = TypeVar("T")
+
+# (text, index of the first character of the value, path) -> (decoded value, index just past the value)
+ScanFunction = Callable[["_Text", int, Tuple[str, ...]], Tuple[Any, int]]
+
+_scan_once = json.scanner.make_scanner(json.decoder.JSONDecoder())
+_scanstring = json.decoder.scanstring
+_WHITESPACE = json.decoder.WHITESPACE.match
+_WHITESPACE_CHARS = " \t\n\r"
+
+# the number of bytes decoded at a time
+_CHUNK_SIZE = 1 << 18
+
+
+def decode_json(cls: Type[T], data: Union[str, bytes, bytearray, memoryview, mmap.mmap]) -> T:
+    """Decodes the JSON document in `data` into an instance of `cls`, without building intermediate dicts.
+
+    `data` is either the text or its UTF-8 encoding, which is decoded incrementally rather than copied into a `str`.
+    """
+    scan = _get_scan_fn(canonicalize_union(cls))
+    text = _Text(data)
+    try:
+        idx = text.skip(0)
+        value, idx = scan(text, idx, ())
+        idx = text.skip(idx)
+        if text.char(idx):
+            raise text.error("Extra data", idx)
+    except json.JSONDecodeError as e:
+        raise ParsingError(f"Invalid JSON: {text.describe(e)}") from e
+    finally:
+        text.close()
+    return value
+
+
+def load_json(cls: Type[T], path: Union[str, os.PathLike]) -> T:
+    """Decodes the JSON file at `path` into an instance of `cls`, reading it through a memory map."""
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can't be mapped
+            return decode_json(cls, f.read())
+        with mapped:
+            return decode_json(cls, mapped)
+
+
+class _Text:
+    """The text being decoded, indexed by the offset of the characters in the whole text.
+
+    For a `str` the window `s` is the whole text. For bytes `s` holds the characters from `offset` on that have been
+    decoded so far: reading past its end decodes more chunks and drops the characters before the index being read,
+    which the scan functions never go back to.
+    """
+
+    def __init__(self, data: Union[str, bytes, bytearray, memoryview, mmap.mmap]):
+        self.offset = 0
+        # the newlines before the window, and the characters between the last one and the window
+        self._lines = 0
+        self._column = 0
+        if isinstance(data, str):
+            self.s = data
+            self._data: Optional[memoryview] = None
+            self._at_end = True
+        else:
+            self.s = ""
+            self._data = memoryview(data)
+            self._read = 0
+            self._decoder = codecs.getincrementaldecoder("utf-8")()
+            self._at_end = False
+
+    def close(self) -> None:
+        # an mmap can't be closed while it is exported
+        if self._data is not None:
+            self._data.release()
+
+    def char(self, idx: int) -> str:
+        """The character at `idx`, or "" past the end of the text."""
+        i = idx - self.offset
+        char = self.s[i : i + 1]
+        if char or self._at_end:
+            return char
+        self._fill(idx, 1)
+        return self.s[:1]
+
+    def startswith(self, prefix: str, idx: int) -> bool:
+        if idx - self.offset + len(prefix) > len(self.s) and not self._at_end:
+            self._fill(idx, len(prefix))
+        return self.s.startswith(prefix, idx - self.offset)
+
+    def skip(self, idx: int) -> int:
+        """Returns the index of the first character from `idx` on that is not whitespace."""
+        s = self.s
+        i = idx - self.offset
+        # also true for "" at the end of the window, as the whitespace may go on past it
+        if s[i : i + 1] in _WHITESPACE_CHARS:
+            i = _WHITESPACE(s, i).end()
+            while i == len(self.s) and not self._at_end:
+                self._fill(self.offset + i, 1)
+                i = _WHITESPACE(self.s, 0).end()
+        return self.offset + i
+
+    def scan(self, scan_fn: Callable[[str, int], Tuple[Any, int]], idx: int) -> Tuple[Any, int]:
+        """Scans the value at `idx` with a scanner of the json module, decoding more of the text until it is whole."""
+        while True:
+            i = idx - self.offset
+            try:
+                value, end = scan_fn(self.s, i)
+                # a number may go on past the window, where the scanner only saw e.g. the `1` of `1e-5`
+                if self._at_end or end + 2 < len(self.s):
+                    return value, self.offset + end
+            except (StopIteration, json.JSONDecodeError):
+                if self._at_end:
+                    raise
+            self._fill(idx, 2 * (len(self.s) - i) + _CHUNK_SIZE)
+
+    def error(self, msg: str, idx: int) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self.s, idx - self.offset)
+
+    def describe(self, e: json.JSONDecodeError) -> str:
+        """The message of `e`, raised in the current window, with the position of the error in the whole text."""
+        column = e.colno + self._column if e.lineno == 1 else e.colno
+        return f"{e.msg}: line {self._lines + e.lineno} column {column} (char {self.offset + e.pos})"
+
+    def _fill(self, idx: int, size: int) -> None:
+        """Drops the characters before `idx`, and decodes until the window holds `size` characters or the text ends."""
+        assert self._data is not None
+        start = idx - self.offset
+        newlines = self.s.count("\n", 0, start)
+        if newlines:
+            self._lines += newlines
+            self._column = start - self.s.rfind("\n", 0, start) - 1
+        else:
+            self._column += start
+        self.offset = idx
+
+        chunks = [self.s[start:]]
+        available = len(chunks[0])
+        while available < size and not self._at_end:
+            chunk = bytes(self._data[self._read : self._read + _CHUNK_SIZE])
+            self._read += len(chunk)
+            self._at_end = self._read >= len(self._data)
+            chunks.append(self._decoder.decode(chunk, final=self._at_end))
+            available += len(chunks[-1])
+        self.s = "".join(chunks)
+
+
+def _scan_raw(text: _Text, idx: int) -> Tuple[Any, int]:
+    try:
+        return text.scan(_scan_once, idx)
+    except StopIteration as e:
+        raise json.JSONDecodeError("Expecting value", text.s, e.value) from None
+
+
+def _expect(text: _Text, idx: int, char: str, what: str) -> int:
+    if text.char(idx) != char:
+        raise text.error(f"Expecting {what}", idx)
+    return text.skip(idx + 1)
+
+
+def _decode_raw(cls: Type) -> ScanFunction:
+    """Scans the value with the json module and decodes it as `decode` would."""
+    decoding_fn = get_decoding_fn(cls)
+
+    def scan(text: _Text, idx: int, path: Tuple[str, ...]) -> Tuple[Any, int]:
+        raw_value, idx = _scan_raw(text, idx)
+        return decoding_fn(raw_value, path), idx
+
+    return scan
+
+
+@lru_cache(maxsize=100)
+def _get_scan_fn(cls: Type) -> ScanFunction:
+    scan = _get_streaming_scan_fn(cls)
+    return scan if scan is not None else _decode_raw(cls)
+
+
+def _get_streaming_scan_fn(cls: Type) -> Optional[ScanFunction]:
+    """Returns a scan function building `cls` without intermediate containers, or None if that has no benefit."""
+    underlying_type = typing.get_origin(cls) or cls
+    if decode.dispatch(cls) is not None or decode.dispatch(underlying_type) is not None:
+        return None
+
+    if is_choice_type(underlying_type):
+        return None
+    elif is_dataclass(underlying_type):
+        return _scan_dataclass(cls)
+    elif is_dict(underlying_type):
+        args = get_type_arguments(cls)
+        if len(args) != 2 or has_generic_arg(args):
+            return None
+        return _scan_dict(cls, *args)
+    elif is_list(cls) and not is_tuple(cls):
+        args = get_type_arguments(cls)
+        if len(args) != 1 or has_generic_arg(args):
+            return None
+        return _scan_list(cls, args[0])
+    elif is_optional(cls):
+        args = [arg for arg in get_type_arguments(cls) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        return _scan_optional(args[0])
+    return None
+
+
+def _scan_dataclass(cls: Type) -> ScanFunction:
+    origin, field_types = dataclass_field_types(cls)
+    field_scanners = {field.name: (field, field_type, _get_scan_fn(field_type)) for field, field_type in field_types}
+    decode_from_raw = _decode_raw(cls)
+
+    def scan(text: _Text, idx: int, path: Tuple[str, ...]) -> Tuple[Any, int]:
+        if text.char(idx) != "{":
+            # not an object, let the regular decoding function report the error
+            return decode_from_raw(text, idx, path)
+
+        init_args: Dict[str, Any] = {}
+        non_init_args: Dict[str, Any] = {}
+        extra_args: Dict[str, Any] = {}
+
+        idx = text.skip(idx + 1)
+        if text.char(idx) == "}":
+            return build_dataclass(cls, origin, init_args, non_init_args, extra_args, path), idx + 1
+
+        while True:
+            if text.char(idx) != '"':
+                raise text.error("Expecting property name enclosed in double quotes", idx)
+            key, idx = text.scan(_scanstring, idx + 1)
+            idx = _expect(text, text.skip(idx), ":", "':' delimiter")
+
+            field_scanner = field_scanners.get(key)
+            if field_scanner is None:
+                extra_args[key], idx = _scan_raw(text, idx)
+            else:
+                field, field_type, field_scan = field_scanner
+                try:
+                    value, idx = field_scan(text, idx, (*path, key))
+                except (ParsingError, DecodingError, json.JSONDecodeError):
+                    raise
+                except Exception as e:
+                    raise DecodingError(
+                        (*path, key),
+                        f'Failed when parsing field "{cls}.{key}" of type {field_type}.\n\tUnderlying error is'
+                        f' "{format_error(e)}"',
+                    ) from e
+                if field.init:
+                    init_args[key] = value
+                else:
+                    non_init_args[key] = value
+
+            idx = text.skip(idx)
+            if text.char(idx) == ",":
+                idx = text.skip(idx + 1)
+            elif text.char(idx) == "}":
+                idx += 1
+                break
+            else:
+                raise text.error("Expecting ',' delimiter", idx)
+
+        return build_dataclass(cls, origin, init_args, non_init_args, extra_args, path), idx
+
+    return scan
+
+
+def _scan_list(cls: Type, item_type: Type) -> Optional[ScanFunction]:
+    item_scan = _get_streaming_scan_fn(item_type)
+    if item_scan is None:
+        # the items are plain values, the json module builds the list faster than we can
+        return None
+    decode_from_raw = _decode_raw(cls)
+
+    def scan(text: _Text, idx: int, path: Tuple[str, ...]) -> Tuple[Any, int]:
+        if text.char(idx) != "[":
+            return decode_from_raw(text, idx, path)
+
+        result = []
+        idx = text.skip(idx + 1)
+        if text.char(idx) == "]":
+            return result, idx + 1
+
+        while True:
+            value, idx = item_scan(text, idx, (*path, str(len(result))))
+            result.append(value)
+            idx = text.skip(idx)
+            if text.char(idx) == ",":
+                idx = text.skip(idx + 1)
+            elif text.char(idx) == "]":
+                return result, idx + 1
+            else:
+                raise text.error("Expecting ',' delimiter", idx)
+
+    return scan
+
+
+def _scan_dict(cls: Type, key_type: Type, value_type: Type) -> Optional[ScanFunction]:
+    value_scan = _get_streaming_scan_fn(value_type)
+    if value_scan is None:
+        return None
+    decode_key = get_decoding_fn(key_type)
+    decode_from_raw = _decode_raw(cls)
+
+    def scan(text: _Text, idx: int, path: Tuple[str, ...]) -> Tuple[Any, int]:
+        if text.char(idx) != "{":
+            # e.g. a list of pairs, which decodes to an OrderedDict
+            return decode_from_raw(text, idx, path)
+
+        result: Dict[Any, Any] = {}
+        idx = text.skip(idx + 1)
+        if text.char(idx) == "}":
+            return result, idx + 1
+
+        while True:
+            if text.char(idx) != '"':
+                raise text.error("Expecting property name enclosed in double quotes", idx)
+            key, idx = text.scan(_scanstring, idx + 1)
+            idx = _expect(text, text.skip(idx), ":", "':' delimiter")
+            decoded_key = decode_key(key, (*path, f"key={key}"))
+            result[decoded_key], idx = value_scan(text, idx, (*path, key))
+
+            idx = text.skip(idx)
+            if text.char(idx) == ",":
+                idx = text.skip(idx + 1)
+            elif text.char(idx) == "}":
+                return result, idx + 1
+            else:
+                raise text.error("Expecting ',' delimiter", idx)
+
+    return scan
+
+
+def _scan_optional(t: Type) -> Optional[ScanFunction]:
+    inner_scan = _get_streaming_scan_fn(t)
+    if inner_scan is None:
+        return None
+
+    def scan(text: _Text, idx: int, path: Tuple[str, ...]) -> Tuple[Any, int]:
+        if text.startswith("null", idx):
+            return None, idx + 4
+        return inner_scan(text, idx, path)
+
+    return scan
@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Schema-guided merging of raw config trees (e.g. the dicts parsed from the layers of `load_layers`).
+
+Later layers override earlier ones: mappings are merged key by key, everything else (scalars, lists) is replaced.
+The type of the config guides the merge: when a layer changes the `type` of a choice field, the subtree of that field
+is replaced instead of merged, since the fields of the old choice most likely don't apply to the new one. Where the
+type says nothing (`Any`, unions of several types, unknown keys), mappings are merged like `mergedeep.merge` does.
+
+The result is made of fresh containers only, so the layers can be shared (e.g. cached) and are never modified.
+"""
+
+import typing
+from dataclasses import is_dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Mapping, Optional, Type
+
+from draccus.choice_types import CHOICE_TYPE_KEY
+from draccus.utils import canonicalize_union, get_type_arguments, is_choice_type, is_dict, is_union
+
+from .decoding import dataclass_field_types
+
+
+def copy_tree(value: Any) -> Any:
+    """Copies the dicts and lists of a raw config tree, sharing the leaves."""
+    if isinstance(value, Mapping):
+        return {k: copy_tree(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_tree(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=100)
+def _field_types(cls: Type) -> Dict[str, Any]:
+    _, field_types = dataclass_field_types(cls)
+    return {field.name: field_type for field, field_type in field_types}
+
+
+def non_optional_type(tpe: Any) -> Any:
+    """Strips `Optional` from `tpe`, or returns `Any` for unions of several types."""
+    if is_union(tpe):
+        args = [arg for arg in get_type_arguments(canonicalize_union(tpe)) if arg is not type(None)]
+        return args[0] if len(args) == 1 else Any
+    return tpe
+
+
+def _choice_schema(tpe: Any, base: Dict[str, Any], override: Mapping[str, Any]) -> Optional[Any]:
+    """The dataclass a choice field is decoded into, or None if `override` switches to another choice."""
+    current = base.get(CHOICE_TYPE_KEY, tpe.default_choice_name())
+    new = override.get(CHOICE_TYPE_KEY, current)
+    if new != current:
+        return None
+    try:
+        return tpe.get_choice_class(new) if new is not None else Any
+    except KeyError:
+        return Any
+
+
+def _merge_into(tpe: Any, base: Any, override: Any) -> Any:
+    """Merges `override` into `base`, which must be owned by the caller, and returns the merged value."""
+    if not isinstance(base, dict) or not isinstance(override, Mapping):
+        return copy_tree(override)
+
+    tpe = non_optional_type(tpe)
+    origin = typing.get_origin(tpe) or tpe
+    if is_choice_type(origin):
+        tpe = _choice_schema(origin, base, override)
+        if tpe is None:
+            return copy_tree(override)
+        origin = typing.get_origin(tpe) or tpe
+
+    if is_dataclass(origin):
+        field_types = _field_types(tpe)
+        for key, value in override.items():
+            base[key] = _merge_into(field_types.get(key, Any), base[key], value) if key in base else copy_tree(value)
+    else:
+        item_type = Any
+        if is_dict(origin):
+            args = get_type_arguments(tpe)
+            item_type = args[1] if len(args) == 2 else Any
+        for key, value in override.items():
+            base[key] = _merge_into(item_type, base[key], value) if key in base else copy_tree(value)
+    return base
+
+
+def merge_layers(cls: Type, layers: Iterable[Any]) -> Any:
+    """Merges the raw config trees in `layers` (in order of increasing precedence) for decoding into `cls`.
+
+    Each layer is visited once, and none of them is modified.
+    """
+    merged: Any = {}
+    for layer in layers:
+        merged = _merge_into(cls, merged, layer)
+    return merged
@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Applying dotted-path overrides to an already decoded config.
+
+Only the overridden values are decoded (with the decoder of their field), and only the dataclasses along the path
+of each override are rebuilt, with `dataclasses.replace`. Everything else is shared with the original config.
+"""
+
+import dataclasses
+import typing
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from draccus.choice_types import CHOICE_TYPE_KEY
+from draccus.utils import DecodingError, get_type_arguments, is_choice_type, is_dict, stringify_type
+
+from .decoding import dataclass_field_types, get_decoding_fn
+from .encoding import encode
+from .merging import merge_layers, non_optional_type
+
+T = TypeVar("T")
+
+_MISSING: Any = object()
+
+
+class _Override:
+    """The overrides below one dotted path: a value for the path itself, and/or overrides of its children."""
+
+    def __init__(self):
+        self.value: Any = _MISSING
+        self.children: Dict[str, "_Override"] = {}
+
+    def to_raw(self) -> Any:
+        """The overrides as a raw config tree, like the one parsed from a config file."""
+        raw = {} if self.value is _MISSING else self.value
+        if not self.children:
+            return raw
+        raw = dict(raw) if isinstance(raw, Mapping) else {}
+        raw.update((key, child.to_raw()) for key, child in self.children.items())
+        return raw
+
+
+def _build_tree(overrides: Mapping[str, Any]) -> _Override:
+    root = _Override()
+    for key, value in overrides.items():
+        node = root
+        for part in key.split("."):
+            node = node.children.setdefault(part, _Override())
+        node.value = value
+    return root
+
+
+@lru_cache(maxsize=100)
+def _fields(cls: Any) -> Dict[str, Tuple[dataclasses.Field, Any]]:
+    _, field_types = dataclass_field_types(cls)
+    return {field.name: (field, field_type) for field, field_type in field_types}
+
+
+def _decode(tpe: Any, raw_value: Any, path: Sequence[str]) -> Any:
+    return get_decoding_fn(tpe)(raw_value, tuple(path))
+
+
+def _apply_to_dataclass(obj: Any, tpe: Any, node: _Override, path: Tuple[str, ...]) -> Any:
+    cls = type(obj)
+    # the declared type keeps the type arguments of generic dataclasses
+    tpe = non_optional_type(tpe)
+    fields = _fields(tpe if typing.get_origin(tpe) is cls else cls)
+    unknown = [key for key in node.children if key not in fields]
+    if unknown:
+        formatted_keys = ", ".join(f"`{k}`" for k in unknown)
+        raise DecodingError(path, f"The fields {formatted_keys} are not valid for {stringify_type(cls)}")
+
+    init_changes: Dict[str, Any] = {}
+    non_init_changes: Dict[str, Any] = {}
+    for name, child in node.children.items():
+        field, field_type = fields[name]
+        value = _apply(getattr(obj, name), field_type, child, (*path, name))
+        if field.init:
+            init_changes[name] = value
+        else:
+            non_init_changes[name] = value
+
+    new_obj = dataclasses.replace(obj, **init_changes)
+    for name, value in non_init_changes.items():
+        object.__setattr__(new_obj, name, value)
+    return new_obj
+
+
+def _apply_to_dict(d: Dict[Any, Any], tpe: Any, node: _Override, path: Tuple[str, ...]) -> Dict[Any, Any]:
+    args = get_type_arguments(tpe)
+    key_type, value_type = args if len(args) == 2 else (Any, Any)
+    new_d = dict(d)
+    for key, child in node.children.items():
+        decoded_key = _decode(key_type, key, (*path, key))
+        if decoded_key in new_d:
+            new_d[decoded_key] = _apply(new_d[decoded_key], value_type, child, (*path, key))
+        else:
+            new_d[decoded_key] = _decode(value_type, child.to_raw(), (*path, key))
+    return new_d
+
+
+def _changes_choice(tpe: Any, value: Any, node: _Override) -> bool:
+    child = node.children.get(CHOICE_TYPE_KEY)
+    if child is None:
+        return False
+    tpe = non_optional_type(tpe)
+    origin = typing.get_origin(tpe) or tpe
+    if value is None or not is_choice_type(origin) or child.children:
+        return True
+    try:
+        return origin.get_choice_name(type(value)) != child.value
+    except ValueError:
+        return True
+
+
+def _apply(value: Any, tpe: Any, node: _Override, path: Tuple[str, ...]) -> Any:
+    if node.value is not _MISSING:
+        value = _decode(tpe, node.value, path)
+        if not node.children:
+            return value
+
+    if CHOICE_TYPE_KEY in node.children:
+        if _changes_choice(tpe, value, node):
+            # a different choice: its subtree is decoded from the overrides alone, like when merging config files
+            return _decode(tpe, node.to_raw(), path)
+        node = _without_choice_key(node)
+        if not node.children:
+            return value
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _apply_to_dataclass(value, tpe, node, path)
+    dict_type = non_optional_type(tpe)
+    if isinstance(value, dict) and (dict_type is Any or is_dict(typing.get_origin(dict_type) or dict_type)):
+        return _apply_to_dict(value, dict_type, node, path)
+
+    # anything else (e.g. a None optional dataclass, or a type with a custom decoder) is merged and decoded again
+    raw = merge_layers(tpe, [encode(value) if value is not None else {}, node.to_raw()])
+    return _decode(tpe, raw, path)
+
+
+def _without_choice_key(node: _Override) -> _Override:
+    new_node = _Override()
+    new_node.value = node.value
+    new_node.children = {k: v for k, v in node.children.items() if k != CHOICE_TYPE_KEY}
+    return new_node
+
+
+def apply_overrides(config: T, overrides: Mapping[str, Any], *, config_class: Optional[Any] = None) -> T:
+    """Returns a copy of `config` with the values at the given dotted paths replaced.
+
+    Args:
+        config: A decoded config (dataclass instance). It is not modified
+        overrides: Raw values (as they would appear in a config file) keyed by dotted path, e.g. `{"optimizer.lr": 1e-4}`
+        config_class: The declared type of `config`, if it differs from its class (e.g. a generic dataclass)
+
+    Only the overridden values are decoded, and only the dataclasses along their paths are rebuilt: the new config
+    shares every other value with `config`. Setting the `type` of a choice field to another choice decodes that field
+    from the overrides alone.
+    """
+    if not overrides:
+        return config
+    tpe = type(config) if config_class is None else config_class
+    return _apply(config, tpe, _build_tree(overrides), ())
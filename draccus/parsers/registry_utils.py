@@ -24,6 +24,8 @@ def withregistry(base_func):
     registry = {}
     dispatch_cache = weakref.WeakKeyDictionary()
     cache_token = None
+    # incremented on every registration, so results derived from the registry can be cached
+    generation = 0
 
     def dispatch(cls) -> Optional[RegistryFunc]:
         nonlocal cache_token
@@ -52,7 +54,7 @@ def withregistry(base_func):
         return impl
 
     def register(cls, func=None, include_subclasses=False):
-        nonlocal cache_token
+        nonlocal cache_token, generation
         if func is None:
             if isinstance(cls, type):
                 return lambda f: register(cls, func=f, include_subclasses=include_subclasses)
@@ -74,6 +76,7 @@ def withregistry(base_func):
         if cache_token is None and hasattr(cls, "__abstractmethods__"):
             cache_token = get_cache_token()
         dispatch_cache.clear()
+        generation += 1
         return func
 
     def wrapper(*args, **kw):
@@ -84,5 +87,6 @@ def withregistry(base_func):
     wrapper.dispatch = dispatch
     wrapper.registry = types.MappingProxyType(registry)
     wrapper._clear_cache = dispatch_cache.clear
+    wrapper.generation = lambda: generation
     update_wrapper(wrapper, base_func)
     return wrapper
@@ -0,0 +1,281 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Resolvers that load the config files referenced by `!include` and the CLI `include` keyword.
+
+A config file is identified by a *location* string. Which resolver handles a location is decided by its shape:
+
+- `path/to/file.yaml`: a file on the local filesystem (`LocalFileResolver`)
+- `path/to/bundle.zip::dir/file.yaml`: a member of a zip archive (`ZipResolver`)
+- `path/to/bundle.tar.gz::dir/file.yaml`: a member of a tar archive (`TarResolver`)
+- `pkg://some.package/dir/file.yaml`: a resource of an importable package (`PackageResourceResolver`)
+
+Relative includes are resolved against the including file with the resolver of that file, so a config inside an
+archive can `!include` its siblings. Custom resolvers (e.g. a fetcher with its own connection pool and memoization)
+can be added with `register_include_resolver`; they take precedence over the built-in ones.
+
+```python
+class S3Resolver(IncludeResolver):
+    def can_resolve(self, location: str) -> bool:
+        return location.startswith("s3://")
+
+    def read_text(self, location: str) -> str:
+        ...
+
+draccus.register_include_resolver(S3Resolver())
+```
+"""
+
+import io
+import os
+import posixpath
+import tarfile
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from .compression import open_text as open_compressed_text
+
+ARCHIVE_SEPARATOR = "::"
+PACKAGE_SCHEME = "pkg://"
+
+
+class IncludeResolver(ABC):
+    @abstractmethod
+    def can_resolve(self, location: str) -> bool:
+        """Whether this resolver handles `location`."""
+        pass
+
+    @abstractmethod
+    def read_text(self, location: str) -> str:
+        """Returns the contents of the config file at `location`. Raises FileNotFoundError if it doesn't exist."""
+        pass
+
+    def normalize(self, location: str) -> str:
+        """Returns a canonical form of `location`, used to deduplicate includes and detect cycles."""
+        return location
+
+    def join(self, base: str, ref: str) -> str:
+        """Resolves the relative reference `ref` found in the file at `base` (a location handled by this resolver)."""
+        scheme, sep, path = base.partition("://")
+        if not sep:
+            scheme, path = "", base
+        return f"{scheme}{sep}{posixpath.normpath(posixpath.join(posixpath.dirname(path), ref))}"
+
+    def qualify(self, location: str, base: Optional[str]) -> str:
+        """Makes `location` (handled by this resolver) independent of the file `base` it was referenced from."""
+        return location
+
+
+class LocalFileResolver(IncludeResolver):
+    def can_resolve(self, location: str) -> bool:
+        return True
+
+    def read_text(self, location: str) -> str:
+        with open_compressed_text(location) as f:
+            return f.read()
+
+    def normalize(self, location: str) -> str:
+        return os.path.normpath(os.path.abspath(location))
+
+    def join(self, base: str, ref: str) -> str:
+        return self.normalize(os.path.join(os.path.dirname(base), ref))
+
+
+def _local_dir(base: Optional[str]) -> str:
+    """The local directory that relative archive paths referenced from `base` are relative to."""
+    if base is None:
+        return ""
+    if ARCHIVE_SEPARATOR in base:
+        base = base.split(ARCHIVE_SEPARATOR, 1)[0]
+    elif get_include_resolver(base) is not _LOCAL_RESOLVER:
+        return ""
+    return os.path.dirname(base)
+
+
+class _ArchiveResolver(IncludeResolver):
+    """Base class for resolvers of `archive::member` locations. Archives are opened once and kept open."""
+
+    suffixes: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # archive path -> (mtime, size, handle), so a rewritten archive is reopened
+        self._archives: Dict[str, Tuple[float, int, object]] = {}
+
+    def can_resolve(self, location: str) -> bool:
+        if ARCHIVE_SEPARATOR not in location:
+            return False
+        archive = location.split(ARCHIVE_SEPARATOR, 1)[0]
+        return archive.lower().endswith(self.suffixes)
+
+    def split(self, location: str) -> Tuple[str, str]:
+        archive, member = location.split(ARCHIVE_SEPARATOR, 1)
+        return archive, member
+
+    def normalize(self, location: str) -> str:
+        archive, member = self.split(location)
+        return f"{os.path.normpath(os.path.abspath(archive))}{ARCHIVE_SEPARATOR}{posixpath.normpath(member)}"
+
+    def join(self, base: str, ref: str) -> str:
+        archive, member = self.split(base)
+        return self.normalize(f"{archive}{ARCHIVE_SEPARATOR}{posixpath.join(posixpath.dirname(member), ref)}")
+
+    def qualify(self, location: str, base: Optional[str]) -> str:
+        archive, member = self.split(location)
+        return self.normalize(f"{os.path.join(_local_dir(base), archive)}{ARCHIVE_SEPARATOR}{member}")
+
+    def read_text(self, location: str) -> str:
+        return self.read_bytes(location).decode("utf-8")
+
+    def read_bytes(self, location: str) -> bytes:
+        archive, member = self.split(location)
+        with self._lock:
+            handle = self._get_archive(archive)
+            try:
+                return self._read_member(handle, member)
+            except KeyError as e:
+                raise FileNotFoundError(f"No member {member} in archive {archive}") from e
+
+    def _get_archive(self, archive: str):
+        archive = os.path.abspath(archive)
+        stat = os.stat(archive)
+        cached = self._archives.get(archive)
+        if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+            return cached[2]
+        if cached is not None:
+            self._close(cached[2])
+        handle = self._open(archive)
+        self._archives[archive] = (stat.st_mtime, stat.st_size, handle)
+        return handle
+
+    def clear(self) -> None:
+        """Closes all archives opened by this resolver."""
+        with self._lock:
+            for _, _, handle in self._archives.values():
+                self._close(handle)
+            self._archives.clear()
+
+    @abstractmethod
+    def _open(self, archive: str):
+        pass
+
+    @abstractmethod
+    def _read_member(self, handle, member: str) -> bytes:
+        pass
+
+    @abstractmethod
+    def _close(self, handle) -> None:
+        pass
+
+
+class ZipResolver(_ArchiveResolver):
+    suffixes = (".zip",)
+
+    def _open(self, archive: str) -> zipfile.ZipFile:
+        return zipfile.ZipFile(archive)
+
+    def _read_member(self, handle: zipfile.ZipFile, member: str) -> bytes:
+        return handle.read(member)
+
+    def _close(self, handle: zipfile.ZipFile) -> None:
+        handle.close()
+
+
+class TarResolver(_ArchiveResolver):
+    suffixes = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+    def _open(self, archive: str) -> Tuple[tarfile.TarFile, Dict[str, tarfile.TarInfo]]:
+        tar = tarfile.open(archive)
+        # index the members once, tar archives have no central directory
+        members = {posixpath.normpath(info.name): info for info in tar.getmembers() if info.isfile()}
+        return tar, members
+
+    def _read_member(self, handle: Tuple[tarfile.TarFile, Dict[str, tarfile.TarInfo]], member: str) -> bytes:
+        tar, members = handle
+        f = tar.extractfile(members[posixpath.normpath(member)])
+        assert f is not None
+        return f.read()
+
+    def _close(self, handle: Tuple[tarfile.TarFile, Dict[str, tarfile.TarInfo]]) -> None:
+        handle[0].close()
+
+
+class PackageResourceResolver(IncludeResolver):
+    def can_resolve(self, location: str) -> bool:
+        return location.startswith(PACKAGE_SCHEME)
+
+    def split(self, location: str) -> Tuple[str, str]:
+        package, _, resource = location[len(PACKAGE_SCHEME) :].partition("/")
+        return package, resource
+
+    def normalize(self, location: str) -> str:
+        package, resource = self.split(location)
+        return f"{PACKAGE_SCHEME}{package}/{posixpath.normpath(resource)}"
+
+    def join(self, base: str, ref: str) -> str:
+        package, resource = self.split(base)
+        return self.normalize(f"{PACKAGE_SCHEME}{package}/{posixpath.join(posixpath.dirname(resource), ref)}")
+
+    def read_text(self, location: str) -> str:
+        import importlib.resources
+
+        package, resource = self.split(location)
+        try:
+            return importlib.resources.files(package).joinpath(resource).read_text(encoding="utf-8")
+        except (ModuleNotFoundError, IsADirectoryError) as e:
+            raise FileNotFoundError(f"Couldn't find resource {resource} in package {package}") from e
+
+
+_LOCAL_RESOLVER = LocalFileResolver()
+
+# consulted in order, the local filesystem is always the last resort
+_resolvers: List[IncludeResolver] = [ZipResolver(), TarResolver(), PackageResourceResolver()]
+
+
+def register_include_resolver(resolver: IncludeResolver) -> IncludeResolver:
+    """Registers a resolver. Resolvers registered later take precedence over earlier and built-in ones."""
+    _resolvers.insert(0, resolver)
+    return resolver
+
+
+def unregister_include_resolver(resolver: IncludeResolver) -> None:
+    _resolvers.remove(resolver)
+
+
+def get_include_resolver(location: str) -> IncludeResolver:
+    for resolver in _resolvers:
+        if resolver.can_resolve(location):
+            return resolver
+    return _LOCAL_RESOLVER
+
+
+def is_local(location: str) -> bool:
+    """Whether `location` is a path on the local filesystem."""
+    return get_include_resolver(location) is _LOCAL_RESOLVER
+
+
+def normalize_location(location: str) -> str:
+    return get_include_resolver(location).normalize(location)
+
+
+def resolve_location(base: Optional[str], ref: str) -> str:
+    """Resolves the include reference `ref` found in the file at `base` (None for the current directory)."""
+    resolver = get_include_resolver(ref)
+    if resolver is not _LOCAL_RESOLVER:
+        return resolver.qualify(ref, base)
+    if base is None or os.path.isabs(ref):
+        return _LOCAL_RESOLVER.normalize(ref)
+    return get_include_resolver(base).join(base, ref)
+
+
+def read_text(location: str) -> str:
+    return get_include_resolver(location).read_text(location)
+
+
+def open_text(location: str) -> io.StringIO:
+    """Returns the contents of `location` as a stream, whose `name` is used to resolve relative includes."""
+    stream = io.StringIO(read_text(location))
+    stream.name = location  # type: ignore
+    return stream
@@ -1,24 +1,169 @@
 # SPDX-License-Identifier: MIT
 # Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
 
-import os
+import io
+from typing import Dict, List, Optional, Sequence, Union
 
 import yaml  # type: ignore
-import yaml.representer  # type: ignore
-from yaml import MappingNode
+from yaml import MappingNode, Node, ScalarNode, SequenceNode
 from yaml.constructor import ConstructorError  # type: ignore
 
+from .cache import record_dependency
+from .include_graph import IncludeCycleError
+from .resolvers import normalize_location, read_text, resolve_location
+
+
+def named_stream(text: str, name: str) -> io.StringIO:
+    """Wraps `text` in a stream whose `name` is used to resolve relative includes."""
+    stream = io.StringIO(text)
+    stream.name = name  # type: ignore
+    return stream
+
+
+def load_yaml(
+    stream: Union[str, io.TextIOBase],
+    loader_class: type,
+    include_sources: Optional[Dict[str, str]] = None,
+    include_chain: Sequence[str] = (),
+    include_nodes: Optional[Dict[str, Optional[Node]]] = None,
+):
+    """Like `yaml.load`, but `!include` is resolved from `include_sources` (location -> text) when possible.
+
+    `include_nodes` caches the composed documents of files merged with `<<: !include`, shared by nested includes.
+    """
+    loader = loader_class(stream)
+    loader.include_sources = include_sources if include_sources is not None else {}
+    loader.include_chain = tuple(include_chain)
+    if include_nodes is not None:
+        loader.include_nodes = include_nodes
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+def _qualify_includes(root: Node, location: str) -> None:
+    """Makes the `!include` references in the document of `location` independent of the file they were found in."""
+    seen = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, ScalarNode):
+            if node.tag == "!include":
+                node.value = resolve_location(location, node.value)
+        elif isinstance(node, SequenceNode):
+            stack.extend(node.value)
+        elif isinstance(node, MappingNode):
+            for key_node, value_node in node.value:
+                stack.append(key_node)
+                stack.append(value_node)
+
+
+def _clone_node(node: Node, memo: Dict[int, Node]) -> Node:
+    """Deep copy of a node tree. Aliases (nodes appearing several times) stay shared within the copy."""
+    clone = memo.get(id(node))
+    if clone is not None:
+        return clone
+    if isinstance(node, ScalarNode):
+        clone = ScalarNode(node.tag, node.value, node.start_mark, node.end_mark, node.style)
+        memo[id(node)] = clone
+        return clone
+
+    clone = node.__class__(node.tag, [], node.start_mark, node.end_mark, node.flow_style)
+    memo[id(node)] = clone
+    if isinstance(node, MappingNode):
+        clone.value = [(_clone_node(key, memo), _clone_node(value, memo)) for key, value in node.value]
+    else:
+        clone.value = [_clone_node(value, memo) for value in node.value]
+    return clone
+
 
 def include_constructor(loader, node):
-    filename = os.path.normpath(os.path.join(os.path.dirname(loader.stream.name), node.value))
-    with open(filename, "r") as f:
-        return yaml.load(f, loader.__class__)
+    filename = resolve_location(loader.name, node.value)
+    chain = loader.include_chain or (normalize_location(loader.name),)
+    if filename in chain:
+        raise IncludeCycleError([*chain, filename])
+    record_dependency(filename)
+
+    text = loader.include_sources.get(filename)
+    if text is None:
+        text = read_text(filename)
+    return load_yaml(
+        named_stream(text, filename),
+        loader.__class__,
+        include_sources=loader.include_sources,
+        include_chain=(*chain, filename),
+        include_nodes=loader.include_nodes,
+    )
 
 
-class ConstructorWithGoodInclusion(yaml.constructor.SafeConstructor, yaml.representer.SafeRepresenter):
+class ConstructorWithGoodInclusion(yaml.constructor.SafeConstructor):
     def __init__(self):
         yaml.constructor.SafeConstructor.__init__(self)
-        yaml.representer.SafeRepresenter.__init__(self)
+        # prefetched text of included files, and the chain of files being included (for cycle detection)
+        self.include_sources: Dict[str, str] = {}
+        self.include_chain: Sequence[str] = ()
+        # composed (and flattened) documents of the files merged with `<<: !include`, by location
+        self.include_nodes: Dict[str, Optional[Node]] = {}
+        # files whose document is being flattened for a merge
+        self.merge_chain: List[str] = []
+
+    def compose_include(self, include_node: ScalarNode) -> Optional[Node]:
+        """Returns a copy of the document included by `include_node`, composed once per location."""
+        filename = resolve_location(self.name, include_node.value)
+        chain = [*(self.include_chain or (normalize_location(self.name),)), *self.merge_chain]
+        if filename in chain:
+            raise IncludeCycleError([*chain, filename])
+        record_dependency(filename)
+
+        if filename not in self.include_nodes:
+            text = self.include_sources.get(filename)
+            if text is None:
+                text = read_text(filename)
+            loader = self.__class__(named_stream(text, filename))
+            try:
+                root = loader.get_single_node()
+            finally:
+                loader.dispose()
+            if root is not None:
+                # the nodes are spliced into other documents, so relative includes must not depend on this file
+                _qualify_includes(root, filename)
+                if isinstance(root, MappingNode):
+                    self.merge_chain.append(filename)
+                    try:
+                        self.flatten_mapping(root)
+                    finally:
+                        self.merge_chain.pop()
+            self.include_nodes[filename] = root
+
+        root = self.include_nodes[filename]
+        # every merge site gets its own nodes, so the constructed values aren't shared between sites
+        return None if root is None else _clone_node(root, {})
+
+    def _merge_source(self, node: Node, value_node: Node) -> MappingNode:
+        if value_node.tag == "!include":
+            included = self.compose_include(value_node)
+            if not isinstance(included, MappingNode):
+                raise ConstructorError(
+                    "while constructing a mapping",
+                    node.start_mark,
+                    "expected included node to be mapping for merging, but found %s"
+                    % ("nothing" if included is None else included.id),
+                    value_node.start_mark,
+                )
+            return included
+        if not isinstance(value_node, MappingNode):
+            raise ConstructorError(
+                "while constructing a mapping",
+                node.start_mark,
+                "expected a mapping for merging, but found %s" % value_node.id,
+                value_node.start_mark,
+            )
+        self.flatten_mapping(value_node)
+        return value_node
 
     # this is a hack to get around the fact that inclusion doesn't work with the merge key <<
     def flatten_mapping(self, node):
@@ -28,34 +173,13 @@ class ConstructorWithGoodInclusion(yaml.constructor.SafeConstructor, yaml.repres
             key_node, value_node = node.value[index]
             if key_node.tag == "tag:yaml.org,2002:merge":
                 del node.value[index]
-                # this is the difference from the original method
-                if value_node.tag == "!include":
-                    value = self.construct_object(value_node)
-                    value = self.represent_data(value)
-                    if isinstance(value, MappingNode):
-                        merge.extend(value.value)
-                    else:
-                        raise ConstructorError(
-                            "while constructing a mapping",
-                            node.start_mark,
-                            "expected included node to be mapping for merging, but found %s" % value_node.id,
-                            value_node.start_mark,
-                        )
-                elif isinstance(value_node, yaml.MappingNode):
-                    self.flatten_mapping(value_node)
-                    merge.extend(value_node.value)
-                elif isinstance(value_node, yaml.SequenceNode):
+                # this is the difference from the original method: included documents are spliced in as nodes
+                if value_node.tag == "!include" or isinstance(value_node, MappingNode):
+                    merge.extend(self._merge_source(node, value_node).value)
+                elif isinstance(value_node, SequenceNode):
                     submerge = []
                     for subnode in value_node.value:
-                        if not isinstance(subnode, yaml.MappingNode):
-                            raise ConstructorError(
-                                "while constructing a mapping",
-                                node.start_mark,
-                                "expected a mapping for merging, but found %s" % subnode.id,
-                                subnode.start_mark,
-                            )
-                        self.flatten_mapping(subnode)
-                        submerge.append(subnode.value)
+                        submerge.append(self._merge_source(node, subnode).value)
                     submerge.reverse()
                     for value in submerge:
                         merge.extend(value)
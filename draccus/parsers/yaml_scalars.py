@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""Fast paths for parsing command line values of scalar fields as YAML.
+
+Every command line value is parsed as a YAML document before being decoded into its field, which is wasteful for the
+common `--trainer.steps 1000`. Knowing the type of the field, we try the few YAML scalar forms that can make sense for
+it with a regex instead. The patterns are those of PyYAML's implicit resolvers, so a fast path returns exactly what
+`yaml.load` would; any value that doesn't match (lists, dicts, quoted strings, hex ints, dates, ...) still goes
+through the YAML parser.
+"""
+
+import re
+import typing
+from enum import Enum
+from functools import lru_cache
+from pathlib import PurePath
+from typing import Any, Callable, Optional, Sequence, Tuple, Type
+
+from draccus import utils
+
+NO_MATCH: Any = object()
+
+_INT_RE = re.compile(r"[-+]?(?:0|[1-9][0-9_]*)")
+_FLOAT_RE = re.compile(r"[-+]?[0-9][0-9_]*\.[0-9_]*(?:[eE][-+][0-9]+)?")
+_BOOLS = {
+    **{word: True for word in ("yes", "Yes", "YES", "true", "True", "TRUE", "on", "On", "ON")},
+    **{word: False for word in ("no", "No", "NO", "false", "False", "FALSE", "off", "Off", "OFF")},
+}
+_NULLS = ("~", "null", "Null", "NULL")
+# plain scalars no implicit resolver applies to (except for the bool and null keywords)
+_WORD_RE = re.compile(r"[A-Za-z_/][A-Za-z0-9_\-./]*")
+
+ScalarMatcher = Callable[[str], Any]
+
+
+def _match_int(s: str) -> Any:
+    return int(s.replace("_", "")) if _INT_RE.fullmatch(s) else NO_MATCH
+
+
+def _match_float(s: str) -> Any:
+    return float(s.replace("_", "")) if _FLOAT_RE.fullmatch(s) else NO_MATCH
+
+
+def _match_bool(s: str) -> Any:
+    return _BOOLS.get(s, NO_MATCH)
+
+
+def _match_null(s: str) -> Any:
+    return None if s in _NULLS else NO_MATCH
+
+
+def _match_word(s: str) -> Any:
+    if s in _BOOLS or s in _NULLS or not _WORD_RE.fullmatch(s):
+        return NO_MATCH
+    return s
+
+
+def _matchers_for(tpe: Any) -> Tuple[ScalarMatcher, ...]:
+    if utils.is_optional(tpe):
+        args = [arg for arg in utils.get_type_arguments(tpe) if arg is not type(None)]
+        inner = _matchers_for(args[0]) if len(args) == 1 else ()
+        return (*inner, _match_null) if inner else ()
+    if utils.is_literal(tpe):
+        values = utils.get_type_arguments(tpe)
+        return tuple(dict.fromkeys(m for value in values for m in _matchers_for(type(value))))
+    if typing.get_origin(tpe) is not None or not isinstance(tpe, type):
+        return ()
+    if tpe is bool:
+        return (_match_bool,)
+    if tpe is int:
+        return (_match_int,)
+    if tpe is float:
+        # ints are valid floats
+        return (_match_int, _match_float)
+    if tpe is str or issubclass(tpe, (Enum, PurePath)):
+        return (_match_word,)
+    return ()
+
+
+_BUILTIN_SCALARS = (bool, int, float, str, type(None))
+
+
+def scalar_kind(tpe: Any) -> Optional[Any]:
+    """Returns a type made of builtins only with the same scalar fast path as `tpe`, or None if `tpe` has none.
+
+    Used to persist the types of command line options without referencing (and importing) the classes behind them.
+    """
+    tpe = utils.canonicalize_union(tpe)
+    if utils.is_optional(tpe):
+        args = [arg for arg in utils.get_type_arguments(tpe) if arg is not type(None)]
+        inner = scalar_kind(args[0]) if len(args) == 1 else None
+        return None if inner is None else Optional[inner]
+    if utils.is_literal(tpe):
+        # only the types of the values matter, and enum members parse like strings
+        values = tuple(v if type(v) in _BUILTIN_SCALARS else str(v) for v in utils.get_type_arguments(tpe))
+        return typing.Literal[values]  # type: ignore
+    if tpe in _BUILTIN_SCALARS:
+        return tpe if _matchers_for(tpe) else None
+    if isinstance(tpe, type) and issubclass(tpe, (Enum, PurePath)):
+        return str
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_scalar_parser(tpe: Type) -> Optional[Callable[[str], Any]]:
+    """Returns a function parsing the scalar forms of `tpe` like YAML would, returning NO_MATCH for anything else.
+
+    Returns None if `tpe` has no scalar fast path (e.g. containers or dataclasses).
+    """
+    matchers: Sequence[ScalarMatcher] = _matchers_for(utils.canonicalize_union(tpe))
+    if not matchers:
+        return None
+
+    def parse(s: str) -> Any:
+        for matcher in matchers:
+            value = matcher(s)
+            if value is not NO_MATCH:
+                return value
+        return NO_MATCH
+
+    return parse
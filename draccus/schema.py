@@ -0,0 +1,209 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""JSON Schema export for config classes.
+
+The schema describes the raw config (what a config file contains), following the decoders in
+`draccus.parsers.decoding`:
+
+- dataclasses are objects with one property per field, and no other properties;
+- choice types are a `oneOf` of their registered choices, each an object whose `type` property names the choice;
+- unions are an `anyOf`, literals and enums an `enum` (enums accept both the names and the values of their members);
+- lists, sets and tuples are arrays, and dicts are objects.
+
+Types the schema can't describe (e.g. types with a custom decoder) accept any value.
+"""
+
+import copy
+import dataclasses
+import enum
+import json
+import typing
+from pathlib import PurePath
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import typing_inspect as tpi
+
+from draccus.choice_types import CHOICE_TYPE_KEY, registry_generation
+from draccus.parsers.decoding import dataclass_field_types
+from draccus.parsers.encoding import encode
+from draccus.utils import (
+    canonicalize_union,
+    get_type_arguments,
+    get_type_name,
+    is_choice_type,
+    is_dict,
+    is_enum,
+    is_list,
+    is_literal,
+    is_set,
+    is_tuple,
+    is_union,
+)
+
+JSON_SCHEMA_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+
+_SCALAR_SCHEMAS: Dict[Any, Dict[str, Any]] = {
+    bool: {"type": "boolean"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    str: {"type": "string"},
+    bytes: {"type": "string"},
+    type(None): {"type": "null"},
+}
+
+# class -> (registry generation, schema)
+_schemas: Dict[Any, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _json_value(value: Any) -> Any:
+    """The JSON form of a python value, or `dataclasses.MISSING` if it has none."""
+    try:
+        encoded = encode(value)
+        json.dumps(encoded)
+        return encoded
+    except Exception:  # pylint: disable=broad-except
+        return dataclasses.MISSING
+
+
+class _SchemaBuilder:
+    def __init__(self):
+        self.defs: Dict[str, Dict[str, Any]] = {}
+        # type (or (choice base, choice name)) -> name of its definition
+        self.def_names: Dict[Any, str] = {}
+
+    def ref(self, key: Any, name: str, build: typing.Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Returns a reference to the definition of `key`, building it on first use (which also handles recursion)."""
+        if key not in self.def_names:
+            unique_name = name
+            suffix = 2
+            while unique_name in self.defs:
+                unique_name = f"{name}_{suffix}"
+                suffix += 1
+            self.def_names[key] = unique_name
+            self.defs[unique_name] = {}
+            self.defs[unique_name] = build()
+        return {"$ref": f"#/$defs/{self.def_names[key]}"}
+
+    def schema(self, tpe: Any) -> Dict[str, Any]:
+        tpe = canonicalize_union(tpe)
+        origin = typing.get_origin(tpe) or tpe
+
+        if tpe is Any or tpe is object:
+            return {}
+        if tpe in _SCALAR_SCHEMAS:
+            return dict(_SCALAR_SCHEMAS[tpe])
+        if isinstance(origin, type) and issubclass(origin, PurePath):
+            return {"type": "string"}
+        if is_choice_type(origin):
+            return self.ref(tpe, get_type_name(tpe), lambda: self.choice_schema(tpe))
+        if dataclasses.is_dataclass(origin):
+            return self.ref(tpe, get_type_name(tpe), lambda: self.dataclass_schema(tpe))
+        if is_union(tpe):
+            return {"anyOf": [self.schema(arg) for arg in get_type_arguments(tpe)]}
+        if is_literal(tpe):
+            # as the values are dumped, e.g. enum members by name
+            values = [_json_value(arg) for arg in get_type_arguments(tpe)]
+            return {"enum": [value for value in values if value is not dataclasses.MISSING]}
+        if is_enum(tpe):
+            return self.enum_schema(tpe)
+        if is_dict(origin):
+            args = get_type_arguments(tpe)
+            value_type = args[1] if len(args) == 2 else Any
+            return {"type": "object", "additionalProperties": self.schema(value_type)}
+        if is_tuple(origin):
+            return self.tuple_schema(get_type_arguments(tpe))
+        if is_list(origin) or is_set(origin):
+            args = get_type_arguments(tpe)
+            return {"type": "array", "items": self.schema(args[0] if len(args) == 1 else Any)}
+        if tpi.is_typevar(tpe):
+            bound = tpi.get_bound(tpe)
+            return {} if bound is None else self.schema(bound)
+        return {}
+
+    def enum_schema(self, tpe: Type[enum.Enum]) -> Dict[str, Any]:
+        values: List[Any] = []
+        for member in tpe:
+            for value in (member.name, member.value):
+                if isinstance(value, (str, int, float, bool)) and value not in values:
+                    values.append(value)
+        return {"enum": values}
+
+    def tuple_schema(self, args: Tuple[Any, ...]) -> Dict[str, Any]:
+        if not args:
+            return {"type": "array"}
+        if Ellipsis in args:
+            return {"type": "array", "items": self.schema(args[args.index(Ellipsis) - 1])}
+        return {
+            "type": "array",
+            "prefixItems": [self.schema(arg) for arg in args],
+            "items": False,
+            "minItems": len(args),
+            "maxItems": len(args),
+        }
+
+    def dataclass_schema(self, tpe: Any, choice_name: Optional[str] = None, required_choice: bool = False):
+        _, field_types = dataclass_field_types(tpe)
+        properties: Dict[str, Any] = {}
+        required: List[str] = []
+        if choice_name is not None:
+            properties[CHOICE_TYPE_KEY] = {"const": choice_name}
+            if required_choice:
+                required.append(CHOICE_TYPE_KEY)
+        for field, field_type in field_types:
+            field_schema = self.schema(field_type)
+            if field.default is not dataclasses.MISSING:
+                default = _json_value(field.default)
+                if default is not dataclasses.MISSING:
+                    field_schema = {**field_schema, "default": default}
+            elif field.init and field.default_factory is dataclasses.MISSING:
+                required.append(field.name)
+            properties[field.name] = field_schema
+
+        schema: Dict[str, Any] = {"type": "object", "title": get_type_name(tpe), "properties": properties}
+        if required:
+            schema["required"] = required
+        schema["additionalProperties"] = False
+        return schema
+
+    def choice_schema(self, tpe: Any) -> Dict[str, Any]:
+        origin = typing.get_origin(tpe) or tpe
+        try:
+            # the choice class is itself registered, so it's decoded as is
+            origin.get_choice_name(origin)
+            return self.dataclass_schema(tpe)
+        except ValueError:
+            pass
+
+        default_name = origin.default_choice_name()
+        choices = []
+        for name, choice_class in origin.get_known_choices().items():
+            choices.append(
+                self.ref(
+                    (origin, name),
+                    f"{get_type_name(origin)}.{name}",
+                    lambda choice_class=choice_class, name=name: self.dataclass_schema(
+                        choice_class, choice_name=name, required_choice=name != default_name
+                    ),
+                )
+            )
+        return {"title": get_type_name(tpe), "oneOf": choices}
+
+
+def json_schema(cls: Type) -> Dict[str, Any]:
+    """Returns a JSON Schema (draft 2020-12) of the config files that can be decoded into `cls`.
+
+    The schema is memoized per class, until a new choice is registered with a choice type. Its layout only depends on
+    `cls`, so it can also be cached on disk.
+    """
+    entry = _schemas.get(cls)
+    if entry is None or entry[0] != registry_generation():
+        builder = _SchemaBuilder()
+        root = builder.schema(cls)
+        schema = {"$schema": JSON_SCHEMA_DIALECT, **root}
+        if builder.defs:
+            schema["$defs"] = builder.defs
+        # read after building, since building may discover plugins
+        entry = (registry_generation(), schema)
+        _schemas[cls] = entry
+    return copy.deepcopy(entry[1])
@@ -5,12 +5,13 @@ import argparse
 import dataclasses
 from dataclasses import Field
 from functools import cached_property
-from typing import Dict, Optional, Sequence, Type
+from typing import Dict, Mapping, Optional, Sequence, Type
 
 from ..choice_types import CHOICE_TYPE_KEY, ChoiceType
 from ..parsers.decoding import has_custom_decoder
 from ..utils import canonicalize_union, is_choice_type, is_union
 from . import FieldWrapper, docstring
+from .suppressing_argparse import Lazy
 from .wrapper import AggregateWrapper, Wrapper
 
 
@@ -36,6 +37,8 @@ class ChoiceWrapper(AggregateWrapper[Type[ChoiceType]]):
 
         self._required: bool = False
         self._explicit: bool = False
+        # the wrappers of the choices looked up so far, by name
+        self._wrapped: Dict[str, Wrapper] = {}
 
     @property
     def title(self) -> str:
@@ -60,45 +63,67 @@ class ChoiceWrapper(AggregateWrapper[Type[ChoiceType]]):
             return ""  # The base dataclass doc looks confusing, remove it
         return class_doc
 
-    def register_actions(self, parser: argparse.ArgumentParser) -> None:
-        group = parser.add_argument_group(title=self.title, description=self.description)
-        children = self._children
+    def register_actions(self, parser: argparse.ArgumentParser, choices: Optional[Mapping[str, str]] = None) -> None:
+        group = parser.add_argument_group(title=Lazy(lambda: self.title), description=Lazy(lambda: self.description))
+        children = self._children if choices is None else self._selected_children(choices)
 
         # Register the type argument. If closed, it's a choice between the known types, otherwise a string description
-        dest = self.dest
-        if dest is None:
-            arg_name = CHOICE_TYPE_KEY
-        else:
-            arg_name = f"{dest}.{CHOICE_TYPE_KEY}"
-
         group.add_argument(
-            f"--{arg_name}",
+            f"--{self.type_option}",
             choices=list(children.keys()),
-            help=f"Which type of {self.title} to use",
+            help=Lazy(lambda: f"Which type of {self.title} to use"),
             required=self.required,
         )
 
-        for child in self._children.values():
+        for child in children.values():
             from .dataclass_wrapper import DataclassWrapper
 
             assert isinstance(child, DataclassWrapper)
-            child.register_actions(parser)
+            child.register_actions(parser, choices)
+
+    @property
+    def type_option(self) -> str:
+        """The name of the option selecting the choice, e.g. `model.type`."""
+        dest = self.dest
+        if dest is None:
+            return CHOICE_TYPE_KEY
+        return f"{dest}.{CHOICE_TYPE_KEY}"
 
     @cached_property
     def _children(self) -> Dict[str, Wrapper]:
+        return {name: self._wrap_child(name, child) for name, child in self.choice_type.get_known_choices().items()}
+
+    def _selected_children(self, choices: Mapping[str, str]) -> Dict[str, Wrapper]:
+        """The wrapper of the choice selected by `choices`, or of the default choice, without looking up the others."""
+        name = choices.get(self.type_option) or self.choice_type.default_choice_name()
+        if name is None:
+            return {}
+        if name not in self._wrapped:
+            try:
+                child = self.choice_type.get_choice_class(name)
+            except (KeyError, ValueError):
+                # an unknown choice: no choice is registered, so the type option rejects it
+                return {}
+            self._wrap_child(name, child)
+        return {name: self._wrapped[name]}
+
+    def _wrap_child(self, name: str, child: Type) -> Wrapper:
         from .dataclass_wrapper import DataclassWrapper
 
-        def _wrap_child(child: Type) -> Wrapper:
-            if not dataclasses.is_dataclass(child):
-                raise ValueError(f"Expected a dataclass, got {child}")
-            if has_custom_decoder(child):
-                raise ValueError(f"Cannot use class with custom decoder as choice type: {child}")
-
-            # because we "substitute" the choice type for the child, we need to make sure that
-            # the child's parent is the same as the choice type's parent
-            return DataclassWrapper(child, parent=self.parent, _field=self._field, name=self.name)
-
-        return {name: _wrap_child(child) for name, child in self.choice_type.get_known_choices().items()}
+        if name in self._wrapped:
+            return self._wrapped[name]
+        if not dataclasses.is_dataclass(child):
+            raise ValueError(f"Expected a dataclass, got {child}")
+        if has_custom_decoder(child):
+            raise ValueError(f"Cannot use class with custom decoder as choice type: {child}")
+
+        # because we "substitute" the choice type for the child, we need to make sure that
+        # the child's parent is the same as the choice type's parent
+        wrapper = DataclassWrapper(child, parent=self.parent, _field=self._field, name=self.name)
+        if self._required:
+            wrapper.required = True
+        self._wrapped[name] = wrapper
+        return wrapper
 
     @property
     def required(self) -> bool:
@@ -107,7 +132,7 @@ class ChoiceWrapper(AggregateWrapper[Type[ChoiceType]]):
     @required.setter
     def required(self, value: bool):
         self._required = value
-        for child_wrapper in self._children.values():
+        for child_wrapper in self._wrapped.values():
             child_wrapper.required = value
 
     @property
@@ -190,9 +215,9 @@ class UnionWrapper(AggregateWrapper[type]):
         class_doc = self.union.__doc__ or ""
         return class_doc
 
-    def register_actions(self, parser: argparse.ArgumentParser) -> None:
+    def register_actions(self, parser: argparse.ArgumentParser, choices: Optional[Mapping[str, str]] = None) -> None:
         # In Pyrallis/Draccus, Unions are implicitly resolved with no tag, unlike Choices
-        group = parser.add_argument_group(title=self.title, description=self.description)
+        group = parser.add_argument_group(title=Lazy(lambda: self.title), description=Lazy(lambda: self.description))
         children = self._children
 
         has_field_wrapper = False
@@ -201,31 +226,29 @@ class UnionWrapper(AggregateWrapper[type]):
             from .dataclass_wrapper import DataclassWrapper
 
             if isinstance(child, DataclassWrapper):
-                child.register_actions(parser)
+                child.register_actions(parser, choices)
             elif isinstance(child, FieldWrapper):
                 has_field_wrapper = True
             elif child is None:
                 pass
             elif isinstance(child, ChoiceWrapper):
-                child.register_actions(parser)
+                child.register_actions(parser, choices)
             else:
                 raise ValueError(f"Unexpected child type: {child}")
 
         if has_field_wrapper:
-            if self._field is None:
-                help_text: Optional[str] = None
-            elif self.parent is not None and self._field is not None:
-                doc = docstring.get_attribute_docstring(self.parent.type, self._field.name)
-                help_text = docstring.get_preferred_help_text(doc, preferred_help=self.preferred_help)
-            else:
-                help_text = None
-
             group.add_argument(
                 f"--{self.dest}",
                 required=False,
-                help=help_text,
+                help=Lazy(self._help_text),
             )
 
+    def _help_text(self) -> Optional[str]:
+        if self.parent is None or self._field is None:
+            return None
+        doc = docstring.get_attribute_docstring(self.parent.type, self._field.name)
+        return docstring.get_preferred_help_text(doc, preferred_help=self.preferred_help)
+
     @cached_property
     def _children(self) -> Sequence[Optional[Wrapper]]:
         from .dataclass_wrapper import DataclassWrapper
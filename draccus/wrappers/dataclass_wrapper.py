@@ -7,7 +7,7 @@ import argparse
 import dataclasses
 import typing
 from logging import getLogger
-from typing import Dict, List, Optional, Type, Union, cast
+from typing import Dict, List, Mapping, Optional, Type, Union, cast
 
 from draccus.utils import Dataclass, DataclassType
 
@@ -16,6 +16,7 @@ from ..choice_types import ChoiceType
 from ..parsers.decoding import has_custom_decoder
 from . import docstring
 from .field_wrapper import FieldWrapper
+from .suppressing_argparse import Lazy
 from .wrapper import AggregateWrapper, Wrapper
 
 logger = getLogger(__name__)
@@ -64,14 +65,14 @@ class DataclassWrapper(AggregateWrapper[Type[Dataclass]]):
             if child is not None:
                 self._children.append(child)
 
-    def register_actions(self, parser: argparse.ArgumentParser) -> None:
-        group = parser.add_argument_group(title=self.title, description=self.description)
+    def register_actions(self, parser: argparse.ArgumentParser, choices: Optional[Mapping[str, str]] = None) -> None:
+        group = parser.add_argument_group(title=Lazy(lambda: self.title), description=Lazy(lambda: self.description))
 
         for child in self._children:
             if isinstance(child, AggregateWrapper):
                 # Child name will always be populated as this is done via our code inside `_wrap_field`
                 parser.add_argument("--" + child.name, type=str, required=False, help="Config file for " + child.name)
-                child.register_actions(parser)
+                child.register_actions(parser, choices)
             elif isinstance(child, FieldWrapper):
                 child.add_action(group)
 
@@ -170,7 +171,7 @@ def _wrap_field(
 
     if has_custom_decoder(field_type):
         field_wrapper = FieldWrapper(field, parent=parent, preferred_help=preferred_help, field_type=field_type)
-        logger.debug(f"wrapped field at {field_wrapper.dest} has a default value of {field_wrapper.default}")
+        logger.debug(f"wrapped field at {field_wrapper.dest} has a custom decoder")
         return field_wrapper
     elif utils.is_choice_type(field_type):
         from .choice_wrapper import ChoiceWrapper
@@ -203,6 +204,6 @@ def _wrap_field(
     else:
         # a normal attribute
         field_wrapper = FieldWrapper(field, parent=parent, preferred_help=preferred_help, field_type=field_type)
-        logger.debug(f"wrapped field at {field_wrapper.dest} has a default value of {field_wrapper.default}")
+        logger.debug(f"wrapped field at {field_wrapper.dest}")
         # self._children.append(field_wrapper)
         return field_wrapper
@@ -6,12 +6,13 @@
 import argparse
 import dataclasses
 import inspect
-from functools import cached_property
+from functools import cached_property, lru_cache
 from logging import getLogger
 from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 
 from .. import utils
 from . import docstring
+from .suppressing_argparse import Lazy
 from .wrapper import Wrapper
 
 logger = getLogger(__name__)
@@ -105,14 +106,9 @@ class FieldWrapper(Wrapper[dataclasses.Field]):
         _arg_options["required"] = False  # Required arguments can also be set from yaml,
         # so do not enforce with argparse
         _arg_options["dest"] = self.dest
-        _arg_options["default"] = self.default
-
-        if self.help:
-            _arg_options["help"] = self.help
-        elif self.default is not None:
-            # issue 64: Need to add an empty 'help' string, so that the formatter
-            # automatically adds the (default: '123')
-            _arg_options["help"] = " "
+        # the defaults and help texts are only needed for `--help`, so they are computed by the parser when it's shown
+        _arg_options["default"] = Lazy(lambda: self.default)
+        _arg_options["help"] = Lazy(self._help_text)
 
         tpe = self.type
         if self.is_union:
@@ -134,9 +130,6 @@ class FieldWrapper(Wrapper[dataclasses.Field]):
                 # For mixed literals, we need to handle type conversion in the action
                 _arg_options["type"] = str
                 _arg_options["choices"] = args  # Keep original values for choices
-
-            if not _arg_options.get("help"):
-                _arg_options["help"] = f"Must be one of: {', '.join(str(c) for c in args)}"
         else:
             _arg_options["type"] = tpe
             try:
@@ -147,6 +140,17 @@ class FieldWrapper(Wrapper[dataclasses.Field]):
 
         return _arg_options
 
+    def _help_text(self) -> Optional[str]:
+        if self.help:
+            return self.help
+        if self.default is not None:
+            # issue 64: Need to add an empty 'help' string, so that the formatter
+            # automatically adds the (default: '123')
+            return " "
+        if self.is_literal:
+            return f"Must be one of: {', '.join(str(c) for c in utils.get_type_arguments(self.type))}"
+        return None
+
     @property
     def action(self) -> Union[str, Type[argparse.Action]]:
         """The `action` argument to be passed to `add_argument(...)`."""
@@ -198,6 +202,12 @@ class FieldWrapper(Wrapper[dataclasses.Field]):
         option_strings = set(f"{dash}{option}" for dash, option in zip(dashes, options))
         return list(sorted(option_strings, key=len))
 
+    @property
+    def dest(self) -> str:
+        if self._dest is None:
+            self._dest = super().dest
+        return self._dest
+
     @property
     def nargs(self):
         return self.custom_arg_options.get("nargs", None)
@@ -368,16 +378,13 @@ def only_keep_action_args(options: Dict[str, Any], action: Union[str, Any]) -> D
         return options
 
     # Remove all the keys that aren't needed by the action constructor:
-    action_class = argparse_action_classes[action]
-    argspec = inspect.getfullargspec(action_class)
+    args_to_keep = _action_constructor_args(argparse_action_classes[action])
 
-    if argspec.varargs is not None or argspec.varkw is not None:
+    if args_to_keep is None:
         # if the constructor takes variable arguments, pass all the options.
         logger.debug("Constructor takes var args. returning all options.")
         return options
 
-    args_to_keep = [*argspec.args, "action"]
-
     kept_options, deleted_options = utils.keep_keys(options, args_to_keep)
     if deleted_options:
         logger.debug(
@@ -387,3 +394,12 @@ def only_keep_action_args(options: Dict[str, Any], action: Union[str, Any]) -> D
         logger.debug(f"Kept options: \t{kept_options.keys()}")
         logger.debug(f"Removed options: \t{deleted_options.keys()}")
     return kept_options
+
+
+@lru_cache(maxsize=None)
+def _action_constructor_args(action_class: Type[argparse.Action]) -> Optional[List[str]]:
+    """The arguments of the constructor of `action_class` (plus "action"), or None if it takes variable arguments."""
+    argspec = inspect.getfullargspec(action_class)
+    if argspec.varargs is not None or argspec.varkw is not None:
+        return None
+    return [*argspec.args, "action"]
@@ -0,0 +1,337 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+"""A table of the command-line options of a config class, and a tokenizer for the common command lines.
+
+Draccus parses every option value as a string and does all the real processing afterwards (see
+`ArgumentParser._postprocessing`), so for plain `--a.b.c value` / `--a.b.c=value` command lines argparse is only an
+expensive tokenizer. `OptionTable` records the options the wrappers register (it has the `add_argument` /
+`add_argument_group` interface of an argparse parser), and `OptionTable.tokenize` parses those command lines directly.
+Anything it doesn't handle exactly like argparse (help, abbreviations, errors, custom actions...) is left to argparse.
+
+A table only needs the options of the choices a command line selects, so it is built for a `ChoiceSelection`: the
+choice types register only the choice named on the command line (or in the config file), or their default choice. The
+choices a command line doesn't select are never wrapped, and plugins are only imported until the selected ones are
+found. A command line using options of other choices doesn't tokenize, and is left to argparse with the full tree.
+
+When the draccus cache is enabled (see `draccus.set_cache_dir`), the tables of a config class are also cached on disk,
+so later processes can skip building the wrapper tree (which imports plugins and resolves the type hints of every
+class). A cached table is reused while the sources of the modules that define the classes behind it are unchanged,
+no plugin module was added or removed, the choice registries have the same choices, and no new decoder is registered.
+"""
+
+import copy
+import hashlib
+import importlib
+import pkgutil
+import re
+import sys
+import sysconfig
+import typing
+from logging import getLogger
+from typing import Any, Dict, FrozenSet, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+from ..choice_types import CHOICE_TYPE_KEY, PluginRegistry
+from ..parsers import cache
+from ..parsers.decoding import decode
+from ..parsers.yaml_scalars import scalar_kind
+from ..utils import get_type_arguments, is_choice_type
+
+logger = getLogger(__name__)
+
+# argparse treats these as values rather than options (as long as no option looks like a negative number)
+_NEGATIVE_NUMBER = re.compile(r"^-\d+$|^-\d*\.\d+$")
+
+
+class Option:
+    """A single command-line option, as registered with `add_argument`."""
+
+    __slots__ = ("choices", "dest", "required", "simple", "type")
+
+    def __init__(self, option_string: str, kwargs: Dict[str, Any]):
+        self.dest: str = kwargs.get("dest") or option_string.lstrip("-").replace("-", "_")
+        self.type: Any = kwargs.get("type")
+        choices = kwargs.get("choices")
+        self.choices: Optional[FrozenSet[str]] = None if choices is None else frozenset(str(c) for c in choices)
+        self.required: bool = bool(kwargs.get("required", False))
+        # options taking exactly one value, which the tokenizer handles
+        self.simple: bool = kwargs.get("action", "store") == "store" and kwargs.get("nargs") is None
+
+
+class ChoiceSelection(Mapping[str, str]):
+    """The selected choices of a command line, by type option (e.g. `model.type`).
+
+    It records the type options the choice types looked up while registering their options, which tells the command
+    lines a table can be reused for.
+    """
+
+    def __init__(self, names: Dict[str, str]):
+        self.names = names
+        # type option -> the name it was looked up with (None if the default choice was used)
+        self.used: Dict[str, Optional[str]] = {}
+
+    def __getitem__(self, key: str) -> str:
+        name = self.names[key]
+        self.used[key] = name
+        return name
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self.used[key] = self.names.get(key)
+        return self.names.get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @staticmethod
+    def from_command_line(args: Sequence[str], file_args: Optional[Dict[str, Any]] = None) -> "ChoiceSelection":
+        """The choices selected by the `type` keys of a config file, overridden by the type options of `args`."""
+        names: Dict[str, str] = {}
+        if isinstance(file_args, dict):
+            _add_file_choices(names, file_args, "")
+        for i, arg in enumerate(args):
+            if not arg.startswith("--"):
+                continue
+            option, sep, value = arg[2:].partition("=")
+            if option != CHOICE_TYPE_KEY and not option.endswith(f".{CHOICE_TYPE_KEY}"):
+                continue
+            if sep:
+                names[option] = value
+            elif i + 1 < len(args):
+                names[option] = args[i + 1]
+        return ChoiceSelection(names)
+
+
+def _add_file_choices(names: Dict[str, str], file_args: Dict[str, Any], prefix: str) -> None:
+    for key, value in file_args.items():
+        if isinstance(value, dict):
+            _add_file_choices(names, value, f"{prefix}{key}.")
+        elif key == CHOICE_TYPE_KEY and isinstance(value, str):
+            names[f"{prefix}{key}"] = value
+
+
+class OptionTable:
+    """The command-line options of a parser, keyed by option string (the last registration of an option wins)."""
+
+    def __init__(self):
+        self.options: Dict[str, Option] = {}
+        # the choices the table was built for (see `ChoiceSelection.used`), or None if it has every choice
+        self.choices: Optional[Dict[str, Optional[str]]] = None
+        self._value_types: Optional[Dict[str, Any]] = None
+
+    def add_argument(self, *option_strings: str, **kwargs) -> None:
+        for option_string in option_strings:
+            self.options[option_string] = Option(option_string, kwargs)
+        self._value_types = None
+
+    def add_argument_group(self, *args, **kwargs) -> "OptionTable":
+        return self
+
+    @property
+    def value_types(self) -> Dict[str, Any]:
+        """The type of the field behind each destination, for the options that have one."""
+        if self._value_types is None:
+            self._value_types = {option.dest: option.type for option in self.options.values() if option.type}
+        return self._value_types
+
+    def selects(self, selection: ChoiceSelection) -> bool:
+        """Whether the table has the options of the choices selected by `selection`."""
+        return self.choices is not None and all(
+            selection.names.get(option) == name for option, name in self.choices.items()
+        )
+
+    def tokenize(self, args: Sequence[str]) -> Optional[Dict[str, str]]:
+        """The values of the options in `args` by destination, or None if argparse must parse them."""
+        values: Dict[str, str] = {}
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if not arg.startswith("--") or arg == "--":
+                return None
+            value: Optional[str] = None
+            if arg in self.options:
+                option = self.options[arg]
+            else:
+                option_string, sep, value = arg.partition("=")
+                if not sep or option_string not in self.options:
+                    return None
+                option = self.options[option_string]
+            if not option.simple:
+                return None
+            if value is None:
+                if i + 1 == len(args):
+                    return None
+                value = args[i + 1]
+                if value.startswith("-") and not _NEGATIVE_NUMBER.match(value) and " " not in value:
+                    return None
+                i += 1
+            if option.choices is not None and value not in option.choices:
+                return None
+            values[option.dest] = value
+            i += 1
+
+        for option in self.options.values():
+            if option.required and option.dest not in values:
+                return None
+        return values
+
+
+# bump this whenever the layout of a cached table changes
+_TABLE_FORMAT_VERSION = 3
+
+# maximum number of tables (one per selection of choices) cached on disk for a config class
+MAX_CACHED_TABLES = 32
+
+_STDLIB_DIR = sysconfig.get_paths()["stdlib"]
+
+
+def _class_file(cls: type) -> Optional[str]:
+    return getattr(sys.modules.get(cls.__module__), "__file__", None)
+
+
+def _cache_key(config_class: type) -> Optional[str]:
+    from draccus import __version__
+
+    module_file = _class_file(config_class)
+    if module_file is None or "<locals>" in config_class.__qualname__:
+        # classes that can't be told apart across processes
+        return None
+    ident = (
+        f"option-table:{_TABLE_FORMAT_VERSION}:{__version__}:{sys.version_info[:2]}:"
+        f"{module_file}:{config_class.__module__}:{config_class.__qualname__}"
+    )
+    return hashlib.sha256(ident.encode()).hexdigest()
+
+
+def _plugin_modules(discover_packages_path: str) -> List[str]:
+    # like `PluginRegistry._discover_packages`, but without importing the plugins
+    package = importlib.import_module(discover_packages_path, "draccus")
+    return sorted(name for _finder, name, _ispkg in pkgutil.iter_modules(package.__path__))
+
+
+def _decoder_names() -> Set[str]:
+    return {f"{getattr(t, '__module__', '')}.{getattr(t, '__qualname__', repr(t))}" for t in decode.registry}
+
+
+class _Sources:
+    """Everything a table depends on, gathered from the wrapper tree it was built from."""
+
+    def __init__(self):
+        self.files: Dict[str, None] = {}
+        self.plugin_packages: Dict[str, List[str]] = {}
+        # (module, qualname) of a choice type -> its choices
+        self.registries: Dict[Tuple[str, str], List[str]] = {}
+        self._seen: Set[Any] = set()
+
+    def add_wrapper(self, wrapper: Any, choices: Optional[Mapping[str, str]] = None) -> None:
+        from .choice_wrapper import ChoiceWrapper, UnionWrapper
+        from .dataclass_wrapper import DataclassWrapper
+        from .field_wrapper import FieldWrapper
+
+        if isinstance(wrapper, DataclassWrapper):
+            self.add_type(wrapper.dataclass)
+            children = wrapper._children
+        elif isinstance(wrapper, ChoiceWrapper):
+            self.add_type(wrapper.choice_type)
+            children = list((wrapper._children if choices is None else wrapper._selected_children(choices)).values())
+        elif isinstance(wrapper, UnionWrapper):
+            self.add_type(wrapper.union)
+            children = [child for child in wrapper._children if child is not None]
+        elif isinstance(wrapper, FieldWrapper):
+            self.add_type(wrapper.type)
+            children = []
+        else:
+            raise TypeError(f"Unexpected wrapper {wrapper}")
+        for child in children:
+            self.add_wrapper(child, choices)
+
+    def add_type(self, tpe: Any) -> None:
+        try:
+            if tpe in self._seen:
+                return
+            self._seen.add(tpe)
+        except TypeError:  # unhashable type annotation
+            pass
+        for arg in get_type_arguments(tpe) if typing.get_origin(tpe) is not None else ():
+            self.add_type(arg if isinstance(arg, type) or typing.get_origin(arg) is not None else type(arg))
+        if not isinstance(tpe, type):
+            return
+        for cls in tpe.__mro__:
+            file = _class_file(cls)
+            if file is not None and not file.startswith(_STDLIB_DIR):
+                self.files[file] = None
+        if is_choice_type(tpe):
+            if issubclass(tpe, PluginRegistry):
+                self.plugin_packages[tpe.discover_packages_path] = _plugin_modules(tpe.discover_packages_path)
+            else:
+                self.registries[(tpe.__module__, tpe.__qualname__)] = sorted(tpe.get_known_choices())
+
+
+def _still_valid(entry: Dict[str, Any]) -> bool:
+    for discover_packages_path, modules in entry["plugin_packages"].items():
+        if _plugin_modules(discover_packages_path) != modules:
+            return False
+    for (module, qualname), choices in entry["registries"].items():
+        cls: Any = importlib.import_module(module)
+        for name in qualname.split("."):
+            cls = getattr(cls, name)
+        if sorted(cls.get_known_choices()) != choices:
+            return False
+    return not (_decoder_names() - entry["decoders"])
+
+
+def _read_items(key: str) -> List[Dict[str, Any]]:
+    entry = cache.read_entry(key)
+    return entry if isinstance(entry, list) else []
+
+
+def read_cached_table(config_class: type, selection: ChoiceSelection) -> Optional[OptionTable]:
+    """Returns the option table of `config_class` for `selection` cached by `write_cached_table`, if still valid."""
+    key = _cache_key(config_class)
+    if key is None:
+        return None
+    for item in _read_items(key):
+        table = item["table"]
+        if not table.selects(selection):
+            continue
+        try:
+            if _still_valid(item):
+                return table
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug(f"Ignoring cached option table of {config_class}: {e}")
+        return None
+    return None
+
+
+def write_cached_table(config_class: type, table: OptionTable, wrapper: Any) -> None:
+    """Caches the option table of `config_class`, built from the wrapper tree `wrapper` for `table.choices`."""
+    key = _cache_key(config_class)
+    if key is None or cache.get_cache_dir() is None or table.choices is None:
+        return
+    sources = _Sources()
+    try:
+        sources.add_wrapper(wrapper, table.choices)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.debug(f"Not caching the option table of {config_class}: {e}")
+        return
+
+    # the classes behind the value types aren't stored, only builtins with the same scalar fast path
+    cached_table = OptionTable()
+    cached_table.choices = table.choices
+    for option_string, option in table.options.items():
+        option = copy.copy(option)
+        option.type = scalar_kind(option.type) if option.type else None
+        cached_table.options[option_string] = option
+    item = {
+        "table": cached_table,
+        "files": list(sources.files),
+        "plugin_packages": sources.plugin_packages,
+        "registries": sources.registries,
+        "decoders": _decoder_names(),
+    }
+    # the tables of the other selections are kept (the oldest ones first)
+    items = [other for other in _read_items(key) if other["table"].choices != table.choices]
+    items = [*items[-(MAX_CACHED_TABLES - 1) :], item]
+    cache.write_entry(key, items, [file for other in items for file in other["files"]])
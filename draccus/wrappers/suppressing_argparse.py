@@ -1,7 +1,40 @@
 # SPDX-License-Identifier: MIT
 # Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
 
-from argparse import ArgumentParser, _ArgumentGroup
+import copy
+from argparse import SUPPRESS, Action, ArgumentParser, _ArgumentGroup
+from typing import Any, Callable, Set
+
+
+class Lazy:
+    """A help text, description, title or default that is only computed when it's needed.
+
+    Help texts read the source of the config classes, which a normal run (without `--help`) never shows, so the
+    wrappers hand them to argparse as `Lazy` values, which the parser resolves before formatting the help.
+    """
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: Callable[[], Any]):
+        self.fn = fn
+
+    @staticmethod
+    def resolve(value: Any) -> Any:
+        return value.fn() if isinstance(value, Lazy) else value
+
+
+class StringChoices(list):
+    """The choices of an action as strings (the form of command-line values), with constant-time membership tests."""
+
+    def __init__(self, choices):
+        super().__init__(str(c) for c in choices)
+        self._choice_set = frozenset(self)
+
+    def __contains__(self, value) -> bool:
+        try:
+            return value in self._choice_set
+        except TypeError:  # unhashable
+            return False
 
 
 class SuppressingArgumentParser(ArgumentParser):
@@ -11,10 +44,15 @@ class SuppressingArgumentParser(ArgumentParser):
     Ideally we'd have a way to say "take the first one", but that doesn't exist and
     can't be easily retrofitted. So we take the last one, but keep the
     old ones for the help message by leaving them in _group_actions but not in _actions.
+
+    Choice types with many choices register the same options over and over, so removed actions are only collected
+    while arguments are added (conflicts are found through argparse's option string index), and dropped from
+    _actions in a single pass before parsing or formatting.
     """
 
     def __init__(self, *args, **kwargs):
         kwargs = {**kwargs, "conflict_handler": "ignore"}
+        self._removed_actions: Set[Action] = set()
         super().__init__(*args, **kwargs)
 
     def add_argument_group(self, *args, **kwargs):
@@ -27,11 +65,76 @@ class SuppressingArgumentParser(ArgumentParser):
         for _option_string, action in conflicting_actions:
             action.container._remove_action(action)
 
+    def _remove_action(self, action):
+        self._removed_actions.add(action)
+
+    def _prune_actions(self):
+        """Drops the actions removed by conflicts from _actions (which the argument groups share)."""
+        if self._removed_actions:
+            self._actions[:] = [action for action in self._actions if action not in self._removed_actions]
+            self._removed_actions.clear()
+
+    def _check_help(self, action):
+        # only called by python 3.14+, which formats help strings when adding arguments
+        if not isinstance(action.help, Lazy):
+            super()._check_help(action)
+
+    def resolve_defaults(self):
+        """Computes the lazy defaults of all arguments."""
+        self._prune_actions()
+        for action in self._actions:
+            action.default = Lazy.resolve(action.default)
+
+    def resolve_help(self):
+        """Computes the lazy help texts, group titles and group descriptions (including those of removed actions)."""
+        self.resolve_defaults()
+        for group in self._action_groups:
+            group.title = Lazy.resolve(group.title)
+            group.description = Lazy.resolve(group.description)
+            for action in group._group_actions:
+                action.default = Lazy.resolve(action.default)
+                action.help = Lazy.resolve(action.help)
+
+    def run_mode_copy(self) -> "SuppressingArgumentParser":
+        """A copy of this parser for normal runs: values are kept as strings and defaults aren't set.
+
+        (draccus decodes the values itself, and takes the defaults from the config class.) The actions are copied, so
+        parsing with the copy doesn't change what this parser shows in its help.
+        """
+        self._prune_actions()
+        parser = copy.copy(self)
+        parser._removed_actions = set()
+        parser._actions = []
+        parser._option_string_actions = {}
+        for action in self._actions:
+            action = copy.copy(action)
+            action.default = SUPPRESS
+            action.type = str
+            if action.choices:
+                action.choices = StringChoices(action.choices)
+            parser._actions.append(action)
+            for option_string in action.option_strings:
+                parser._option_string_actions[option_string] = action
+        return parser
+
+    def parse_known_args(self, args=None, namespace=None):
+        self.resolve_defaults()
+        return super().parse_known_args(args, namespace)
+
+    def format_usage(self):
+        self._prune_actions()
+        return super().format_usage()
+
+    def format_help(self):
+        self.resolve_help()
+        return super().format_help()
+
 
 class _SuppressingArgumentGroup(_ArgumentGroup):
     def __init__(self, container, *args, **kwargs):
         kwargs = {**kwargs, "conflict_handler": "ignore"}
         super().__init__(container, *args, **kwargs)
+        self._parser: SuppressingArgumentParser = container
 
     def add_argument(self, *args, **kwargs):
         return super().add_argument(*args, **kwargs)
@@ -42,8 +145,12 @@ class _SuppressingArgumentGroup(_ArgumentGroup):
     def add_mutually_exclusive_group(self, *args, **kwargs):
         raise NotImplementedError("It's a bad idea to nest argument groups. argparse ignores them for help")
 
+    def _check_help(self, action):
+        if not isinstance(action.help, Lazy):
+            super()._check_help(action)
+
     def _remove_action(self, action):
-        self._actions.remove(action)
+        self._parser._remove_action(action)
         # don't remove from _group_actions, so that we can still show the old ones in the help message
 
     def _handle_conflict_ignore(self, action, conflicting_actions):
@@ -7,7 +7,7 @@
 import argparse
 from abc import ABC, abstractmethod
 from dataclasses import Field
-from typing import Generic, List, Optional, Type
+from typing import Generic, List, Mapping, Optional, Type
 
 from draccus.utils import T
 
@@ -81,5 +81,10 @@ class AggregateWrapper(Wrapper[T]):
     """Wrapper for types that have fields (i.e. Dataclasses and Choices)."""
 
     @abstractmethod
-    def register_actions(self, parser: argparse.ArgumentParser) -> None:
+    def register_actions(self, parser: argparse.ArgumentParser, choices: Optional[Mapping[str, str]] = None) -> None:
+        """Adds the arguments of the wrapped type to `parser`.
+
+        `choices` maps the type option of each choice type (e.g. `model.type`) to the selected choice. If given, only
+        the selected (or default) choice of each choice type is registered, instead of every known choice.
+        """
         pass
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import pytest
+
+import draccus
+from draccus.parsers import resolvers
+from draccus.parsers.resolvers import IncludeResolver
+
+
+@dataclass
+class Leaf:
+    x: int = 0
+
+
+@dataclass
+class Config:
+    name: str = ""
+    leaf: Leaf = field(default_factory=Leaf)
+    tags: List[str] = field(default_factory=list)
+
+
+class BarrierResolver(IncludeResolver):
+    """Serves files from memory, and only once `parties` reads are in flight at the same time."""
+
+    def __init__(self, files: Dict[str, str], parties: int):
+        self.files = files
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def can_resolve(self, location: str) -> bool:
+        return location.startswith("slow://")
+
+    def read_text(self, location: str) -> str:
+        self.barrier.wait()
+        return self.files[location]
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    (tmp_path / "leaf.yaml").write_text("x: 5\n")
+    (tmp_path / "a.yaml").write_text("name: a\nleaf: !include leaf.yaml\n")
+    (tmp_path / "b.json").write_text('{"name": "b", "tags": ["x"]}')
+    (tmp_path / "c.toml").write_text('name = "c"\n[leaf]\nx = 2\n')
+    return tmp_path
+
+
+def test_aload(config_dir):
+    cfg = asyncio.run(draccus.aload(Config, config_dir / "a.yaml"))
+    assert cfg == Config("a", Leaf(5))
+
+
+def test_aload_many(config_dir):
+    paths = [config_dir / "a.yaml", config_dir / "b.json", config_dir / "c.toml"] * 3
+    cfgs = asyncio.run(draccus.aload_many(Config, paths, max_concurrency=2))
+    assert cfgs == [Config("a", Leaf(5)), Config("b", tags=["x"]), Config("c", Leaf(2))] * 3
+
+
+def test_executors(config_dir, monkeypatch):
+    io_executor = ThreadPoolExecutor(2, thread_name_prefix="io")
+    cpu_executor = ThreadPoolExecutor(1, thread_name_prefix="cpu")
+    reads, decodes = [], []
+
+    original_read = resolvers.read_text
+
+    def recording_read(location):
+        reads.append(threading.current_thread().name)
+        return original_read(location)
+
+    @dataclass
+    class Recording:
+        name: str = ""
+        leaf: Leaf = field(default_factory=Leaf)
+
+        def __post_init__(self):
+            decodes.append(threading.current_thread().name)
+
+    monkeypatch.setattr(resolvers, "read_text", recording_read)
+    try:
+        cfg = asyncio.run(
+            draccus.aload(Recording, config_dir / "a.yaml", executor=cpu_executor, io_executor=io_executor)
+        )
+    finally:
+        io_executor.shutdown()
+        cpu_executor.shutdown()
+
+    assert cfg.leaf == Leaf(5)
+    assert reads and all(name.startswith("io") for name in reads)
+    assert decodes and all(name.startswith("cpu") for name in decodes)
+
+
+def test_reads_are_concurrent():
+    num_files = 4
+    resolver = draccus.register_include_resolver(
+        BarrierResolver({f"slow://{i}.yaml": f"name: n{i}\n" for i in range(num_files)}, parties=num_files)
+    )
+    try:
+        with ThreadPoolExecutor(num_files) as io_executor:
+            paths = [f"slow://{i}.yaml" for i in range(num_files)]
+            cfgs = asyncio.run(draccus.aload_many(Config, paths, io_executor=io_executor))
+    finally:
+        resolvers.unregister_include_resolver(resolver)
+    assert [cfg.name for cfg in cfgs] == [f"n{i}" for i in range(num_files)]
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(draccus.aload(Config, tmp_path / "missing.yaml"))
+
+
+def test_adump(tmp_path):
+    cfg = Config("d", Leaf(1), ["t"])
+    assert asyncio.run(draccus.adump(cfg)) == draccus.dump(cfg)
+
+    path = tmp_path / "out.json"
+    assert asyncio.run(draccus.adump(cfg, path, omit_defaults=True)) is None
+    assert path.read_text() == '{"name": "d", "leaf": {"x": 1}, "tags": ["t"]}'
+    assert asyncio.run(draccus.aload(Config, path)) == cfg
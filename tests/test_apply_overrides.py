@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import dataclasses
+from pathlib import Path
+from typing import Dict, Generic, List, Optional, TypeVar
+
+import pytest
+
+import draccus
+from draccus.choice_types import ChoiceRegistry
+from draccus.utils import DecodingError
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass(frozen=True)
+class OptimizerConfig(ChoiceRegistry):
+    lr: float = 1e-3
+
+
+@OptimizerConfig.register_subclass("adam")
+@dataclasses.dataclass(frozen=True)
+class AdamConfig(OptimizerConfig):
+    beta1: float = 0.9
+
+
+@OptimizerConfig.register_subclass("sgd")
+@dataclasses.dataclass(frozen=True)
+class SGDConfig(OptimizerConfig):
+    momentum: float = 0.0
+
+
+@dataclasses.dataclass(frozen=True)
+class DataConfig:
+    path: Path = Path("data")
+    weights: Dict[str, float] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(frozen=True)
+class ModelConfig:
+    layers: List[int] = dataclasses.field(default_factory=lambda: [1, 2])
+    hidden: int = 16
+
+
+@dataclasses.dataclass(frozen=True)
+class Holder(Generic[T]):
+    value: Optional[T] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class RunConfig:
+    name: str = "run"
+    optimizer: OptimizerConfig = dataclasses.field(default_factory=AdamConfig)
+    data: DataConfig = dataclasses.field(default_factory=DataConfig)
+    model: ModelConfig = dataclasses.field(default_factory=ModelConfig)
+    eval_data: Optional[DataConfig] = None
+    steps: Holder[int] = dataclasses.field(default_factory=Holder)
+    num_params: int = dataclasses.field(default=0, init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "num_params", self.model.hidden * sum(self.model.layers))
+
+
+def test_apply_overrides():
+    base = RunConfig(data=DataConfig(weights={"a": 1.0, "b": 2.0}))
+    cfg = draccus.apply_overrides(
+        base, {"optimizer.lr": "1e-4", "data.path": "/tmp/d", "data.weights.b": 3, "model.hidden": 32}
+    )
+    assert cfg == RunConfig(
+        optimizer=AdamConfig(lr=1e-4),
+        data=DataConfig(Path("/tmp/d"), {"a": 1.0, "b": 3.0}),
+        model=ModelConfig(hidden=32),
+    )
+    # the original is untouched
+    assert base == RunConfig(data=DataConfig(weights={"a": 1.0, "b": 2.0}))
+    # __post_init__ ran on the rebuilt nodes
+    assert cfg.num_params == 96
+
+
+def test_structural_sharing():
+    base = RunConfig()
+    cfg = draccus.apply_overrides(base, {"optimizer.lr": 0.5})
+    assert cfg.optimizer is not base.optimizer
+    assert cfg.data is base.data
+    assert cfg.model is base.model
+    assert cfg.model.layers is base.model.layers
+
+
+def test_matches_full_decode():
+    base = RunConfig(optimizer=SGDConfig(momentum=0.5))
+    overrides = {"optimizer.lr": 0.1, "model": {"layers": [3]}, "model.hidden": 8, "eval_data.path": "eval"}
+    encoded = draccus.encode(base)
+    del encoded["num_params"]  # computed in __post_init__
+    expected = draccus.load_layers(RunConfig, [encoded], overrides=overrides)
+    assert draccus.apply_overrides(base, overrides) == expected
+    assert expected.eval_data == DataConfig(Path("eval"))
+
+
+def test_choice_type():
+    base = RunConfig(optimizer=AdamConfig(lr=0.1, beta1=0.5))
+    assert draccus.apply_overrides(base, {"optimizer.type": "adam", "optimizer.beta1": 0.7}).optimizer == AdamConfig(
+        lr=0.1, beta1=0.7
+    )
+    assert draccus.apply_overrides(base, {"optimizer.type": "sgd", "optimizer.momentum": 0.9}).optimizer == SGDConfig(
+        momentum=0.9
+    )
+
+
+def test_generic_dataclass():
+    cfg = draccus.apply_overrides(RunConfig(), {"steps.value": "12"})
+    assert cfg.steps == Holder(12)
+
+
+def test_errors():
+    with pytest.raises(DecodingError, match=r"optimizer.*`momentum`"):
+        draccus.apply_overrides(RunConfig(), {"optimizer.momentum": 0.1})
+    with pytest.raises(DecodingError, match=r"model\.hidden"):
+        draccus.apply_overrides(RunConfig(), {"model.hidden": "many"})
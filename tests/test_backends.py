@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import io
+import math
+from dataclasses import dataclass, field
+from typing import ClassVar, List
+
+import pytest
+
+import draccus
+from draccus import Backend, Capability, ConfigType
+from draccus.parsers import backends
+from draccus.parsers.config_parsers import JSONParser, OrjsonParser
+
+from .testutils import TestSetup
+
+HAS_ORJSON = backends._is_importable("orjson")
+
+
+@dataclass
+class Config(TestSetup):
+    steps: int = 0
+    lr: float = 0.1
+    names: List[str] = field(default_factory=list)
+
+
+class RecordingParser(JSONParser):
+    calls: ClassVar[List[str]] = []
+
+    @staticmethod
+    def load_config(stream):
+        RecordingParser.calls.append("load")
+        return JSONParser.load_config(stream)
+
+
+@pytest.fixture
+def recording_backend():
+    RecordingParser.calls = []
+    backend = draccus.register_backend("json", Backend("recording", RecordingParser, Capability.LOAD, priority=100))
+    yield backend
+    backends.unregister_backend("json", "recording")
+
+
+@pytest.fixture
+def json_config_type():
+    with draccus.config_type("json"):
+        yield
+
+
+def test_builtin_backends():
+    assert [b.name for b in backends.list_backends(ConfigType.JSON)] == ["orjson", "json"]
+    assert backends.get_parser(ConfigType.YAML, Capability.LOAD) is ConfigType.YAML.value
+    assert backends.get_parser(ConfigType.JSON, Capability.DUMP) is JSONParser
+
+
+@pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")
+def test_orjson_is_preferred_for_reading(json_config_type, tmp_path):
+    assert backends.get_parser(ConfigType.JSON, Capability.LOAD) is OrjsonParser
+    assert backends.get_parser(ConfigType.JSON, Capability.PARSE_STRING) is OrjsonParser
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"steps": 3, "lr": 1e-3, "names": ["a"]}')
+    assert draccus.load(Config, config_path) == Config(3, 1e-3, ["a"])
+    assert Config.setup('--steps 4 --names \'["b","c"]\'') == Config(4, 0.1, ["b", "c"])
+
+
+@pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")
+def test_orjson_matches_json_on_rejected_inputs():
+    text = '{"big": 123456789012345678901234567890, "nan": NaN}'
+    result = OrjsonParser.load_config(io.StringIO(text))
+    assert result["big"] == 123456789012345678901234567890
+    assert math.isnan(result["nan"])
+    assert OrjsonParser.parse_string("Infinity") == math.inf
+    assert OrjsonParser.parse_string("not json") == "not json"
+
+
+def test_dump_output_is_unchanged(json_config_type):
+    cfg = Config(1, 0.5, ["x"])
+    assert draccus.dump(cfg) == '{"steps": 1, "lr": 0.5, "names": ["x"]}'
+    assert draccus.dump(cfg, indent=1).startswith('{\n "steps"')
+
+
+def test_orjson_parser_dumps_like_json(json_config_type):
+    cfg = Config(1, 0.5, ["x"])
+    expected = draccus.dump(cfg, indent=2)
+    draccus.register_backend("json", Backend("orjson-all", OrjsonParser, priority=100))
+    try:
+        assert backends.get_parser("json", Capability.DUMP | Capability.DUMP_KWARGS) is OrjsonParser
+        assert draccus.dump(cfg, indent=2) == expected
+        stream = io.StringIO()
+        draccus.dump(cfg, stream)
+        assert stream.getvalue() == '{"steps": 1, "lr": 0.5, "names": ["x"]}'
+    finally:
+        backends.unregister_backend("json", "orjson-all")
+
+
+def test_highest_priority_backend_with_capability(recording_backend, json_config_type):
+    assert draccus.load(Config, io.StringIO('{"steps": 2}')) == Config(2)
+    assert RecordingParser.calls == ["load"]
+    # the backend can't dump, so dumping falls back
+    assert backends.get_parser("json", Capability.DUMP) is JSONParser
+
+
+def test_set_backend(recording_backend, json_config_type):
+    draccus.set_backend("json", "json")
+    try:
+        assert backends.get_parser("json", Capability.LOAD) is JSONParser
+        draccus.load(Config, io.StringIO('{"steps": 2}'))
+        assert RecordingParser.calls == []
+    finally:
+        draccus.set_backend("json", None)
+    assert backends.get_parser("json", Capability.LOAD) is RecordingParser
+
+
+def test_set_unknown_backend():
+    with pytest.raises(ValueError, match="No backend named"):
+        draccus.set_backend("json", "missing")
+
+
+def test_unavailable_backend_is_skipped():
+    draccus.register_backend("json", Backend("missing", RecordingParser, priority=100, requires=("no_such_module",)))
+    try:
+        draccus.set_backend("json", "missing")
+        assert backends.get_parser("json", Capability.LOAD) is not RecordingParser
+    finally:
+        backends.unregister_backend("json", "missing")
@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import dataclasses
+import os
+import pickle
+import zipfile
+from typing import List
+
+import pytest
+
+import draccus
+from draccus.parsers import bundles, resolvers, yaml_loader
+
+from .testutils import TestSetup
+
+
+@dataclasses.dataclass
+class DataConfig:
+    path: str = ""
+    shards: List[int] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class ModelConfig:
+    layers: int = 1
+    hidden: int = 8
+
+
+@dataclasses.dataclass
+class ExperimentConfig(TestSetup):
+    name: str = ""
+    data: DataConfig = dataclasses.field(default_factory=DataConfig)
+    model: ModelConfig = dataclasses.field(default_factory=ModelConfig)
+
+
+EXPECTED = ExperimentConfig("exp", DataConfig("/data", [1, 2]), ModelConfig(4, 64))
+
+
+@pytest.fixture
+def config_tree(tmp_path):
+    (tmp_path / "common").mkdir()
+    (tmp_path / "experiments").mkdir()
+    (tmp_path / "common" / "data.yaml").write_text("path: /data\nshards: !include shards.yaml\n")
+    (tmp_path / "common" / "shards.yaml").write_text("[1, 2]\n")
+    (tmp_path / "common" / "model.yaml").write_text("layers: 4\nhidden: 32\n")
+    (tmp_path / "experiments" / "exp.yaml").write_text(
+        "name: exp\ndata: !include ../common/data.yaml\nmodel:\n  <<: !include ../common/model.yaml\n  hidden: 64\n"
+    )
+    yield tmp_path
+    resolvers.get_include_resolver("a.zip::b").clear()
+
+
+def test_bundle(config_tree):
+    location = draccus.bundle(config_tree / "experiments" / "exp.yaml")
+    archive, member = location.split("::")
+    assert archive == str(config_tree / "experiments" / "exp.zip")
+    assert member == "experiments/exp.yaml"
+    with zipfile.ZipFile(archive) as zf:
+        assert sorted(zf.namelist()) == [
+            "common/data.yaml",
+            "common/model.yaml",
+            "common/shards.yaml",
+            "experiments/exp.yaml",
+        ]
+
+    # the bundle is self-contained
+    for path in config_tree.rglob("*.yaml"):
+        os.remove(path)
+    assert draccus.load(ExperimentConfig, location) == EXPECTED
+    assert ExperimentConfig.setup(f"--config_path {location} --model.layers 2").model == ModelConfig(2, 64)
+
+
+def test_bundle_is_reproducible(config_tree):
+    first = draccus.bundle(config_tree / "experiments" / "exp.yaml", config_tree / "a.zip")
+    second = draccus.bundle(config_tree / "experiments" / "exp.yaml", config_tree / "b.zip")
+    assert first.split("::")[1] == second.split("::")[1]
+    assert (config_tree / "a.zip").read_bytes() == (config_tree / "b.zip").read_bytes()
+
+
+@pytest.fixture
+def trusted():
+    draccus.trust_parsed_bundles()
+    yield
+    draccus.trust_parsed_bundles(False)
+
+
+def test_parsed_bundle(config_tree, monkeypatch, trusted):
+    location = draccus.bundle(config_tree / "experiments" / "exp.yaml", config_tree / "exp.zip", parsed=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the bundle shouldn't be parsed")
+
+    monkeypatch.setattr(yaml_loader, "load_yaml", fail)
+    assert draccus.load(ExperimentConfig, location) == EXPECTED
+
+
+class _Exploit:
+    def __reduce__(self):
+        return (os.system, ("touch pwned",))
+
+
+def test_parsed_forms_are_not_unpickled_by_default(config_tree, monkeypatch):
+    monkeypatch.chdir(config_tree)
+    location = draccus.bundle(config_tree / "experiments" / "exp.yaml", config_tree / "exp.zip")
+    with zipfile.ZipFile(config_tree / "exp.zip", "a") as zf:
+        entry = {"version": bundles._BUNDLE_FORMAT_VERSION, "format": "yaml", "value": _Exploit()}
+        zf.writestr(f"{bundles.PARSED_DIR}/experiments/exp.yaml.pickle", pickle.dumps(entry))
+
+    # parsed from the config files instead
+    assert draccus.load(ExperimentConfig, location) == EXPECTED
+    assert ExperimentConfig.setup(f"--config_path {location}") == EXPECTED
+    assert not (config_tree / "pwned").exists()
+
+
+def test_bundle_json(tmp_path, trusted):
+    (tmp_path / "exp.json").write_text('{"name": "exp", "model": {"layers": 3}}')
+    location = draccus.bundle(tmp_path / "exp.json", parsed=True)
+    assert draccus.load(ExperimentConfig, location) == ExperimentConfig("exp", model=ModelConfig(3))
+
+
+def test_bundle_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        draccus.bundle(tmp_path / "missing.yaml")
+    (tmp_path / "exp.yaml").write_text("name: exp\n")
+    with pytest.raises(ValueError):
+        draccus.bundle(tmp_path / "exp.yaml", tmp_path / "exp.tar")
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+from dataclasses import dataclass, field
+
+import pytest
+
+import draccus
+from draccus.parsers import cache
+from draccus.parsers.config_parsers import YAMLParser
+
+
+@dataclass
+class Inner:
+    x: int = 0
+    y: str = ""
+
+
+@dataclass
+class Outer:
+    inner: Inner = field(default_factory=Inner)
+    z: float = 0.0
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    cache.set_cache_dir(tmp_path / "cache")
+    yield tmp_path / "cache"
+    cache.set_cache_dir(None)
+
+
+@pytest.fixture
+def count_yaml_loads(monkeypatch):
+    calls = []
+    original = YAMLParser.load_config
+
+    def counting_load_config(stream):
+        calls.append(stream)
+        return original(stream)
+
+    monkeypatch.setattr(YAMLParser, "load_config", staticmethod(counting_load_config))
+    return calls
+
+
+def test_cache_disabled_by_default(monkeypatch):
+    monkeypatch.delenv(cache.CACHE_DIR_ENV, raising=False)
+    assert cache.get_cache_dir() is None
+
+
+def test_cache_dir_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv(cache.CACHE_DIR_ENV, str(tmp_path))
+    assert cache.get_cache_dir() == tmp_path
+
+
+def test_second_load_skips_parsing(tmp_path, cache_dir, count_yaml_loads):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("inner:\n  x: 1\n  y: hello\nz: 2.5\n")
+
+    first = draccus.load(Outer, config_path)
+    second = draccus.load(Outer, config_path)
+
+    assert first == second == Outer(Inner(1, "hello"), 2.5)
+    assert len(count_yaml_loads) == 1
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+
+def test_changed_file_is_reparsed(tmp_path, cache_dir, count_yaml_loads):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("z: 1.0\n")
+    assert draccus.load(Outer, config_path).z == 1.0
+
+    config_path.write_text("z: 2.0\n")
+    assert draccus.load(Outer, config_path).z == 2.0
+    assert len(count_yaml_loads) == 2
+
+
+def test_changed_include_is_reparsed(tmp_path, cache_dir, count_yaml_loads):
+    (tmp_path / "inner.yaml").write_text("x: 1\n")
+    (tmp_path / "nested.yaml").write_text("inner: !include inner.yaml\n")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("<<: !include nested.yaml\nz: 3.0\n")
+
+    assert draccus.load(Outer, config_path).inner.x == 1
+    assert draccus.load(Outer, config_path).inner.x == 1
+    assert len(count_yaml_loads) == 1
+
+    # a change two includes deep must still invalidate the entry
+    (tmp_path / "inner.yaml").write_text("x: 2\n")
+    assert draccus.load(Outer, config_path).inner.x == 2
+    assert len(count_yaml_loads) == 2
+
+
+def test_corrupt_entry_is_ignored(tmp_path, cache_dir):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("z: 1.0\n")
+    draccus.load(Outer, config_path)
+
+    for entry in cache_dir.glob("*.pickle"):
+        entry.write_bytes(b"not a pickle")
+
+    assert draccus.load(Outer, config_path).z == 1.0
+
+
+def test_cli_config_path_uses_cache(tmp_path, cache_dir, count_yaml_loads):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("inner:\n  x: 4\n")
+
+    for _ in range(3):
+        cfg = draccus.parse(Outer, config_path=str(config_path), args=["--inner.y", "cli"])
+        assert cfg == Outer(Inner(4, "cli"), 0.0)
+
+    assert len(count_yaml_loads) == 1
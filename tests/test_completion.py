@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import dataclasses
+import enum
+import shutil
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, Optional
+
+import pytest
+
+import draccus
+from draccus.choice_types import ChoiceRegistry
+
+
+class Color(enum.Enum):
+    red = 1
+    blue = 2
+
+
+@dataclass
+class ModelConfig(ChoiceRegistry):
+    layers: int = 2
+
+
+@ModelConfig.register_subclass("mlp")
+@dataclass
+class MLPConfig(ModelConfig):
+    activation: Literal["relu", "gelu"] = "relu"
+
+
+@ModelConfig.register_subclass("conv")
+@dataclass
+class ConvConfig(ModelConfig):
+    kernel: int = 3
+
+
+@dataclass
+class TrainConfig:
+    lr: float = 0.1
+    output: Optional[Path] = None
+    color: Color = Color.red
+    fast: bool = False
+    model: ModelConfig = dataclasses.field(default_factory=MLPConfig)
+
+
+def _complete_bash(script: str, words) -> list:
+    command = f'{script}\nCOMP_WORDS=({" ".join(repr(w) for w in words)}); COMP_CWORD={len(words) - 1}\n'
+    command += '_draccus_train; printf "%s\\n" "${COMPREPLY[@]}"'
+    output = subprocess.run(["bash", "-c", command], capture_output=True, text=True, check=True).stdout
+    return output.split()
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="requires bash")
+def test_bash_completion():
+    script = draccus.completion_script(TrainConfig, "bash", prog="train")
+    assert _complete_bash(script, ["train", "--model.k"]) == ["--model.kernel"]
+    assert _complete_bash(script, ["train", "--model.type", ""]) == ["conv", "mlp"]
+    assert _complete_bash(script, ["train", "--model.activation", "="]) == ["gelu", "relu"]
+    assert _complete_bash(script, ["train", "--color", "=", "b"]) == ["blue"]
+    assert _complete_bash(script, ["train", "--fast", "t"]) == ["true"]
+    assert _complete_bash(script, ["train", "--lr", ""]) == []
+
+
+def test_zsh_and_fish_completion():
+    zsh = draccus.completion_script(TrainConfig, "zsh", prog="train")
+    assert zsh.startswith("#compdef train\n")
+    assert "'--model.type=:model.type:(conv mlp)'" in zsh
+    assert "--config_path=:config_path:_files" in zsh
+    assert "--output=:output:_files" in zsh
+    assert "--model=:model:_files" in zsh
+
+    fish = draccus.completion_script(TrainConfig, "fish", prog="train")
+    assert "complete -c train -l model.type -x -a 'conv mlp'" in fish
+    assert "complete -c train -l color -x -a 'red blue'" in fish
+    assert "complete -c train -l config_path -r -F" in fish
+    assert "complete -c train -l model.kernel -x" in fish
+
+    with pytest.raises(ValueError, match="Unsupported shell"):
+        draccus.completion_script(TrainConfig, "powershell")
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import bz2
+import gzip
+import lzma
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import pytest
+
+import draccus
+from draccus import cfgparsing
+
+from .testutils import TestSetup
+
+
+@dataclass
+class Layer:
+    units: int = 8
+    activation: str = "relu"
+
+
+@dataclass
+class Config(TestSetup):
+    name: str = "run"
+    layers: List[Layer] = field(default_factory=list)
+    tags: Dict[str, str] = field(default_factory=dict)
+
+
+CONFIG = Config("big", [Layer(i) for i in range(200)], {"a": "b"})
+
+
+@pytest.mark.parametrize(
+    "filename", ["config.yaml.gz", "config.yml.bz2", "config.json.gz", "config.json.xz", "config.toml.gz"]
+)
+def test_round_trip(tmp_path, filename):
+    path = tmp_path / filename
+    draccus.dump(CONFIG, path)
+    assert draccus.load(Config, path) == CONFIG
+    assert draccus.load(Config, str(path)) == CONFIG
+
+
+@pytest.mark.parametrize("suffix, codec", [(".gz", gzip), (".bz2", bz2), (".xz", lzma)])
+def test_files_are_compressed(tmp_path, suffix, codec):
+    draccus.dump(CONFIG, tmp_path / "config.json")
+    draccus.dump(CONFIG, tmp_path / f"config.json{suffix}")
+    plain = (tmp_path / "config.json").read_bytes()
+    compressed = (tmp_path / f"config.json{suffix}").read_bytes()
+    assert codec.decompress(compressed) == plain
+    assert len(compressed) * 10 < len(plain)
+
+
+def test_format_detection():
+    assert cfgparsing._config_type_for_file("a/config.yaml.gz") == "yaml"
+    assert cfgparsing._config_type_for_file("config.JSON.XZ") is None
+    assert cfgparsing._config_type_for_file("config.json.bz2") == "json"
+    assert cfgparsing._config_type_for_file("config.gz") is None
+
+
+def test_compressed_include(tmp_path):
+    with gzip.open(tmp_path / "layer.yaml.gz", "wt") as f:
+        f.write("units: 32\n")
+    (tmp_path / "config.yaml").write_text("layers:\n  - !include layer.yaml.gz\n  - units: 4\n")
+    assert draccus.load(Config, tmp_path / "config.yaml").layers == [Layer(32), Layer(4)]
+
+
+def test_relative_include_from_compressed_file(tmp_path):
+    os.mkdir(tmp_path / "configs")
+    (tmp_path / "configs" / "layer.yaml").write_text("units: 16\n")
+    with lzma.open(tmp_path / "configs" / "config.yaml.xz", "wt") as f:
+        f.write("layers: [!include layer.yaml]\n")
+    assert draccus.load(Config, tmp_path / "configs" / "config.yaml.xz").layers == [Layer(16)]
+
+
+def test_cli_config_path(tmp_path):
+    path = tmp_path / "config.yaml.bz2"
+    draccus.dump(Config("from_file"), path)
+    assert Config.setup(f"--config_path {path}") == Config("from_file")
@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import asyncio
+import io
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+import draccus
+from draccus import ConfigType
+
+
+@dataclass
+class Config:
+    name: str = ""
+    steps: int = 0
+    layers: List[int] = field(default_factory=list)
+
+
+EXPECTED = Config("run", 3, [1, 2])
+TEXTS = {
+    "yaml": "name: run\nsteps: 3\nlayers: [1, 2]\n",
+    "json": '{"name": "run", "steps": 3, "layers": [1, 2]}',
+    "toml": 'name = "run"\nsteps = 3\nlayers = [1, 2]\n',
+}
+
+
+def test_context_overrides_global_default():
+    assert draccus.get_config_type() is ConfigType.YAML
+    with draccus.config_type("json"):
+        assert draccus.get_config_type() is ConfigType.JSON
+        draccus.set_config_type("toml")
+        assert draccus.get_config_type() is ConfigType.TOML
+    assert draccus.get_config_type() is ConfigType.YAML
+
+
+def test_context_is_not_shared_with_other_threads():
+    seen = []
+    with draccus.config_type("toml"):
+        thread = threading.Thread(target=lambda: seen.append(draccus.get_config_type()))
+        thread.start()
+        thread.join()
+    assert seen == [ConfigType.YAML]
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    # switch threads as often as possible, so that races are likely to show up
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_concurrent_loads_of_different_formats(tmp_path, frequent_thread_switches):
+    for fmt, text in TEXTS.items():
+        (tmp_path / f"config.{fmt}").write_text(text)
+
+    num_threads = 12
+    iterations = 50
+    barrier = threading.Barrier(num_threads, timeout=10)
+    errors = []
+
+    def worker(i):
+        fmt = list(TEXTS)[i % len(TEXTS)]
+        try:
+            barrier.wait()
+            for _ in range(iterations):
+                # loading a file picks the format from its extension
+                assert draccus.load(Config, tmp_path / f"config.{fmt}") == EXPECTED
+                # a stream uses the format of the current context
+                with draccus.config_type(fmt):
+                    assert draccus.load(Config, io.StringIO(TEXTS[fmt])) == EXPECTED
+        except Exception as e:  # pylint: disable=broad-except
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert draccus.get_config_type() is ConfigType.YAML
+
+
+def test_concurrent_asyncio_tasks():
+    async def load(fmt):
+        with draccus.config_type(fmt):
+            await asyncio.sleep(0)
+            return draccus.load(Config, io.StringIO(TEXTS[fmt]))
+
+    async def main():
+        return await asyncio.gather(*(load(fmt) for fmt in list(TEXTS) * 10))
+
+    assert asyncio.run(main()) == [EXPECTED] * 30
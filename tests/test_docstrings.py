@@ -99,3 +99,29 @@ def test_docstring_works_with_field_function():
     assert docstring.comment_above == "A sequence of tasks."
     assert docstring.comment_inline == "side"
     assert docstring.docstring_below == "Below"
+
+
+def test_help_is_only_read_for_help(monkeypatch):
+    import inspect
+
+    from draccus.wrappers import docstring
+
+    @dataclass
+    class Lazy(TestSetup):
+        """Class docstring of Lazy."""
+
+        base: Base = field(default_factory=lambda: Base(a=1))
+        n: int = 3  # inline comment on 'n'
+
+    def getsource(obj):
+        raise AssertionError(f"read the source of {obj} without --help")
+
+    docstring._get_class_source.cache_clear()
+    with monkeypatch.context() as m:
+        m.setattr(inspect, "getsource", getsource)
+        assert Lazy.setup("--n 4 --base.a 2") == Lazy(base=Base(a=2), n=4)
+
+    help_text = Lazy.get_help_text()
+    assert "inline comment on 'n'" in help_text
+    assert "TODO: finetune this" in help_text
+    assert "(default: 3)" in help_text
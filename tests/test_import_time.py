@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import draccus
+
+# wall-clock budgets are flaky on loaded machines, so the import time is only checked against a budget (in
+# microseconds) given in this variable, e.g. `DRACCUS_IMPORT_BUDGET_US=25000` (`import draccus` takes a few ms)
+IMPORT_BUDGET_VAR = "DRACCUS_IMPORT_BUDGET_US"
+
+# modules `import draccus` used to import, which are only needed by some of its functions
+_DEFERRED_MODULES = [
+    "argparse",
+    "asyncio",
+    "mergedeep",
+    "typing_inspect",
+    "draccus.argparsing",
+    "draccus.cfgparsing",
+    "draccus.wrappers",
+    "draccus.parsers.decoding",
+    "draccus.parsers.encoding",
+]
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(Path(draccus.__file__).parents[1]), *sys.path]))
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+
+def _import_time_us() -> int:
+    """The cumulative time of `import draccus` reported by `-X importtime`, in microseconds."""
+    stderr = _run("-X", "importtime", "-c", "import draccus").stderr
+    for line in stderr.splitlines():
+        _self, cumulative, name = line.partition(":")[2].split("|")
+        if name.strip() == "draccus":
+            return int(cumulative)
+    raise AssertionError(f"draccus missing from the import times:\n{stderr}")
+
+
+def test_import_is_lazy():
+    modules = _run("-c", "import sys, draccus; print('\\n'.join(sys.modules))").stdout.split()
+    assert not set(_DEFERRED_MODULES) & set(modules)
+
+
+@pytest.mark.skipif(not os.environ.get(IMPORT_BUDGET_VAR), reason=f"set {IMPORT_BUDGET_VAR} to check the import time")
+def test_import_time_budget():
+    budget = int(os.environ[IMPORT_BUDGET_VAR])
+    # the fastest of a few runs, as the first one may have to write bytecode
+    import_time = min(_import_time_us() for _ in range(3))
+    assert import_time < budget, f"`import draccus` took {import_time} us"
+
+
+def test_lazy_attributes():
+    for name in draccus.__all__:
+        assert getattr(draccus, name) is not None
+        assert name in dir(draccus)
+    assert draccus.set_config_type == draccus.Options.set_config_type
+    assert draccus.utils.CONFIG_ARG == "config_path"
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        draccus.missing  # noqa: B018
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict
+
+import pytest
+
+import draccus
+from draccus.parsers import include_graph
+from draccus.parsers.include_graph import IncludeCycleError, resolve_include_graph, scan_includes
+
+
+@dataclass
+class Leaf:
+    x: int = 0
+
+
+@dataclass
+class Branches:
+    a: Leaf = field(default_factory=Leaf)
+    b: Leaf = field(default_factory=Leaf)
+    c: Dict[str, int] = field(default_factory=dict)
+
+
+def test_scan_includes():
+    text = """
+a: !include a.yaml
+<<: !include "b c.yaml"
+# d: !include commented.yaml
+e: [!include e1.yaml, !include 'e2.yaml']  # !include trailing.yaml
+f: not!include g.yaml
+"""
+    assert scan_includes(text) == ["a.yaml", "b c.yaml", "e1.yaml", "e2.yaml"]
+
+
+def test_shared_include_is_read_once(tmp_path, monkeypatch):
+    reads = []
+    original = include_graph._read_text
+
+    def counting_read(path):
+        reads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(include_graph, "_read_text", counting_read)
+
+    (tmp_path / "leaf.yaml").write_text("x: 3\n")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "branch.yaml").write_text("!include ../leaf.yaml\n")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("a: !include leaf.yaml\nb: !include sub/branch.yaml\n")
+
+    cfg = draccus.load(Branches, config_path)
+
+    assert cfg.a == cfg.b == Leaf(3)
+    assert cfg.a is not cfg.b
+    assert sorted(reads) == sorted([str(tmp_path / "leaf.yaml"), str(tmp_path / "sub" / "branch.yaml")])
+
+
+def test_independent_includes_are_read_concurrently(tmp_path, monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+    original = include_graph._read_text
+
+    def waiting_read(path):
+        # both reads must be in flight at the same time for the barrier to release
+        barrier.wait()
+        return original(path)
+
+    monkeypatch.setattr(include_graph, "_read_text", waiting_read)
+
+    (tmp_path / "a.yaml").write_text("x: 1\n")
+    (tmp_path / "b.yaml").write_text("x: 2\n")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("a: !include a.yaml\nb: !include b.yaml\n")
+
+    assert draccus.load(Branches, config_path) == Branches(Leaf(1), Leaf(2))
+
+
+def test_include_cycle_is_reported(tmp_path):
+    (tmp_path / "a.yaml").write_text("x: !include b.yaml\n")
+    (tmp_path / "b.yaml").write_text("<<: !include a.yaml\n")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("a: !include a.yaml\n")
+
+    with pytest.raises(IncludeCycleError) as exc_info:
+        draccus.load(Branches, config_path)
+
+    assert exc_info.value.chain == [str(tmp_path / name) for name in ["a.yaml", "b.yaml", "a.yaml"]]
+    assert "a.yaml -> " in str(exc_info.value)
+
+
+def test_self_include_is_reported(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("c: !include config.yaml\n")
+
+    with pytest.raises(IncludeCycleError):
+        resolve_include_graph(str(config_path))
+
+
+def test_missing_include_still_fails_at_load(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("a: !include missing.yaml\n")
+
+    graph = resolve_include_graph(str(config_path))
+    assert str(tmp_path / "missing.yaml") not in graph.sources
+
+    with pytest.raises(draccus.ParsingError):
+        draccus.load(Branches, config_path)
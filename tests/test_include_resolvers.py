@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import tarfile
+import zipfile
+from dataclasses import dataclass, field
+from typing import Dict
+
+import pytest
+
+import draccus
+from draccus.parsers import resolvers
+from draccus.parsers.resolvers import IncludeResolver, resolve_location
+
+from .testutils import TestSetup
+
+
+@dataclass
+class Leaf:
+    x: int = 0
+    name: str = ""
+
+
+@dataclass
+class Config(TestSetup):
+    a: Leaf = field(default_factory=Leaf)
+    b: Leaf = field(default_factory=Leaf)
+
+
+class DictResolver(IncludeResolver):
+    """Stand-in for a remote fetcher: serves files from memory and counts fetches."""
+
+    def __init__(self, files: Dict[str, str]):
+        self.files = files
+        self.fetches: Dict[str, int] = {}
+
+    def can_resolve(self, location: str) -> bool:
+        return location.startswith("mem://")
+
+    def read_text(self, location: str) -> str:
+        self.fetches[location] = self.fetches.get(location, 0) + 1
+        try:
+            return self.files[location]
+        except KeyError as e:
+            raise FileNotFoundError(location) from e
+
+
+@pytest.fixture
+def dict_resolver():
+    resolver = draccus.register_include_resolver(
+        DictResolver(
+            {
+                "mem://configs/leaf.yaml": "x: 7\nname: remote\n",
+                "mem://configs/nested/leaf.yaml": "<<: !include ../leaf.yaml\nx: 8\n",
+            }
+        )
+    )
+    yield resolver
+    resolvers.unregister_include_resolver(resolver)
+
+
+def test_resolve_location(tmp_path):
+    base = str(tmp_path / "configs" / "main.yaml")
+    assert resolve_location(base, "sub/a.yaml") == str(tmp_path / "configs" / "sub" / "a.yaml")
+    assert resolve_location(base, "bundle.zip::x/a.yaml") == f"{tmp_path}/configs/bundle.zip::x/a.yaml"
+    assert resolve_location(f"{tmp_path}/b.zip::x/main.yaml", "../a.yaml") == f"{tmp_path}/b.zip::a.yaml"
+    assert resolve_location(f"{tmp_path}/b.zip::x/main.yaml", "/abs/a.yaml") == "/abs/a.yaml"
+    assert resolve_location("pkg://some.pkg/cfg/main.yaml", "a.yaml") == "pkg://some.pkg/cfg/a.yaml"
+
+
+def test_include_from_zip(tmp_path):
+    with zipfile.ZipFile(tmp_path / "bundle.zip", "w") as zf:
+        zf.writestr("leaves/a.yaml", "x: 1\nname: zipped\n")
+        zf.writestr("leaves/b.yaml", "<<: !include a.yaml\nx: 2\n")
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("a: !include bundle.zip::leaves/a.yaml\nb: !include bundle.zip::leaves/b.yaml\n")
+
+    assert draccus.load(Config, config_path) == Config(Leaf(1, "zipped"), Leaf(2, "zipped"))
+
+
+def test_include_from_tar(tmp_path):
+    leaf = tmp_path / "leaf.yaml"
+    leaf.write_text("x: 3\nname: tarred\n")
+    with tarfile.open(tmp_path / "bundle.tar.gz", "w:gz") as tf:
+        tf.add(leaf, arcname="leaves/a.yaml")
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("a: !include bundle.tar.gz::leaves/a.yaml\n")
+
+    assert draccus.load(Config, config_path).a == Leaf(3, "tarred")
+
+
+def test_missing_archive_member(tmp_path):
+    with zipfile.ZipFile(tmp_path / "bundle.zip", "w") as zf:
+        zf.writestr("a.yaml", "x: 1\n")
+
+    with pytest.raises(FileNotFoundError):
+        resolvers.read_text(f"{tmp_path}/bundle.zip::missing.yaml")
+
+
+def test_include_from_package_resource(tmp_path, monkeypatch):
+    package = tmp_path / "draccus_test_resources"
+    (package / "configs").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "configs" / "leaf.yaml").write_text("x: 4\nname: packaged\n")
+    (package / "configs" / "other.yaml").write_text("<<: !include leaf.yaml\nx: 5\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "a: !include pkg://draccus_test_resources/configs/leaf.yaml\n"
+        "b: !include pkg://draccus_test_resources/configs/other.yaml\n"
+    )
+
+    assert draccus.load(Config, config_path) == Config(Leaf(4, "packaged"), Leaf(5, "packaged"))
+
+
+def test_custom_resolver(tmp_path, dict_resolver):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "a: !include mem://configs/leaf.yaml\nb: !include mem://configs/nested/leaf.yaml\n",
+    )
+
+    assert draccus.load(Config, config_path) == Config(Leaf(7, "remote"), Leaf(8, "remote"))
+    # the shared include is only fetched once
+    assert dict_resolver.fetches == {"mem://configs/leaf.yaml": 1, "mem://configs/nested/leaf.yaml": 1}
+
+
+def test_cli_include_with_custom_resolver(dict_resolver):
+    cfg = Config.setup("--a 'include mem://configs/nested/leaf.yaml' --b.x 9")
+    assert cfg == Config(Leaf(8, "remote"), Leaf(9, ""))
+
+
+def test_cli_include_missing(dict_resolver):
+    with pytest.raises(FileNotFoundError, match="Include is a reserved cli keyword"):
+        Config.setup("--a 'include mem://configs/missing.yaml'")
@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import json
+import tracemalloc
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional, Tuple, Union
+
+import pytest
+
+import draccus
+from draccus.choice_types import ChoiceRegistry
+from draccus.parsers import json_decoding
+from draccus.utils import DecodingError, ParsingError
+
+
+class Color(Enum):
+    red = "RED"
+    blue = "BLUE"
+
+
+@dataclass
+class Source:
+    name: str
+    weight: float = 1.0
+    tags: List[str] = field(default_factory=list)
+    color: Color = Color.red
+
+
+@dataclass
+class ModelConfig(ChoiceRegistry):
+    pass
+
+
+@ModelConfig.register_subclass("gpt")
+@dataclass
+class GPTConfig(ModelConfig):
+    layers: int = 12
+
+
+@dataclass
+class Mixture:
+    sources: List[Source] = field(default_factory=list)
+    by_name: Dict[str, Source] = field(default_factory=dict)
+    default: Optional[Source] = None
+    shape: Tuple[int, int] = (1, 1)
+    lr: Union[float, str] = 0.1
+    model: ModelConfig = field(default_factory=GPTConfig)
+    seed: int = 0
+    counter: int = field(default=0, init=False)
+
+
+RAW = {
+    "sources": [
+        {"name": "web", "weight": 0.5, "tags": ["a", "b"]},
+        {"name": "books", "color": "BLUE"},
+    ],
+    "by_name": {"code": {"name": "code", "weight": 2}},
+    "default": None,
+    "shape": [3, 4],
+    "lr": "cosine",
+    "model": {"type": "gpt", "layers": 24},
+    "seed": 7,
+    "counter": 3,
+}
+
+
+def test_matches_decode():
+    text = json.dumps(RAW, indent=2)
+    assert draccus.decode_json(Mixture, text) == draccus.decode(Mixture, json.loads(text))
+    assert draccus.decode_json(Mixture, text.encode()).counter == 3
+
+
+def test_load_json_matches_load(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(RAW))
+
+    with draccus.config_type("json"):
+        expected = draccus.load(Mixture, config_path)
+    assert draccus.load_json(Mixture, config_path) == expected
+
+
+def test_load_json_empty_file(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text("")
+
+    with pytest.raises(ParsingError, match="Expecting value"):
+        draccus.load_json(Mixture, config_path)
+
+
+def test_optional_present():
+    cfg = draccus.decode_json(Mixture, '{"default": {"name": "x"}}')
+    assert cfg.default == Source("x")
+
+
+def test_unknown_field():
+    with pytest.raises(DecodingError, match="`unknown`"):
+        draccus.decode_json(Mixture, '{"unknown": 1}')
+
+
+def test_missing_field():
+    with pytest.raises(DecodingError, match="Missing required field"):
+        draccus.decode_json(Mixture, '{"sources": [{"weight": 1}]}')
+
+
+def test_bad_field_value_has_path():
+    with pytest.raises(DecodingError) as exc_info:
+        draccus.decode_json(Mixture, '{"sources": [{"name": "a", "weight": "heavy"}]}')
+    assert exc_info.value.key_path == ("sources", "0", "weight")
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"seed": 1', '{"seed" 1}', '{"seed": 1,}', '{"seed": 1} []', "", '{"sources": [{"name": "a"} {}]}'],
+)
+def test_invalid_json(text):
+    with pytest.raises(ParsingError, match="Invalid JSON"):
+        draccus.decode_json(Mixture, text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_bytes_are_decoded_in_chunks(monkeypatch, chunk_size):
+    monkeypatch.setattr(json_decoding, "_CHUNK_SIZE", chunk_size)
+    raw = dict(RAW, sources=[{"name": "wéb ✓ 😀", "weight": 12345.678e-3, "tags": ["a\\n", "é"]}] * 3)
+    text = json.dumps(raw, indent=2, ensure_ascii=False)
+    assert draccus.decode_json(Mixture, text.encode()) == draccus.decode_json(Mixture, text)
+
+
+@pytest.mark.parametrize("text", ['{\n  "seed": 1,\n  "sources": [{"name": "a"} {}]}', '{"seed": 1}  \n\n  []'])
+def test_chunked_errors_have_the_position_in_the_document(monkeypatch, text):
+    with pytest.raises(ParsingError) as expected:
+        draccus.decode_json(Mixture, text)
+    monkeypatch.setattr(json_decoding, "_CHUNK_SIZE", 3)
+    with pytest.raises(ParsingError) as exc_info:
+        draccus.decode_json(Mixture, text.encode())
+    assert str(exc_info.value) == str(expected.value)
+
+
+def test_load_json_invalid_file(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"seed": }')
+
+    with pytest.raises(ParsingError, match="Expecting value: line 1 column 10"):
+        draccus.load_json(Mixture, config_path)
+
+
+def test_load_json_does_not_copy_the_file(tmp_path):
+    config_path = tmp_path / "config.json"
+    padding = " " * (16 << 20)
+    config_path.write_text(f'{{"seed": 1, {padding} "sources": [{padding} {{"name": "a"}}]}}')
+
+    tracemalloc.start()
+    try:
+        cfg = draccus.load_json(Mixture, config_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert cfg == Mixture(sources=[Source("a")], seed=1)
+    assert peak < (8 << 20)
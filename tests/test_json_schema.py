@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import dataclasses
+import json
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Generic, List, Literal, Optional, Tuple, TypeVar, Union
+
+import pytest
+
+import draccus
+from draccus.choice_types import ChoiceRegistry
+
+T = TypeVar("T")
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclasses.dataclass
+class OptimizerConfig(ChoiceRegistry):
+    lr: float = 1e-3
+
+
+@OptimizerConfig.register_subclass("adam")
+@dataclasses.dataclass
+class AdamConfig(OptimizerConfig):
+    betas: Tuple[float, float] = (0.9, 0.999)
+
+
+@OptimizerConfig.register_subclass("sgd")
+@dataclasses.dataclass
+class SGDConfig(OptimizerConfig):
+    momentum: float = 0.0
+
+
+@dataclasses.dataclass
+class Range(Generic[T]):
+    low: T
+    high: T
+
+
+@dataclasses.dataclass
+class Node:
+    name: str
+    children: List["Node"] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class Config:
+    name: str
+    steps: int = 100
+    color: Color = Color.RED
+    mode: Literal["train", "eval"] = "train"
+    output: Optional[Path] = None
+    optimizer: OptimizerConfig = dataclasses.field(default_factory=AdamConfig)
+    lr_range: Range[float] = dataclasses.field(default_factory=lambda: Range(0.0, 1.0))
+    weights: Dict[str, float] = dataclasses.field(default_factory=dict)
+    seed: Union[int, str] = 0
+    tree: Optional[Node] = None
+
+
+def test_schema_layout():
+    schema = draccus.json_schema(Config)
+    assert schema["$schema"] == "https://json-schema.org/draft/2020-12/schema"
+    config = schema["$defs"][schema["$ref"].split("/")[-1]]
+    assert config["required"] == ["name"]
+    assert config["additionalProperties"] is False
+    properties = config["properties"]
+    assert properties["steps"] == {"type": "integer", "default": 100}
+    assert properties["color"] == {"enum": ["RED", "red", "BLUE", "blue"], "default": "RED"}
+    assert properties["mode"] == {"enum": ["train", "eval"], "default": "train"}
+    assert properties["output"] == {"anyOf": [{"type": "string"}, {"type": "null"}], "default": None}
+    assert properties["seed"] == {"anyOf": [{"type": "integer"}, {"type": "string"}], "default": 0}
+
+    optimizer = schema["$defs"]["OptimizerConfig"]
+    assert [choice["$ref"] for choice in optimizer["oneOf"]] == [
+        "#/$defs/OptimizerConfig.adam",
+        "#/$defs/OptimizerConfig.sgd",
+    ]
+    adam = schema["$defs"]["OptimizerConfig.adam"]
+    assert adam["properties"]["type"] == {"const": "adam"}
+    assert adam["required"] == ["type"]
+    assert schema["$defs"]["Range[float]"]["properties"]["low"] == {"type": "number"}
+    # stable and serializable
+    assert json.loads(json.dumps(schema)) == draccus.json_schema(Config)
+
+
+def test_enum_literal():
+    @dataclasses.dataclass
+    class Palette:
+        color: Literal[Color.RED, "none"] = Color.RED
+
+    schema = draccus.json_schema(Palette)
+    properties = schema["$defs"][schema["$ref"].split("/")[-1]]["properties"]
+    # as dumped
+    assert properties["color"] == {"enum": ["RED", "none"], "default": "RED"}
+    assert json.loads(json.dumps(schema)) == schema
+
+
+def test_schema_is_memoized_until_registration():
+    schema = draccus.json_schema(Config)
+    schema["$defs"].clear()  # callers get their own copy
+    assert "OptimizerConfig.rmsprop" not in draccus.json_schema(Config)["$defs"]
+
+    @OptimizerConfig.register_subclass("rmsprop")
+    @dataclasses.dataclass
+    class RMSPropConfig(OptimizerConfig):
+        alpha: float = 0.99
+
+    try:
+        assert "OptimizerConfig.rmsprop" in draccus.json_schema(Config)["$defs"]
+    finally:
+        del OptimizerConfig._choice_registry["rmsprop"]
+
+
+@pytest.mark.parametrize(
+    "config, valid",
+    [
+        ({"name": "run"}, True),
+        ({"name": "run", "optimizer": {"type": "sgd", "momentum": 0.9}, "color": "blue", "output": "/tmp/x"}, True),
+        ({"name": "run", "optimizer": {"type": "adam", "betas": [0.8, 0.9]}, "seed": "abc"}, True),
+        ({"name": "run", "tree": {"name": "a", "children": [{"name": "b"}]}, "lr_range": {"low": 0, "high": 2}}, True),
+        ({"steps": 10}, False),
+        ({"name": "run", "stepz": 10}, False),
+        ({"name": "run", "steps": "many"}, False),
+        ({"name": "run", "mode": "test"}, False),
+        ({"name": "run", "optimizer": {"type": "sgd", "betas": [0.8, 0.9]}}, False),
+        ({"name": "run", "optimizer": {"momentum": 0.9}}, False),
+        ({"name": "run", "optimizer": {"type": "adam", "betas": [0.8]}}, False),
+        ({"name": "run", "tree": {"children": []}}, False),
+    ],
+)
+def test_schema_validation_matches_decoding(config, valid):
+    jsonschema = pytest.importorskip("jsonschema")
+    schema = draccus.json_schema(Config)
+    if valid:
+        jsonschema.validate(config, schema)
+        draccus.decode(Config, config)
+    else:
+        with pytest.raises(jsonschema.ValidationError):
+            jsonschema.validate(config, schema)
+        with pytest.raises(draccus.ParsingError):
+            draccus.decode(Config, config)
@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import io
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+import draccus
+from draccus.utils import DecodingError
+
+
+@dataclass
+class Trial:
+    name: str = ""
+    lr: float = 1e-3
+    layers: List[int] = field(default_factory=list)
+
+
+TRIALS = [Trial(f"trial{i}", lr=i / 10, layers=list(range(i % 3))) for i in range(50)]
+
+
+@pytest.mark.parametrize("filename", ["sweep.yaml", "sweep.jsonl", "sweep.ndjson", "sweep.jsonl.gz", "sweep.yml.xz"])
+def test_round_trip(tmp_path, filename):
+    path = tmp_path / filename
+    draccus.dump_iter(iter(TRIALS), path)
+    assert list(draccus.load_iter(Trial, path)) == TRIALS
+
+
+def test_jsonl_layout(tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    draccus.dump_iter(TRIALS[:2], path, omit_defaults=True)
+    assert path.read_text().splitlines() == [
+        '{"name": "trial0", "lr": 0.0}',
+        '{"name": "trial1", "lr": 0.1, "layers": [0]}',
+    ]
+
+
+def test_yaml_stream():
+    stream = io.StringIO("name: a\n---\nname: b\nlayers: [1]\n...\n---\nlr: 0.5\n")
+    assert list(draccus.load_iter(Trial, stream)) == [Trial("a"), Trial("b", layers=[1]), Trial(lr=0.5)]
+
+
+def test_stream_format_follows_config_type():
+    stream = io.StringIO()
+    with draccus.config_type("json"):
+        draccus.dump_iter(TRIALS[:3], stream)
+        stream.seek(0)
+        records = draccus.load_iter(Trial, stream)
+    # the format was resolved when load_iter was called
+    assert list(records) == TRIALS[:3]
+    assert len(stream.getvalue().splitlines()) == 3
+
+
+def test_records_are_lazy():
+    stream = io.StringIO('{"name": "a"}\n\n{"name": "b"}\n{"lr": "fast"}\n')
+    records = draccus.load_iter(Trial, stream, config_type="json")
+    assert next(records) == Trial("a")
+    assert next(records) == Trial("b")
+    with pytest.raises(DecodingError):
+        next(records)
+
+
+def test_invalid_records():
+    with pytest.raises(draccus.ParsingError, match="line 2"):
+        list(draccus.load_iter(Trial, io.StringIO('{"name": "a"}\nnot json\n'), config_type="json"))
+    with pytest.raises(draccus.ParsingError):
+        list(draccus.load_iter(Trial, io.StringIO("name: [a\n"), config_type="yaml"))
+    with pytest.raises(draccus.ParsingError):
+        draccus.load_iter(Trial, io.StringIO(""), config_type="toml")
@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import dataclasses
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import pytest
+import yaml
+
+import draccus
+from draccus.choice_types import ChoiceRegistry
+from draccus.parsers import cache, yaml_loader
+from draccus.parsers.merging import merge_layers
+
+from .testutils import TestSetup
+
+
+@dataclasses.dataclass
+class OptimizerConfig(ChoiceRegistry):
+    lr: float = 1e-3
+
+
+@OptimizerConfig.register_subclass("adam")
+@dataclasses.dataclass
+class AdamConfig(OptimizerConfig):
+    beta1: float = 0.9
+    beta2: float = 0.999
+
+
+@OptimizerConfig.register_subclass("sgd")
+@dataclasses.dataclass
+class SGDConfig(OptimizerConfig):
+    momentum: float = 0.0
+
+
+@dataclasses.dataclass
+class ClusterConfig:
+    nodes: int = 1
+    env: Dict[str, str] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class RunConfig(TestSetup):
+    name: str = ""
+    optimizer: OptimizerConfig = dataclasses.field(default_factory=AdamConfig)
+    cluster: ClusterConfig = dataclasses.field(default_factory=ClusterConfig)
+    layers: List[int] = dataclasses.field(default_factory=list)
+    extra: Optional[Dict[str, Any]] = None
+
+
+@pytest.fixture(autouse=True)
+def clear_memoized():
+    cache.clear_memoized()
+    yield
+    cache.clear_memoized()
+
+
+@pytest.fixture
+def layer_files(tmp_path):
+    files = {
+        "base.yaml": {
+            "name": "base",
+            "optimizer": {"type": "adam", "lr": 0.1, "beta1": 0.8},
+            "cluster": {"nodes": 2, "env": {"A": "1"}},
+            "layers": [1, 2, 3],
+        },
+        "cluster.yaml": {"cluster": {"env": {"B": "2"}}, "extra": {"a": {"b": 1}}},
+        "experiment.yaml": {"optimizer": {"type": "sgd", "momentum": 0.5}, "layers": [4]},
+        "user.json": {"optimizer": {"lr": 0.01}, "extra": {"a": {"c": 2}}},
+    }
+    paths = []
+    for name, content in files.items():
+        path = tmp_path / name
+        path.write_text(json.dumps(content) if name.endswith(".json") else yaml.safe_dump(content))
+        paths.append(path)
+    return paths
+
+
+def test_load_layers(layer_files):
+    overrides = {"cluster.nodes": 8, "name": "run"}
+    cfg = draccus.load_layers(RunConfig, layer_files, overrides=overrides)
+    assert cfg == RunConfig(
+        name="run",
+        # switching to sgd dropped the adam fields of the base layer
+        optimizer=SGDConfig(lr=0.01, momentum=0.5),
+        cluster=ClusterConfig(nodes=8, env={"A": "1", "B": "2"}),
+        layers=[4],
+        extra={"a": {"b": 1, "c": 2}},
+    )
+
+
+def test_choice_type_change_replaces_subtree():
+    base = {"optimizer": {"type": "adam", "beta1": 0.3}}
+    # the fields of adam don't apply to sgd
+    assert draccus.load_layers(RunConfig, [base, {"optimizer": {"type": "sgd"}}]).optimizer == SGDConfig()
+    # apply_overrides gives the same result
+    cfg = draccus.apply_overrides(draccus.load_layers(RunConfig, [base]), {"optimizer.type": "sgd"})
+    assert cfg.optimizer == SGDConfig()
+
+
+def test_same_choice_is_merged(layer_files):
+    base, cluster, _, user = layer_files
+    cfg = draccus.load_layers(RunConfig, [base, cluster, user], overrides={"optimizer": {"type": "adam"}})
+    assert cfg.optimizer == AdamConfig(lr=0.01, beta1=0.8)
+
+
+def test_default_choice_type():
+    @dataclasses.dataclass
+    class Scheduler(ChoiceRegistry):
+        warmup: int = 0
+
+        @classmethod
+        def default_choice_name(cls):
+            return "linear"
+
+    @Scheduler.register_subclass("linear")
+    @dataclasses.dataclass
+    class LinearScheduler(Scheduler):
+        decay: float = 0.0
+
+    @Scheduler.register_subclass("constant")
+    @dataclasses.dataclass
+    class ConstantScheduler(Scheduler):
+        pass
+
+    @dataclasses.dataclass
+    class Config:
+        scheduler: Scheduler = dataclasses.field(default_factory=LinearScheduler)
+
+    base = {"scheduler": {"warmup": 10, "decay": 0.5}}
+    linear = {"scheduler": {"type": "linear", "warmup": 5}}
+    assert draccus.load_layers(Config, [base, linear]) == Config(LinearScheduler(5, 0.5))
+    constant = {"scheduler": {"type": "constant"}}
+    assert draccus.load_layers(Config, [base, constant]) == Config(ConstantScheduler())
+
+
+def test_layers_are_not_modified():
+    base = {"cluster": {"nodes": 2, "env": {"A": "1"}}, "layers": [1]}
+    override = {"cluster": {"env": {"B": "2"}}}
+    merged = merge_layers(RunConfig, [base, override])
+    merged["cluster"]["env"]["C"] = "3"
+    merged["layers"].append(2)
+    assert base == {"cluster": {"nodes": 2, "env": {"A": "1"}}, "layers": [1]}
+    assert override == {"cluster": {"env": {"B": "2"}}}
+
+
+def test_layers_are_parsed_once(layer_files, monkeypatch):
+    loaded = []
+    original = yaml_loader.load_yaml
+
+    def counting_load(stream, *args, **kwargs):
+        loaded.append(stream.name)
+        return original(stream, *args, **kwargs)
+
+    monkeypatch.setattr(yaml_loader, "load_yaml", counting_load)
+
+    first = draccus.load_layers(RunConfig, layer_files[:3])
+    assert len(loaded) == 3
+    assert draccus.load_layers(RunConfig, layer_files[:3]) == first
+    assert len(loaded) == 3
+
+    # a modified layer is parsed again
+    layer_files[0].write_text("name: changed\n")
+    os.utime(layer_files[0], ns=(0, 0))
+    assert draccus.load_layers(RunConfig, layer_files[:3]).name == "changed"
+    assert len(loaded) == 4
+
+
+def test_modified_include_is_reparsed(tmp_path):
+    (tmp_path / "cluster.yaml").write_text("nodes: 2\n")
+    (tmp_path / "base.yaml").write_text("cluster: !include cluster.yaml\n")
+    assert draccus.load_layers(RunConfig, [tmp_path / "base.yaml"]).cluster.nodes == 2
+
+    (tmp_path / "cluster.yaml").write_text("nodes: 16\n")
+    assert draccus.load_layers(RunConfig, [tmp_path / "base.yaml"]).cluster.nodes == 16
+
+
+def test_cli_changes_choice_type(tmp_path):
+    # the command line is merged into the config file, also when it changes the type of a choice
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump({"optimizer": {"type": "adam", "lr": 0.5}}))
+    cfg = RunConfig.setup(f"--config_path {config_path} --optimizer.type sgd")
+    assert cfg.optimizer == SGDConfig(lr=0.5)
+    cfg = RunConfig.setup(f"--config_path {config_path} --optimizer.type sgd --optimizer.momentum 0.2")
+    assert cfg.optimizer == SGDConfig(lr=0.5, momentum=0.2)
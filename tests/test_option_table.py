@@ -0,0 +1,274 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import dataclasses
+import importlib
+import sys
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from draccus import argparsing
+from draccus.argparsing import ArgumentParser
+from draccus.choice_types import ChoiceRegistry
+from draccus.parsers import cache
+from draccus.utils import DecodingError
+from draccus.wrappers import option_table
+
+from .testutils import raises_unrecognized_args
+
+
+@dataclass
+class ModelConfig(ChoiceRegistry):
+    layers: int = 2
+
+
+@ModelConfig.register_subclass("mlp")
+@dataclass
+class MLPConfig(ModelConfig):
+    hidden: int = 16
+
+
+@dataclass
+class TrainConfig:
+    name: str = "run"
+    lr: float = 1e-3
+    model: ModelConfig = dataclasses.field(default_factory=MLPConfig)
+    tags: List[str] = dataclasses.field(default_factory=list)
+
+
+def _table(args: List[str]) -> option_table.OptionTable:
+    return ArgumentParser(TrainConfig)._get_option_table(option_table.ChoiceSelection.from_command_line(args))
+
+
+@pytest.mark.parametrize(
+    "args, values",
+    [
+        ([], {}),
+        (["--name", "exp", "--lr=0.1"], {"name": "exp", "lr": "0.1"}),
+        (["--lr", "-1", "--lr", "-.5"], {"lr": "-.5"}),
+        (["--model.type", "mlp", "--model.hidden", "8"], {"model.type": "mlp", "model.hidden": "8"}),
+        (["--tags", "[a, b]", "--name="], {"tags": "[a, b]", "name": ""}),
+        (["--name", "-x y"], {"name": "-x y"}),
+    ],
+)
+def test_tokenize(args, values):
+    assert _table(args).tokenize(args) == values
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--nam", "exp"],  # abbreviation
+        ["--name"],
+        ["--name", "--lr", "1"],
+        ["--lr", "-1e-3"],
+        ["--model.type", "transformer"],
+        ["--unknown", "1"],
+        ["exp"],
+        ["--", "--name", "exp"],
+        ["-h"],
+    ],
+)
+def test_tokenize_leaves_the_rest_to_argparse(args):
+    assert _table(args).tokenize(args) is None
+
+
+def test_parse_without_argparse():
+    parser = ArgumentParser(TrainConfig)
+    config = parser.parse_args(["--lr", "0.5", "--model.type", "mlp", "--model.hidden", "8", "--tags", "[a]"])
+    assert config == TrainConfig(lr=0.5, model=MLPConfig(hidden=8), tags=["a"])
+    assert parser._parser is None
+
+
+def test_fallback_to_argparse():
+    parser = ArgumentParser(TrainConfig)
+    assert parser.parse_args(["--nam", "exp"]) == TrainConfig(name="exp")
+    assert parser._parser is not None
+    with raises_unrecognized_args("--unknown", "1"):
+        ArgumentParser(TrainConfig).parse_args(["--unknown", "1"])
+
+
+def test_customized_parser_is_used(monkeypatch):
+    parser = ArgumentParser(TrainConfig)
+    parser.parser.add_argument("--verbose", action="store_true")
+    monkeypatch.setattr(option_table.OptionTable, "tokenize", None)
+    config, unparsed = parser.parse_known_args(["--name", "exp", "--other"])
+    assert config == TrainConfig(name="exp")
+    assert unparsed == ["--other"]
+
+
+@dataclass
+class OptimizerConfig(ChoiceRegistry):
+    lr: float = 1e-3
+
+
+@OptimizerConfig.register_subclass("sgd")
+@dataclass
+class SGDConfig(OptimizerConfig):
+    momentum: float = 0.0
+
+
+@OptimizerConfig.register_subclass("adam")
+@dataclass
+class AdamConfig(OptimizerConfig):
+    beta1: float = 0.9
+
+
+@dataclass
+class OptimConfig:
+    optimizer: OptimizerConfig = dataclasses.field(default_factory=SGDConfig)
+
+
+def _wrapped_choices(parser: ArgumentParser) -> List[str]:
+    assert parser._wrapper is not None
+    (choice_wrapper,) = parser._wrapper._children
+    return list(choice_wrapper._wrapped)
+
+
+def test_only_the_selected_choice_is_registered(tmp_path):
+    parser = ArgumentParser(OptimConfig)
+    config = parser.parse_args(["--optimizer.type", "adam", "--optimizer.beta1", "0.5"])
+    assert config == OptimConfig(AdamConfig(beta1=0.5))
+    assert _wrapped_choices(parser) == ["adam"]
+    assert "--optimizer.momentum" not in next(iter(parser._option_tables.values())).options
+    assert parser._parser is None
+
+    # the type can come from the config file
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("optimizer:\n  type: sgd\n")
+    config = parser.parse_args(["--config_path", str(config_path), "--optimizer.momentum", "0.9"])
+    assert config == OptimConfig(SGDConfig(momentum=0.9))
+    assert _wrapped_choices(parser) == ["adam", "sgd"]
+    assert parser._parser is None
+
+    # options of another choice are left to argparse, which has every choice
+    with pytest.raises(DecodingError):
+        parser.parse_args(["--optimizer.type", "adam", "--optimizer.momentum", "0.9"])
+    assert parser._parser is not None
+
+
+def test_option_tables_are_capped(monkeypatch):
+    monkeypatch.setattr(argparsing, "MAX_CACHED_OPTION_TABLES", 2)
+    parser = ArgumentParser(OptimConfig)
+    parser.parse_args(["--optimizer.type", "adam"])
+    (adam_table,) = parser._option_tables.values()
+    parser.parse_args(["--optimizer.type=adam", "--optimizer.lr", "0.1"])
+    assert list(parser._option_tables.values()) == [adam_table]
+
+    parser.parse_args(["--optimizer.type", "sgd"])
+    parser.parse_args([])
+    # the oldest table was dropped
+    assert len(parser._option_tables) == 2
+    assert adam_table not in parser._option_tables.values()
+    assert parser.parse_args(["--optimizer.type", "adam"]) == OptimConfig(AdamConfig())
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    cache.set_cache_dir(tmp_path / "cache")
+    yield tmp_path / "cache"
+    cache.set_cache_dir(None)
+
+
+def test_cached_table(cache_dir):
+    args = ["--model.type", "mlp", "--lr", "0.5"]
+    ArgumentParser(TrainConfig).parse_args(args)
+    parser = ArgumentParser(TrainConfig)
+    assert parser.parse_args(args) == TrainConfig(lr=0.5)
+    assert parser._wrapper is None
+    assert next(iter(parser._option_tables.values())).value_types["lr"] is float
+    # --help still has everything
+    help_text = parser._get_parser().format_help()
+    assert "--model.hidden" in help_text
+
+    @ModelConfig.register_subclass("conv")
+    @dataclass
+    class ConvConfig(ModelConfig):
+        kernel: int = 3
+
+    try:
+        assert option_table.read_cached_table(TrainConfig, option_table.ChoiceSelection({})) is None
+        assert ArgumentParser(TrainConfig).parse_args(["--model.type", "conv"]) == TrainConfig(model=ConvConfig())
+    finally:
+        del ModelConfig._choice_registry["conv"]
+
+
+_PLUGIN_CONFIG = """
+import dataclasses
+
+from draccus.choice_types import PluginRegistry
+
+
+@dataclasses.dataclass
+class ModelConfig(PluginRegistry, discover_packages_path="option_table_plugins"):
+    layers: int = 2
+
+
+@dataclasses.dataclass
+class Config:
+    model: ModelConfig = dataclasses.field(default_factory=ModelConfig)
+"""
+
+_PLUGIN = """
+import dataclasses
+
+from option_table_config import ModelConfig
+
+
+@ModelConfig.register_subclass("{name}")
+@dataclasses.dataclass
+class Model(ModelConfig):
+    {name}_size: int = 1
+"""
+
+
+def test_only_the_selected_plugin_is_imported(tmp_path, monkeypatch):
+    plugins = tmp_path / "option_table_plugins"
+    plugins.mkdir()
+    (plugins / "__init__.py").write_text("")
+    for name in ["large", "small"]:
+        (plugins / f"{name}.py").write_text(_PLUGIN.format(name=name))
+    (tmp_path / "option_table_config.py").write_text(_PLUGIN_CONFIG)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        module = importlib.import_module("option_table_config")
+        config = ArgumentParser(module.Config).parse_args(["--model.type", "small", "--model.small_size", "2"])
+        assert config.model.small_size == 2
+        assert "option_table_plugins.small" in sys.modules
+        assert "option_table_plugins.large" not in sys.modules
+        assert sorted(module.ModelConfig.get_known_choices()) == ["large", "small"]
+    finally:
+        for name in list(sys.modules):
+            if name.startswith(("option_table_config", "option_table_plugins")):
+                del sys.modules[name]
+
+
+def test_cached_table_is_rebuilt_on_changes(cache_dir, tmp_path, monkeypatch):
+    plugins = tmp_path / "option_table_plugins"
+    plugins.mkdir()
+    (plugins / "__init__.py").write_text("")
+    (plugins / "small.py").write_text(_PLUGIN.format(name="small"))
+    (tmp_path / "option_table_config.py").write_text(_PLUGIN_CONFIG)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        config_class = importlib.import_module("option_table_config").Config
+        small = option_table.ChoiceSelection({"model.type": "small"})
+        ArgumentParser(config_class).parse_args(["--model.type", "small"])
+        assert "--model.small_size" in option_table.read_cached_table(config_class, small).options
+
+        # a new plugin
+        (plugins / "large.py").write_text(_PLUGIN.format(name="large"))
+        assert option_table.read_cached_table(config_class, small) is None
+
+        # a changed source
+        ArgumentParser(config_class).parse_args(["--model.type", "small"])
+        assert option_table.read_cached_table(config_class, small) is not None
+        with open(tmp_path / "option_table_config.py", "a") as f:
+            f.write("# changed\n")
+        assert option_table.read_cached_table(config_class, small) is None
+    finally:
+        for name in list(sys.modules):
+            if name.startswith(("option_table_config", "option_table_plugins")):
+                del sys.modules[name]
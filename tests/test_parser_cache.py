@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import dataclasses
+from dataclasses import dataclass
+
+import pytest
+
+import draccus
+from draccus import argparsing
+from draccus.choice_types import ChoiceRegistry
+
+from .testutils import TestSetup, exits_and_writes_to_stderr
+
+
+@dataclass
+class ModelConfig(ChoiceRegistry):
+    layers: int = 2
+
+
+@ModelConfig.register_subclass("mlp")
+@dataclass
+class MLPConfig(ModelConfig):
+    hidden: int = 16
+
+
+@dataclass
+class TrainConfig(TestSetup):
+    name: str = "run"
+    steps: int = 10
+    model: ModelConfig = dataclasses.field(default_factory=MLPConfig)
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    built = []
+    init = argparsing.ArgumentParser.__init__
+
+    def counting_init(self, *args, **kwargs):
+        built.append(self)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(argparsing.ArgumentParser, "__init__", counting_init)
+    argparsing._parsers.clear()
+    return built
+
+
+def test_parser_is_reused(builds):
+    assert TrainConfig.setup("--steps 3") == TrainConfig(steps=3)
+    assert TrainConfig.setup("--name exp") == TrainConfig(name="exp")
+    assert len(builds) == 1
+    draccus.parse(TrainConfig, args=[], prog="other")
+    assert len(builds) == 2
+
+
+def test_parsing_doesnt_change_the_help(builds):
+    help_text = TrainConfig.get_help_text()
+    # abbreviations are parsed by argparse
+    assert TrainConfig.setup("--ste 3") == TrainConfig(steps=3)
+    assert TrainConfig.get_help_text() == help_text
+    assert "Path for a config file to parse with draccus (default:" in help_text
+    assert len(builds) == 1
+
+
+def test_registrations_invalidate_the_parser(builds):
+    TrainConfig.setup("")
+
+    @ModelConfig.register_subclass("conv")
+    @dataclass
+    class ConvConfig(ModelConfig):
+        kernel: int = 3
+
+    try:
+        config = TrainConfig.setup("--model.type conv --model.kernel 5")
+        assert config.model == ConvConfig(kernel=5)
+        assert len(builds) == 2
+    finally:
+        del ModelConfig._choice_registry["conv"]
+
+    class Tag(str):
+        pass
+
+    draccus.decode.register(Tag, lambda raw_value, path: Tag(raw_value))
+    TrainConfig.setup("")
+    assert len(builds) == 3
+
+
+def test_run_mode_view_is_prepared_once():
+    parser = argparsing.ArgumentParser(TrainConfig)
+    # abbreviations are parsed by argparse
+    assert parser.parse_args(["--ste", "3"]) == TrainConfig(steps=3)
+    run_parser = parser._run_parser
+    assert parser.parse_args(["--ste", "4", "--model.type", "mlp"]) == TrainConfig(steps=4)
+    assert parser._run_parser is run_parser
+    model_type = next(action for action in run_parser._actions if action.dest == "model.type")
+    assert "mlp" in model_type.choices and list(model_type.choices) == ["mlp"]
+
+    # the help-mode actions are untouched
+    help_action = next(action for action in parser._get_parser()._actions if action.dest == "model.type")
+    assert help_action is not model_type and help_action.default is None
+
+    with exits_and_writes_to_stderr("invalid choice"):
+        parser.parse_args(["--ste", "4", "--model.type", "conv"])
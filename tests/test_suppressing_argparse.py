@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+from draccus.wrappers.suppressing_argparse import SuppressingArgumentParser
+
+
+def test_last_registration_wins():
+    parser = SuppressingArgumentParser(prog="draccus")
+    groups = [parser.add_argument_group(title=f"group {i}") for i in range(50)]
+    for i, group in enumerate(groups):
+        group.add_argument("--shared", choices=[str(i)], help=f"shared option of group {i}")
+        group.add_argument(f"--own_{i}", help=f"own option of group {i}")
+
+    args = parser.parse_args(["--shared", "49", "--own_3", "x"])
+    assert args.shared == "49" and args.own_3 == "x"
+    assert [action.dest for action in parser._actions].count("shared") == 1
+
+    # every group still shows its own version of the option
+    help_text = parser.format_help()
+    assert "shared option of group 0" in help_text
+    assert "shared option of group 49" in help_text
+    assert parser.format_usage().count("--shared") == 1
+
+    # adding arguments after parsing still works
+    groups[0].add_argument("--shared", help="shared option, again")
+    parser.parse_args(["--shared", "anything"])
+    assert [action.dest for action in parser._actions].count("shared") == 1
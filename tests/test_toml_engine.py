@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import importlib.util
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import pytest
+
+import draccus
+from draccus.parsers.config_parsers import TOMLEngine, TOMLParser
+
+from .testutils import TestSetup
+
+
+@dataclass
+class Inner:
+    lr: float = 0.1
+    name: str = ""
+
+
+@dataclass
+class Config(TestSetup):
+    steps: int = 0
+    layers: List[int] = field(default_factory=list)
+    inner: Inner = field(default_factory=Inner)
+    extra: Dict[str, str] = field(default_factory=dict)
+    debug: bool = False
+
+
+TOML_TEXT = """
+steps = 1_000
+layers = [1, 2, 3]
+debug = true
+
+[inner]
+lr = 3e-4
+name = "adam"
+
+[extra]
+a = "b"
+"""
+
+
+HAS_TOMLLIB = any(importlib.util.find_spec(name) is not None for name in ("tomllib", "tomli"))
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(TOMLEngine.TOMLLIB, marks=pytest.mark.skipif(not HAS_TOMLLIB, reason="tomllib not available")),
+        TOMLEngine.TOML,
+    ]
+)
+def engine(request):
+    TOMLParser.set_engine(request.param)
+    yield request.param
+    TOMLParser.set_engine(None)
+
+
+@pytest.fixture
+def toml_config_type():
+    with draccus.config_type("toml"):
+        yield
+
+
+@pytest.mark.skipif(not HAS_TOMLLIB, reason="tomllib not available")
+def test_default_engine_prefers_tomllib():
+    assert TOMLParser.get_engine() is TOMLEngine.TOMLLIB
+
+
+def test_load(engine, tmp_path):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(TOML_TEXT)
+
+    cfg = draccus.load(Config, config_path)
+    assert cfg == Config(1000, [1, 2, 3], Inner(3e-4, "adam"), {"a": "b"}, True)
+
+
+def test_dump_output_is_unchanged(engine, toml_config_type, tmp_path):
+    cfg = Config(5, [1], Inner(0.5, "sgd"), {"x": "y"})
+    text = draccus.dump(cfg)
+
+    import toml
+
+    assert text == toml.dumps(draccus.encode(cfg))
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(text)
+    assert draccus.load(Config, config_path) == cfg
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "1",
+        "-12",
+        "+3",
+        "1_000",
+        "007",
+        "1.5",
+        "-2e-3",
+        "1.",
+        "inf",
+        "nan",
+        "true",
+        "True",
+        "hello",
+        "a.b-c/d",
+        "hello world",
+        '"quoted"',
+        "[1, 2]",
+        "{a = 1}",
+        "1979-05-27",
+        "0x1F",
+        "",
+    ],
+)
+def test_parse_string_matches_full_parser(value):
+    import toml
+
+    try:
+        expected = toml.loads(f"val = {value}")["val"]
+    except toml.decoder.TomlDecodeError:
+        expected = value
+
+    result = TOMLParser.parse_string(value)
+    if value == "nan":
+        assert result != result
+    else:
+        assert result == expected
+        # the toml package returns a dict subclass for inline tables
+        assert type(result) is type(expected) or isinstance(result, dict)
+
+
+def test_cli_values(engine, toml_config_type):
+    cfg = Config.setup("--steps 10 --layers [4,5] --inner.lr 1e-2 --inner.name fast --debug true")
+    assert cfg == Config(10, [4, 5], Inner(1e-2, "fast"), {}, True)
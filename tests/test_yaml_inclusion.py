@@ -5,6 +5,11 @@ import tempfile
 from enum import Enum, auto
 from pathlib import Path
 
+import pytest
+
+import draccus
+from draccus.parsers import yaml_loader
+from draccus.parsers.include_graph import IncludeCycleError
 from tests.conftest import Optimizers
 
 
@@ -75,3 +80,58 @@ num_units: 16
         assert config.embedding_dim == 32
         assert config.age_group.name == "age_group"
         assert config.age_group.num_units == 16
+
+
+def test_merge_include_is_composed_once(tmp_path, monkeypatch):
+    (tmp_path / "common").mkdir()
+    (tmp_path / "common" / "layer.yaml").write_text("units: 8\nactivation: !include act.yaml\n")
+    (tmp_path / "common" / "act.yaml").write_text("name: relu\n")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("""
+first:
+  <<: !include common/layer.yaml
+  units: 16
+second:
+  <<: [!include common/layer.yaml, {dropout: 0.1}]
+third:
+  <<: !include common/layer.yaml
+""")
+
+    composed = []
+    original = yaml_loader.FullLoaderWithInclusion.get_single_node
+
+    def counting_compose(self):
+        composed.append(self.name)
+        return original(self)
+
+    monkeypatch.setattr(yaml_loader.FullLoaderWithInclusion, "get_single_node", counting_compose)
+
+    with open(config_path) as f:
+        d = draccus.cfgparsing.load_config(f)
+
+    assert d == {
+        "first": {"units": 16, "activation": {"name": "relu"}},
+        "second": {"units": 8, "activation": {"name": "relu"}, "dropout": 0.1},
+        "third": {"units": 8, "activation": {"name": "relu"}},
+    }
+    # merge sites don't share their values
+    assert d["first"]["activation"] is not d["third"]["activation"]
+    assert composed.count(str(tmp_path / "common" / "layer.yaml")) == 1
+
+
+def test_merge_include_cycle(tmp_path):
+    (tmp_path / "a.yaml").write_text("<<: !include b.yaml\nx: 1\n")
+    (tmp_path / "b.yaml").write_text("<<: !include a.yaml\ny: 2\n")
+    stream = yaml_loader.named_stream((tmp_path / "a.yaml").read_text(), str(tmp_path / "a.yaml"))
+
+    with pytest.raises(IncludeCycleError) as exc_info:
+        yaml_loader.load_yaml(stream, yaml_loader.FullLoaderWithInclusion)
+    assert [Path(p).name for p in exc_info.value.chain] == ["a.yaml", "b.yaml", "a.yaml"]
+
+
+def test_merge_include_requires_mapping(tmp_path):
+    (tmp_path / "list.yaml").write_text("- 1\n- 2\n")
+    (tmp_path / "config.yaml").write_text("<<: !include list.yaml\n")
+    with pytest.raises(draccus.ParsingError):
+        with open(tmp_path / "config.yaml") as f:
+            draccus.cfgparsing.load_config(f)
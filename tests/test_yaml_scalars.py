@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import math
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Literal, Optional
+
+import pytest
+import yaml
+
+from draccus.parsers.config_parsers import YAMLParser
+from draccus.parsers.yaml_scalars import NO_MATCH, get_scalar_parser
+
+from .testutils import TestSetup
+
+
+class Color(Enum):
+    red = "RED"
+    blue = "BLUE"
+
+
+VALUES = [
+    "0",
+    "-0",
+    "+7",
+    "1000",
+    "1_000",
+    "07",
+    "0x1f",
+    "1:30",
+    "1.5",
+    "-2.",
+    "1_0.2_5",
+    "1.0e-3",
+    "1.0e3",
+    "1e3",
+    ".5",
+    ".inf",
+    ".nan",
+    "true",
+    "False",
+    "yes",
+    "ON",
+    "y",
+    "n",
+    "~",
+    "null",
+    "NULL",
+    "nULL",
+    "hello",
+    "hello_world",
+    "a-b.c",
+    "/tmp/out",
+    "red",
+    "include foo.yaml",
+    "a: b",
+    "a #comment",
+    "'quoted'",
+    "[1, 2]",
+    "{a: 1}",
+    "2024-01-01",
+    "",
+]
+
+
+@pytest.mark.parametrize(
+    "tpe", [int, float, bool, str, Path, Color, Optional[int], Optional[str], Literal["a", 1], Literal[1, 2]]
+)
+@pytest.mark.parametrize("value", VALUES)
+def test_matches_yaml(tpe, value):
+    expected = YAMLParser.parse_string(value)
+    result = YAMLParser.parse_typed_string(value, tpe)
+    if isinstance(expected, float) and math.isnan(expected):
+        assert math.isnan(result)
+    else:
+        assert result == expected and type(result) is type(expected)
+
+
+@pytest.mark.parametrize("tpe", [List[int], Dict[str, int], Optional[List[int]], object])
+def test_no_fast_path(tpe):
+    assert get_scalar_parser(tpe) is None
+
+
+def test_fast_path_rejects_structured_values():
+    parse = get_scalar_parser(int)
+    assert parse("12") == 12
+    assert parse("[12]") is NO_MATCH
+
+
+@dataclass
+class Trainer:
+    steps: int = 0
+    lr: float = 0.0
+    name: str = ""
+    color: Color = Color.red
+    output: Optional[Path] = None
+    layers: List[int] = field(default_factory=list)
+
+
+@dataclass
+class Config(TestSetup):
+    trainer: Trainer = field(default_factory=Trainer)
+    debug: bool = False
+
+
+def test_cli_scalars_skip_yaml(monkeypatch):
+    loaded = []
+    original = yaml.load
+
+    def counting_load(stream, *args, **kwargs):
+        loaded.append(stream)
+        return original(stream, *args, **kwargs)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+
+    cfg = Config.setup(
+        "--trainer.steps 1_000 --trainer.lr 3.0e-4 --trainer.name run-1 --trainer.color blue"
+        " --trainer.output /tmp/out --trainer.layers [1,2] --debug true"
+    )
+
+    assert cfg == Config(Trainer(1000, 3e-4, "run-1", Color.blue, Path("/tmp/out"), [1, 2]), True)
+    # only the list needed the yaml parser
+    assert loaded == ["[1,2]"]